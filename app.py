@@ -12,11 +12,37 @@ import streamlit as st
 import json
 import os
 from pathlib import Path
+from types import MappingProxyType
 
-# Import controllers and UI components
-from src.controllers.file_merger import FileMerger
-from src.ui.components import render_header, render_sidebar, render_footer
-from src.ui.pages import render_about_page
+from src import initialize_app
+from src.utils.lazy import lazy_import
+
+# Controllers and UI components are imported on first use so that only the
+# modules needed by the current page are loaded on each rerun
+FileMerger = lazy_import("src.controllers.file_merger.FileMerger")
+render_header = lazy_import("src.ui.components.render_header")
+render_sidebar = lazy_import("src.ui.components.render_sidebar")
+render_footer = lazy_import("src.ui.components.render_footer")
+render_about_page = lazy_import("src.ui.pages.render_about_page")
+
+# Configuration used for any keys missing from config.json
+_DEFAULT_CONFIG = MappingProxyType({
+    "theme": "light",
+    "max_file_size_mb": 100,
+    "default_merge_method": "append",
+    "plugins_enabled": True,
+    "export_formats": ["parquet", "feather", "csv", "xlsx", "json"],
+    "default_export_format": "parquet",
+    "parquet_compression": "zstd",
+    "engine": "auto"
+})
+
+# Stylesheets injected for each theme (empty means no overrides)
+_DARK_CSS = "<style>.main{background-color:#0e1117;color:#ffffff;}</style>"
+_THEME_CSS = {
+    "dark": _DARK_CSS,
+    "light": ""
+}
 
 # Set page configuration
 st.set_page_config(
@@ -26,33 +52,37 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+# Configure logging (runs once per process)
+initialize_app()
+
 # Load configuration
 @st.cache_data
 def load_config():
-    config_path = Path("config.json")
-    if config_path.exists():
-        with open(config_path, "r") as f:
-            return json.load(f)
-    return {
-        "theme": "light",
-        "max_file_size_mb": 100,
-        "default_merge_method": "append",
-        "plugins_enabled": True,
-        "export_formats": ["csv", "xlsx", "json"]
-    }
+    try:
+        loaded = json.loads(Path("config.json").read_bytes())
+    except FileNotFoundError:
+        return dict(_DEFAULT_CONFIG)
+    # Fill in any keys missing from the user's config
+    return {**_DEFAULT_CONFIG, **loaded}
 
 config = load_config()
 
+@st.cache_resource
+def _plugins():
+    """Discover and initialize plugins once per server process."""
+    from src.plugins import initialize_plugins
+    initialize_plugins()
+    return True
+
+@st.cache_resource
+def _get_merger(config_items):
+    """Build the FileMerger controller once per distinct configuration."""
+    return FileMerger(dict(config_items))
+
 # Apply theme
-if config["theme"] == "dark":
-    st.markdown("""
-    <style>
-    .main {
-        background-color: #0e1117;
-        color: #ffffff;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+theme_css = _THEME_CSS.get(config["theme"], "")
+if theme_css:
+    st.markdown(theme_css, unsafe_allow_html=True)
 
 # Initialize session state if needed
 if 'page' not in st.session_state:
@@ -61,13 +91,16 @@ if 'page' not in st.session_state:
 # Render header with navigation
 render_header()
 
+# Load plugins
+_plugins()
+
 # Render sidebar
 render_sidebar(config)
 
 # Render the selected page
 if st.session_state.page == 'merger':
     # Initialize and run the file merger
-    merger = FileMerger(config)
+    merger = _get_merger(tuple(sorted(config.items())))
     merger.handle()
 elif st.session_state.page == 'about':
     render_about_page()
@@ -7,13 +7,27 @@ DataFusion is a Streamlit application for merging multiple files with advanced
 options and data transformations.
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+import threading
+
+# Guards initialize_app() so it only runs once per process
+_INITIALIZED = False
+_INIT_LOCK = threading.Lock()
 
 # Configure logging
 def configure_logging():
-    """Configure the logging system for the application."""
+    """
+    Configure the logging system for the application.
+    
+    Records are handed to a background QueueListener so that emitting a log
+    line never blocks on I/O. File output is buffered by a MemoryHandler and
+    written in batches (or immediately for errors).
+    """
     # Create logs directory if it doesn't exist
     logs_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
     os.makedirs(logs_dir, exist_ok=True)
@@ -21,14 +35,31 @@ def configure_logging():
     # Log file path
     log_file = os.path.join(logs_dir, 'datafusion.log')
     
-    # Configure root logger
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    # File output is opened lazily and flushed in batches
+    file_handler = logging.FileHandler(log_file, delay=True)
+    file_handler.setFormatter(formatter)
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.ERROR,
+        target=file_handler
+    )
+    
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    
+    # Only the non-blocking queue handler is attached to the root logger
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, memory_handler, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # Configure root logger (final formatting happens in the listener's handlers)
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler(sys.stdout)
-        ]
+        format='%(message)s',
+        handlers=[logging.handlers.QueueHandler(log_queue)]
     )
     
     # Set third-party loggers to WARNING level to reduce noise
@@ -42,24 +73,45 @@ def configure_logging():
     
     return logger
 
-# Initialize the application
-def initialize_app():
-    """Initialize the application and all its components."""
-    logger = configure_logging()
+def configure_pandas():
+    """
+    Enable pandas Copy-on-Write.
     
-    logger.info("Initializing DataFusion application")
+    With Copy-on-Write, frames derived from the merged data share memory
+    until one of them is modified, so session state can hold the original
+    and transformed results without making defensive copies. It is always
+    enabled from pandas 3.0 on.
+    """
+    import pandas as pd
     
-    # Initialize plugins
-    from src.plugins import initialize_plugins
-    initialize_plugins()
+    if int(pd.__version__.split('.')[0]) < 3:
+        pd.set_option('mode.copy_on_write', True)
+
+# Initialize the application
+def initialize_app():
+    """
+    Initialize the application and all its components.
     
-    # Import controllers to register them
-    import src.controllers
+    Safe to call on every Streamlit rerun; the work is only done once per
+    process. Plugins are initialized separately by the app entry point.
+    """
+    global _INITIALIZED
     
-    logger.info("Application initialization complete")
-
-# Call initialize_app when this module is imported
-initialize_app()
+    with _INIT_LOCK:
+        if _INITIALIZED:
+            return
+            
+        logger = configure_logging()
+        
+        logger.info("Initializing DataFusion application")
+        
+        configure_pandas()
+        
+        # Import controllers so the registry is available
+        import src.controllers
+        
+        logger.info("Application initialization complete")
+        _INITIALIZED = True
 
 # Version information
 __version__ = '1.0.0'
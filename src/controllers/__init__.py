@@ -4,11 +4,13 @@ Controllers Package
 Controllers handle the business logic of the DataFusion application.
 """
 
+import functools
 import importlib
 import logging
-import inspect
 import os
 import pkgutil
+import re
+from types import MappingProxyType
 
 from src.controllers.base_controller import BaseController
 
@@ -17,6 +19,9 @@ logger = logging.getLogger(__name__)
 # Dictionary to store registered controllers by name
 _controllers = {}
 
+# Read-only view of the registry handed out by get_all_controllers()
+_controllers_view = MappingProxyType(_controllers)
+
 def register_controller(cls):
     """
     Decorator to register a controller class.
@@ -34,32 +39,56 @@ def register_controller(cls):
     controller_name = cls.__name__
     _controllers[controller_name] = cls
     
+    # Registry changed, drop any cached lookups
+    get_controller.cache_clear()
+    
     return cls
 
+def _module_name(controller_name):
+    """Convert a controller class name to its module name (FileMerger -> file_merger)."""
+    return re.sub(r'(?<!^)(?=[A-Z])', '_', controller_name).lower()
+
+@functools.lru_cache(maxsize=None)
 def get_controller(name):
     """
     Get a controller class by name.
     
+    Controllers register themselves when their module is imported, so on a
+    miss the matching module is imported once and the lookup retried.
+    Results are cached until the next call to register_controller().
+    
     Args:
         name: The name of the controller class
         
     Returns:
         The controller class or None if not found
     """
-    return _controllers.get(name)
+    controller = _controllers.get(name)
+    if controller is None:
+        try:
+            importlib.import_module(f"src.controllers.{_module_name(name)}")
+        except ImportError:
+            return None
+        controller = _controllers.get(name)
+    return controller
 
 def get_all_controllers():
     """
     Get all registered controllers.
     
     Returns:
-        Dictionary of controller classes by name
+        Read-only mapping of controller classes by name. The view reflects
+        later registrations; copy it with dict() if a snapshot is needed.
     """
-    return _controllers.copy()
+    return _controllers_view
 
 def initialize_controllers():
     """
     Discover and register all controller classes in this package.
+    
+    Not called at import time; controllers register themselves through
+    ``@register_controller``. Use this only when the full registry is needed.
+    Each controller module lists its controller classes in ``CONTROLLERS``.
     """
     # Get the directory of this package
     package_dir = os.path.dirname(__file__)
@@ -74,21 +103,32 @@ def initialize_controllers():
             # Import the module
             module = importlib.import_module(f"src.controllers.{module_name}")
             
-            # Find all controller classes
-            for name, obj in inspect.getmembers(module):
-                if (inspect.isclass(obj) and 
-                    issubclass(obj, BaseController) and 
-                    obj is not BaseController):
-                    # Register the controller
-                    register_controller(obj)
-                    logger.info(f"Registered controller: {name}")
+            # Register the controllers the module declares in CONTROLLERS
+            for cls in getattr(module, "CONTROLLERS", ()):
+                register_controller(cls)
+                logger.info(f"Registered controller: {cls.__name__}")
                     
         except Exception as e:
             logger.error(f"Error loading controller module {module_name}: {str(e)}", exc_info=True)
 
-# Initialize controllers when this module is imported
-initialize_controllers()
+# Controllers importable from this package without loading their module up front
+_LAZY = {
+    'FileMerger': 'src.controllers.file_merger:FileMerger'
+}
 
-# Import and register FileMerger explicitly to ensure it's available
-from src.controllers.file_merger import FileMerger
-register_controller(FileMerger)
\ No newline at end of file
+def __getattr__(name):
+    """
+    Import controllers on first attribute access (PEP 562).
+    
+    Allows ``from src.controllers import FileMerger`` without importing the
+    controller module until it is actually needed. The resolved object is
+    stored in the module globals so later lookups bypass this hook.
+    """
+    spec = _LAZY.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        
+    module_name, attr = spec.split(':')
+    obj = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = obj
+    return obj
@@ -15,13 +15,19 @@ class BaseController(ABC):
     across different controllers.
     """
     
+    def __init_subclass__(cls, **kwargs):
+        """Give each subclass its own logger, created once per class."""
+        super().__init_subclass__(**kwargs)
+        cls.logger = logging.getLogger(cls.__name__)
+        
     def __init__(self):
         """
         Initialize the base controller.
         
-        Sets up logging and any other common initialization.
+        Hook for common initialization; the logger is set per class in
+        __init_subclass__.
         """
-        self.logger = logging.getLogger(self.__class__.__name__)
+        pass
         
     @abstractmethod
     def handle(self):
@@ -34,18 +40,24 @@ class BaseController(ABC):
         """
         pass
         
-    def log_info(self, message):
+    # Bound logger methods; pass printf-style args, e.g. log_debug("rows=%d", n)
+    
+    @property
+    def log_info(self):
         """Log an info message."""
-        self.logger.info(message)
+        return self.logger.info
         
-    def log_error(self, message, exc_info=False):
+    @property
+    def log_error(self):
         """Log an error message, optionally with exception info."""
-        self.logger.error(message, exc_info=exc_info)
+        return self.logger.error
         
-    def log_warning(self, message):
+    @property
+    def log_warning(self):
         """Log a warning message."""
-        self.logger.warning(message)
+        return self.logger.warning
         
-    def log_debug(self, message):
+    @property
+    def log_debug(self):
         """Log a debug message."""
-        self.logger.debug(message)
\ No newline at end of file
+        return self.logger.debug
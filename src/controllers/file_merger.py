@@ -11,10 +11,15 @@ import base64
 import json
 from datetime import datetime
 import io
+import hashlib
 from typing import List, Dict, Tuple, Optional, Any, Union
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+from src.controllers import register_controller
 from src.controllers.base_controller import BaseController
 from src.utils.data_processors import (
     clean_dataframe,
@@ -27,13 +32,81 @@ from src.utils.file_handlers import (
     get_file_info,
     detect_encoding,
     read_file,
-    get_download_link_multi_format
+    read_csv_polars,
+    get_export_data,
+    get_auto_download_script
 )
 
+try:
+    import numexpr as _ne
+except ImportError:
+    _ne = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Row count from which numeric filters are evaluated with numexpr
+NUMEXPR_MIN_ROWS = 1_000_000
+
+def _compare_numeric(values: np.ndarray, operator: str, threshold: float) -> np.ndarray:
+    """
+    Compare a numeric array against a threshold.
+    
+    Large arrays are compared by numexpr (when installed) in a single
+    multithreaded pass; NumPy is used otherwise. NaN never matches.
+    
+    Args:
+        values: Array of numeric values
+        operator: ">" or "<"
+        threshold: Value to compare against
+        
+    Returns:
+        Boolean array with one entry per value
+    """
+    if _ne is not None and len(values) >= NUMEXPR_MIN_ROWS:
+        return _ne.evaluate(
+            f"values {operator} threshold",
+            local_dict={'values': values, 'threshold': threshold}
+        )
+    return values > threshold if operator == ">" else values < threshold
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _parse_upload(digest: str, file_extension: str, engine: str, _data: bytes) -> Optional[pd.DataFrame]:
+    """
+    Parse uploaded file contents into a DataFrame, cached across reruns.
+    
+    The cache is keyed on ``digest`` rather than the raw bytes (``_data`` is
+    excluded from hashing), so an unchanged upload is only parsed
+    once. The cached frame is returned as-is rather than as a pickled copy, so
+    callers must not modify it in place.
+    
+    Args:
+        digest: Upload file_id or BLAKE2b digest of the file contents
+        file_extension: File extension (csv, xlsx, etc.)
+        engine: "polars" to read CSV files with Polars when available
+        _data: Raw file contents
+        
+    Returns:
+        DataFrame if successfully read, None otherwise
+    """
+    buffer = io.BytesIO(_data)
+    
+    # Encoding detection only applies to CSV files
+    if file_extension != 'csv':
+        return read_file(buffer, file_extension)
+        
+    encoding = detect_encoding(buffer)
+    
+    # Fall back to pandas when Polars is unavailable or cannot handle the file
+    df = None
+    if engine == "polars":
+        df = read_csv_polars(buffer, encoding=encoding)
+    if df is None:
+        df = read_file(buffer, file_extension, encoding=encoding)
+    return df
+
+@register_controller
 class FileMerger(BaseController):
     """
     Controller for merging multiple files with advanced options.
@@ -61,9 +134,18 @@ class FileMerger(BaseController):
             'xls': 'Excel File (XLS)',
             'json': 'JSON File'
         }
-        self.export_formats = self.config.get("export_formats", ["csv", "xlsx", "json"])
+        self.export_formats = self.config.get("export_formats", ["parquet", "feather", "csv", "xlsx", "json"])
+        self.default_export_format = self.config.get("default_export_format", "parquet")
+        self.parquet_compression = self.config.get("parquet_compression", "zstd")
+        self.engine = self.config.get("engine", "auto")
+        
+    def init_session_state(self):
+        """
+        Initialize the session state variables used by this controller.
         
-        # Initialize session state variables if needed
+        Called from handle() rather than __init__ because the controller
+        instance is cached and shared across Streamlit sessions.
+        """
         if 'loaded_files' not in st.session_state:
             st.session_state.loaded_files = {}
         if 'merged_df' not in st.session_state:
@@ -71,12 +153,33 @@ class FileMerger(BaseController):
         if 'last_merge_time' not in st.session_state:
             st.session_state.last_merge_time = None
             
-    def load_data(self, uploaded_file) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+    def select_engine(self, total_bytes: int) -> str:
+        """
+        Choose the parsing engine for a batch of uploads.
+        
+        With the "auto" engine, Polars is used once the combined upload size
+        exceeds half of the per-file size limit; smaller batches stay on pandas
+        where Polars' startup cost would dominate.
+        
+        Args:
+            total_bytes: Combined size of the uploaded files
+            
+        Returns:
+            "polars" or "pandas"
+        """
+        if self.engine == "polars":
+            return "polars"
+        if self.engine == "auto" and total_bytes > self.max_file_size_mb * 0.5 * 1024 * 1024:
+            return "polars"
+        return "pandas"
+        
+    def load_data(self, uploaded_file, engine: str = "pandas") -> Tuple[Optional[pd.DataFrame], Optional[str]]:
         """
         Load data from an uploaded file with advanced error handling and options.
         
         Args:
             uploaded_file: Streamlit UploadedFile object
+            engine: "polars" to read CSV files with Polars when available
             
         Returns:
             Tuple containing:
@@ -94,20 +197,25 @@ class FileMerger(BaseController):
             return None, f"Unsupported file format: {file_extension}. Supported formats: {', '.join(self.supported_formats.keys())}"
         
         try:
-            # Get file info and detect encoding for CSV files
+            # Get file info
             file_info = get_file_info(uploaded_file)
             
-            # For CSV files, try to detect encoding
-            encoding = None
-            if file_extension == 'csv':
-                encoding = detect_encoding(uploaded_file)
-                
-            # Read the file with appropriate parameters
-            df = read_file(uploaded_file, file_extension, encoding=encoding)
+            # Parse the file, reusing the cached result for unchanged uploads.
+            # Streamlit gives every upload a unique file_id, which saves
+            # hashing the contents again on each merge.
+            data = uploaded_file.getvalue()
+            digest = getattr(uploaded_file, 'file_id', None)
+            if not isinstance(digest, str):
+                digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+            df = _parse_upload(digest, file_extension, engine, data)
             
             if df is None or df.empty:
                 return None, f"File {uploaded_file.name} is empty or could not be read."
                 
+            # Hand out a shallow copy so renaming columns or filling values
+            # during the merge never touches the cached frame
+            df = df.copy(deep=False)
+                
             # Log success
             logger.info(f"Successfully loaded file {uploaded_file.name} with {df.shape[0]} rows and {df.shape[1]} columns")
             
@@ -117,6 +225,55 @@ class FileMerger(BaseController):
             logger.error(f"Error loading file {uploaded_file.name}: {str(e)}", exc_info=True)
             return None, f"Error loading file {uploaded_file.name}: {str(e)}"
             
+    @staticmethod
+    def append_frames(dfs: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Stack DataFrames vertically in a single concatenation.
+        
+        Columns are kept in first-seen order rather than sorted, so no extra
+        reindexing pass is made over the result.
+        
+        Args:
+            dfs: DataFrames to stack
+            
+        Returns:
+            Concatenated DataFrame with a fresh RangeIndex
+        """
+        return pd.concat(dfs, ignore_index=True, sort=False)
+        
+    @staticmethod
+    def arrow_text_columns(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert the text columns of a DataFrame to Arrow-backed strings.
+        
+        Only object and string columns holding nothing but text are
+        converted; numeric, boolean and mixed-type columns keep their dtypes.
+        
+        Args:
+            df: DataFrame to convert
+            
+        Returns:
+            DataFrame with string[pyarrow] text columns
+        """
+        text_columns = [
+            col for col, dtype in df.dtypes.items()
+            if dtype == object or isinstance(dtype, pd.StringDtype)
+        ]
+        if not text_columns:
+            return df
+            
+        converted = df[text_columns].convert_dtypes(
+            infer_objects=False,
+            convert_integer=False,
+            convert_boolean=False,
+            convert_floating=False,
+            dtype_backend='pyarrow'
+        )
+        # Shallow copy; copy-on-write keeps the other columns shared
+        result = df.copy(deep=False)
+        result[text_columns] = converted
+        return result
+        
     def render_file_uploader(self):
         """Render the file uploader section with supported file types info."""
         st.subheader("Upload Files")
@@ -254,26 +411,44 @@ class FileMerger(BaseController):
         if not uploaded_files:
             return None, ["No files uploaded"]
             
-        if options["merge_method"].startswith("Join") and not options["join_key"]:
+        is_join = options["merge_method"].startswith("Join")
+        if is_join and not options["join_key"]:
             return None, ["Please specify a key column for joining"]
             
+        # Column names are lowercased per file below, so match the key once here
+        if options["ignore_case"] and options["join_key"]:
+            options["join_key"] = options["join_key"].lower()
+            
         # Load all files
         dfs = []
         file_names = []
         error_messages = []
         all_columns = set()
         
+        engine = self.select_engine(sum(f.size for f in uploaded_files))
+        
         with st.spinner("Loading and processing files..."):
             progress_bar = st.progress(0)
             
-            for i, uploaded_file in enumerate(uploaded_files):
-                # Update progress
-                progress = (i + 1) / len(uploaded_files)
-                progress_bar.progress(progress)
-                
-                # Load file
-                df, error = self.load_data(uploaded_file)
-                
+            # Parse files concurrently (the parsers release the GIL); results
+            # are collected in upload order so the merge order is unchanged
+            results = [None] * len(uploaded_files)
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(uploaded_files)),
+                initializer=add_script_run_ctx,
+                initargs=(None, get_script_run_ctx())
+            ) as executor:
+                futures = {
+                    executor.submit(self.load_data, uploaded_file, engine=engine): i
+                    for i, uploaded_file in enumerate(uploaded_files)
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    results[futures[future]] = future.result()
+                    
+                    # Update progress
+                    progress_bar.progress(done / len(uploaded_files))
+                    
+            for uploaded_file, (df, error) in zip(uploaded_files, results):
                 if error:
                     error_messages.append(error)
                     continue
@@ -283,12 +458,11 @@ class FileMerger(BaseController):
                     
                     # Handle column names case
                     if options["ignore_case"]:
-                        df.columns = [col.lower() for col in df.columns]
-                        if options["join_key"]:
-                            options["join_key"] = options["join_key"].lower()
+                        # Relabels the column Index only; column data is not copied
+                        df.columns = df.columns.map(str.lower)
                             
                     # Check for join key if doing horizontal merge
-                    if options["merge_method"].startswith("Join") and options["join_key"] not in df.columns:
+                    if is_join and options["join_key"] not in df.columns:
                         error_messages.append(f"File '{uploaded_file.name}' is missing the key column '{options['join_key']}'")
                         
                         # Suggest similar columns
@@ -315,37 +489,21 @@ class FileMerger(BaseController):
         if len(dfs) > 0:
             # Apply data transformations and cleaning before merging
             for i, df in enumerate(dfs):
-                # Fill missing values if requested
+                # Fill missing values if requested, the same way as the
+                # cleaning utilities do
                 if options["fill_missing"] and options["fill_method"] != "None (keep NaN)":
-                    if options["fill_method"] == "Zero":
-                        df = df.fillna(0)
-                    elif options["fill_method"] == "Mean":
-                        for col in df.select_dtypes(include=[np.number]).columns:
-                            df[col] = df[col].fillna(df[col].mean())
-                    elif options["fill_method"] == "Median":
-                        for col in df.select_dtypes(include=[np.number]).columns:
-                            df[col] = df[col].fillna(df[col].median())
-                    elif options["fill_method"] == "Mode":
-                        for col in df.columns:
-                            df[col] = df[col].fillna(df[col].mode()[0] if not df[col].mode().empty else np.nan)
-                    elif options["fill_method"] == "Forward fill":
-                        df = df.fillna(method='ffill')
-                    elif options["fill_method"] == "Backward fill":
-                        df = df.fillna(method='bfill')
-                    elif options["fill_method"] == "Custom value":
-                        try:
-                            # Try to convert to numeric if possible
-                            value = float(options["fill_value"]) if options["fill_value"].replace(".", "", 1).isdigit() else options["fill_value"]
-                            df = df.fillna(value)
-                        except:
-                            df = df.fillna(options["fill_value"])
+                    df = clean_dataframe(df, {
+                        "fill_method": options["fill_method"],
+                        "fill_value": options["fill_value"],
+                        "ignore_case": False
+                    })
                 
                 # Handle duplicates if requested
                 if options["handle_duplicates"]:
                     original_rows = len(df)
                     
                     # If joining, keep duplicates only in the key column
-                    if options["merge_method"].startswith("Join") and options["join_key"] in df.columns:
+                    if is_join and options["join_key"] in df.columns:
                         df = df.drop_duplicates(subset=[options["join_key"]])
                     else:
                         df = df.drop_duplicates()
@@ -360,7 +518,7 @@ class FileMerger(BaseController):
             st.subheader("Merging Files")
             
             if options["merge_method"] == "Append (stack vertically)":
-                merged_df = pd.concat(dfs, ignore_index=True)
+                merged_df = self.append_frames(dfs)
                 st.success(f"Successfully merged {len(dfs)} files vertically. Result has {merged_df.shape[0]} rows and {merged_df.shape[1]} columns.")
                 
             elif options["merge_method"] == "Join on key column (merge horizontally)":
@@ -422,30 +580,27 @@ class FileMerger(BaseController):
                     st.success(f"Only one file provided. No merging needed.")
                     
                 else:
-                    # Detect common columns across all dataframes
-                    common_cols = set.intersection(*[set(df.columns) for df in dfs])
+                    # Detect common columns across all dataframes, in the first
+                    # file's column order so key selection is deterministic
+                    common_cols = [
+                        col for col in dfs[0].columns
+                        if all(col in df.columns for df in dfs[1:])
+                    ]
                     
                     if not common_cols:
                         # No common columns - use append
-                        merged_df = pd.concat(dfs, ignore_index=True)
+                        merged_df = self.append_frames(dfs)
                         st.warning("No common columns found across files. Performing vertical append instead.")
                         
                     else:
-                        # Find potential key columns by checking uniqueness
-                        potential_keys = []
-                        for col in common_cols:
-                            is_potential_key = True
-                            for df in dfs:
-                                # Check if column has unique values
-                                if df[col].nunique() != len(df[col].dropna()):
-                                    is_potential_key = False
-                                    break
-                            if is_potential_key:
-                                potential_keys.append(col)
-                                
-                        if potential_keys:
-                            # Use the first potential key found
-                            key_col = potential_keys[0]
+                        # Use the first column whose non-null values are unique in
+                        # every file; scanning stops as soon as one is found
+                        key_col = next(
+                            (col for col in common_cols if all(df[col].dropna().is_unique for df in dfs)),
+                            None
+                        )
+                        
+                        if key_col is not None:
                             st.info(f"Automatically selected '{key_col}' as the key column for joining.")
                             
                             # Start with the first dataframe
@@ -465,9 +620,15 @@ class FileMerger(BaseController):
                             
                         else:
                             # No unique key columns - use append
-                            merged_df = pd.concat(dfs, ignore_index=True)
+                            merged_df = self.append_frames(dfs)
                             st.warning("No suitable key columns found. Performing vertical append instead.")
                 
+            # Store text columns as Arrow strings instead of Python objects,
+            # which shrinks the copies held in session state. Numeric columns
+            # keep their 64-bit NumPy dtypes, so later arithmetic neither
+            # overflows nor loses precision, and whole floats stay floats
+            merged_df = self.arrow_text_columns(merged_df)
+            
             # Save the merged dataframe in session state for later use
             st.session_state.merged_df = merged_df
             st.session_state.last_merge_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -477,6 +638,52 @@ class FileMerger(BaseController):
         else:
             return None, ["No valid dataframes to merge"]
             
+    def get_column_stats(self, df: pd.DataFrame) -> Tuple[pd.Series, pd.Series]:
+        """
+        Get per-column non-null and unique value counts for a DataFrame.
+        
+        The preview is re-rendered on every widget interaction, so the counts
+        are kept in session state and only recomputed when the DataFrame
+        being shown changes.
+        
+        Args:
+            df: DataFrame being previewed
+            
+        Returns:
+            Tuple of (non-null counts, unique value counts) indexed by column
+        """
+        cached = st.session_state.get('column_stats')
+        if cached is not None and cached[0] is df:
+            return cached[1], cached[2]
+            
+        non_null_counts = df.count()
+        unique_counts = df.nunique()
+        st.session_state.column_stats = (df, non_null_counts, unique_counts)
+        return non_null_counts, unique_counts
+        
+    def get_numeric_column(self, df: pd.DataFrame, column: str) -> np.ndarray:
+        """
+        Get a column coerced to numbers for numeric comparisons.
+        
+        The coerced values are kept in session state, so filtering the same
+        column of the same DataFrame again (e.g. with a different threshold)
+        skips the conversion.
+        
+        Args:
+            df: DataFrame being filtered
+            column: Name of the column to coerce
+            
+        Returns:
+            Array of numeric values (NaN where a value is not numeric)
+        """
+        cached = st.session_state.get('numeric_column')
+        if cached is not None and cached[0] is df and cached[1] == column:
+            return cached[2]
+            
+        values = pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+        st.session_state.numeric_column = (df, column, values)
+        return values
+        
     def render_data_preview_and_download(self, df, output_filename):
         """
         Render a preview of the merged data and download options.
@@ -492,8 +699,12 @@ class FileMerger(BaseController):
             # Add a search/filter option
             search_term = st.text_input("Search/Filter data (searches all columns)", "")
             if search_term:
-                mask = np.column_stack([df[col].astype(str).str.contains(search_term, case=False, na=False) for col in df.columns])
-                filtered_df = df[mask.any(axis=1)]
+                # OR each column's matches into one row mask instead of
+                # building an (nrows x ncols) matrix
+                mask = np.zeros(len(df), dtype=bool)
+                for col in df.columns:
+                    mask |= df[col].astype(str).str.contains(search_term, case=False, regex=False, na=False).to_numpy(dtype=bool)
+                filtered_df = df[mask]
                 st.dataframe(filtered_df.head(10))
                 st.info(f"Showing filtered preview. {len(filtered_df)} rows match the search term '{search_term}'.")
             else:
@@ -503,24 +714,26 @@ class FileMerger(BaseController):
             st.subheader("Data Analysis")
             tab1, tab2, tab3 = st.tabs(["Column Information", "Data Types", "Missing Values"])
             
+            # Counts are shared by the Column Information and Missing Values tabs
+            non_null_counts, unique_counts = self.get_column_stats(df)
+            null_counts = len(df) - non_null_counts
+            
             with tab1:
                 col_info = pd.DataFrame({
                     'Column Name': df.columns,
                     'Data Type': df.dtypes.astype(str),
-                    'Non-Null Count': df.count().values,
-                    'Null Count': df.isna().sum().values,
-                    'Unique Values': [df[col].nunique() for col in df.columns]
+                    'Non-Null Count': non_null_counts.values,
+                    'Null Count': null_counts.values,
+                    'Unique Values': unique_counts.values
                 })
                 st.dataframe(col_info)
                 
             with tab2:
-                # Group columns by data type
+                # Group columns by data type (read from df.dtypes in one go
+                # rather than building a Series per column)
                 type_groups = {}
-                for col in df.columns:
-                    col_type = str(df[col].dtype)
-                    if col_type not in type_groups:
-                        type_groups[col_type] = []
-                    type_groups[col_type].append(col)
+                for col, col_type in zip(df.columns, df.dtypes.astype(str)):
+                    type_groups.setdefault(col_type, []).append(col)
                 
                 for dtype, cols in type_groups.items():
                     with st.expander(f"{dtype} ({len(cols)} columns)"):
@@ -529,8 +742,8 @@ class FileMerger(BaseController):
             with tab3:
                 # Calculate missing values percentage
                 missing_data = pd.DataFrame({
-                    'Missing Values': df.isna().sum(),
-                    'Percentage': (df.isna().sum() / len(df) * 100).round(2)
+                    'Missing Values': null_counts,
+                    'Percentage': (null_counts / len(df) * 100).round(2)
                 }).sort_values('Percentage', ascending=False)
                 
                 missing_data = missing_data[missing_data['Missing Values'] > 0]
@@ -580,7 +793,8 @@ class FileMerger(BaseController):
                     
                     if st.button("Convert column type"):
                         try:
-                            new_df = df.copy()
+                            # Shallow copy: only the converted column is replaced
+                            new_df = df.copy(deep=False)
                             if target_type == "string":
                                 new_df[col_to_convert] = new_df[col_to_convert].astype(str)
                             elif target_type == "number":
@@ -603,7 +817,8 @@ class FileMerger(BaseController):
                     
                     if st.button("Replace values") and find_value:
                         try:
-                            new_df = df.copy()
+                            # Shallow copy: only the modified column is replaced
+                            new_df = df.copy(deep=False)
                             new_df[col_to_modify] = new_df[col_to_modify].replace(find_value, replace_value)
                             st.session_state.merged_df = new_df
                             st.success(f"Replaced values in '{col_to_modify}'")
@@ -618,19 +833,25 @@ class FileMerger(BaseController):
                     
                     if st.button("Apply filter") and filter_value:
                         try:
-                            new_df = df.copy()
-                            
+                            # Build the row mask as a plain boolean array;
+                            # selecting by position already returns a new
+                            # frame, so no copy is needed
+                            column = df[filter_col]
                             if filter_type == "equals":
-                                new_df = new_df[new_df[filter_col] == filter_value]
+                                mask = (column == filter_value).to_numpy(dtype=bool, na_value=False)
                             elif filter_type == "not equals":
-                                new_df = new_df[new_df[filter_col] != filter_value]
+                                mask = (column != filter_value).to_numpy(dtype=bool, na_value=False)
                             elif filter_type == "contains":
-                                new_df = new_df[new_df[filter_col].astype(str).str.contains(filter_value, na=False)]
-                            elif filter_type == "greater than":
-                                new_df = new_df[pd.to_numeric(new_df[filter_col], errors='coerce') > float(filter_value)]
-                            elif filter_type == "less than":
-                                new_df = new_df[pd.to_numeric(new_df[filter_col], errors='coerce') < float(filter_value)]
+                                mask = column.astype(str).str.contains(filter_value, na=False).to_numpy(dtype=bool)
+                            elif filter_type in ("greater than", "less than"):
+                                # NaN compares False, so non-numeric rows drop out
+                                mask = _compare_numeric(
+                                    self.get_numeric_column(df, filter_col),
+                                    ">" if filter_type == "greater than" else "<",
+                                    float(filter_value)
+                                )
                                 
+                            new_df = df.take(np.flatnonzero(mask))
                             st.session_state.merged_df = new_df
                             st.success(f"Applied filter to '{filter_col}'. {len(new_df)} rows remaining.")
                             st.rerun()
@@ -644,7 +865,7 @@ class FileMerger(BaseController):
                 # Reset transformations
                 if st.button("Reset all transformations"):
                     if "original_merged_df" in st.session_state:
-                        st.session_state.merged_df = st.session_state.original_merged_df.copy()
+                        st.session_state.merged_df = st.session_state.original_merged_df
                         st.success("Reset all transformations")
                         st.rerun()
                     else:
@@ -657,32 +878,33 @@ class FileMerger(BaseController):
             export_format = st.radio(
                 "Select export format",
                 options=[fmt.upper() for fmt in self.export_formats],
+                index=self.export_formats.index(self.default_export_format)
+                    if self.default_export_format in self.export_formats else 0,
                 horizontal=True
             )
             
-            # Generate download links
-            download_links = get_download_link_multi_format(
-                df, 
-                filename=output_filename,
-                formats=[export_format.lower()]
-            )
-            
-            # Display download button
-            for fmt, link in download_links.items():
-                st.markdown(link, unsafe_allow_html=True)
+            # Serialize once for both the download button and the
+            # auto-download script
+            fmt = export_format.lower()
+            download_name = f"{output_filename}.{fmt}"
+            export = get_export_data(df, fmt, parquet_compression=self.parquet_compression)
+            
+            # Display download button; Streamlit serves the raw bytes
+            if export is not None:
+                data, mime, label = export
+                st.download_button(
+                    f"Download {label}",
+                    data=data,
+                    file_name=download_name,
+                    mime=mime
+                )
+            else:
+                st.warning(f"{export_format} export is not available.")
                 
             # Add auto-download option
             auto_download = st.checkbox("Auto-download file", value=True)
-            if auto_download:
-                auto_link = get_download_link_multi_format(
-                    df, 
-                    filename=output_filename,
-                    formats=[export_format.lower()],
-                    auto_download=True
-                )
-                
-                for fmt, script in auto_link.items():
-                    st.markdown(script, unsafe_allow_html=True)
+            if auto_download and export is not None:
+                st.markdown(get_auto_download_script(data, fmt, download_name), unsafe_allow_html=True)
                     
             # Show download information
             with st.expander("Download Information"):
@@ -696,11 +918,17 @@ class FileMerger(BaseController):
                     st.write("Excel files preserve formatting and can contain multiple sheets.")
                 elif export_format.lower() == "json":
                     st.write("JSON format is ideal for web applications and APIs.")
+                elif export_format.lower() == "parquet":
+                    st.write("Parquet is a compressed columnar format that is fast to read in pandas, Spark, and DuckDB.")
+                elif export_format.lower() == "feather":
+                    st.write("Feather (Arrow IPC) is the fastest format to load back into pandas or Polars.")
         else:
             st.warning("No data to preview. Please upload and merge files first.")
             
     def handle(self):
         """Main handler method that orchestrates the entire workflow."""
+        self.init_session_state()
+        
         # Render header and description
         st.title("DataFusion: Advanced File Merger")
         st.markdown("""
@@ -734,7 +962,7 @@ class FileMerger(BaseController):
             
         if reset_button:
             # Clear session state
-            for key in ['loaded_files', 'merged_df', 'last_merge_time', 'original_merged_df']:
+            for key in ['loaded_files', 'merged_df', 'last_merge_time', 'original_merged_df', 'column_stats', 'numeric_column']:
                 if key in st.session_state:
                     del st.session_state[key]
             st.rerun()
@@ -749,12 +977,16 @@ class FileMerger(BaseController):
                     st.write(f"- {msg}")
                     
             if merged_df is not None:
-                # Store original merged dataframe for reset functionality
+                # Store original merged dataframe for reset functionality;
+                # transformations return new frames, so no copy is needed
                 if "original_merged_df" not in st.session_state:
-                    st.session_state.original_merged_df = merged_df.copy()
+                    st.session_state.original_merged_df = merged_df
                     
                 # Render preview and download options
                 self.render_data_preview_and_download(merged_df, options["output_filename"])
         elif st.session_state.merged_df is not None:
             # If we already have a merged dataframe in session state, show it
-            self.render_data_preview_and_download(st.session_state.merged_df, options["output_filename"])
\ No newline at end of file
+            self.render_data_preview_and_download(st.session_state.merged_df, options["output_filename"])
+
+# Controllers exported by this module (read by initialize_controllers)
+CONTROLLERS = [FileMerger]
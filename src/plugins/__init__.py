@@ -4,6 +4,7 @@ Plugins System
 Provides extensibility for the DataFusion application.
 """
 
+import functools
 import logging
 import os
 
@@ -13,6 +14,17 @@ def get_plugin_info():
     """
     Get information about available plugins.
     
+    Returns:
+        Dictionary with plugin categories and counts
+    """
+    # Plugins are fixed at install time, so the directory scan is cached
+    return dict(_scan_plugins())
+
+@functools.lru_cache(maxsize=1)
+def _scan_plugins():
+    """
+    Count the plugin modules in each plugin category directory.
+    
     Returns:
         Dictionary with plugin categories and counts
     """
@@ -6,11 +6,11 @@ Provides extensible data transformation capabilities for DataFusion.
 
 from abc import ABC, abstractmethod
 import pandas as pd
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Callable, List, Optional, Union
 import importlib
+import importlib.metadata
 import os
 import pkgutil
-import inspect
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,23 +23,27 @@ class DataTransformer(ABC):
     capabilities to DataFusion beyond the built-in transformations.
     """
     
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """The name of the transformer (displayed in the UI)."""
-        pass
-        
-    @property
-    @abstractmethod
-    def description(self) -> str:
-        """A short description of what the transformer does."""
-        pass
+    #: The name of the transformer (displayed in the UI)
+    name: str = ""
+    #: A short description of what the transformer does
+    description: str = ""
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not cls.name or not cls.description:
+            raise TypeError(f"{cls.__name__} must define name and description")
         
-    @abstractmethod
+    #: Parameter definitions, declared once per class (see get_parameters)
+    PARAMETERS: List[Dict[str, Any]] = []
+    
     def get_parameters(self) -> List[Dict[str, Any]]:
         """
         Get the parameters required by this transformer.
         
+        The definitions are static, so subclasses declare them as the
+        PARAMETERS class attribute instead of rebuilding them on every call.
+        The returned list is shared and must not be modified.
+        
         Returns:
             A list of parameter dictionaries, each containing:
                 - name: Parameter name
@@ -49,7 +53,7 @@ class DataTransformer(ABC):
                 - required: Whether the parameter is required
                 - options: For 'select' type, a list of options
         """
-        pass
+        return self.PARAMETERS
         
     @abstractmethod
     def transform(self, df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -84,6 +88,49 @@ class DataTransformer(ABC):
                 errors[name] = f"Parameter '{param['label']}' is required"
                 
         return errors
+        
+    def compile(self, params: Dict[str, Any]) -> Callable[[pd.DataFrame], pd.DataFrame]:
+        """
+        Validate parameters once and bind them to the transformation.
+        
+        Useful when the same transformation is applied to many DataFrames
+        (e.g. batches of one file). Transformers that override _prepare also
+        parse their parameters and pick their kernel here, so each call only
+        does the work that depends on the data.
+        
+        Args:
+            params: Dictionary of parameters for the transformation
+            
+        Returns:
+            Function taking a DataFrame and returning the transformed DataFrame
+            
+        Raises:
+            ValueError: If the parameters are invalid
+        """
+        errors = self.validate_parameters(params)
+        if errors:
+            raise ValueError("; ".join(errors.values()))
+            
+        return self._prepare(dict(params))
+        
+    def _prepare(self, params: Dict[str, Any]) -> Callable[[pd.DataFrame], pd.DataFrame]:
+        """
+        Resolve the parameters into a function applying the transformation.
+        
+        The default binds the parameters to transform(). Subclasses override
+        this to do the parameter-only work once, and implement transform()
+        as ``self._prepare(params)(df)``.
+        
+        Args:
+            params: Dictionary of parameters for the transformation
+            
+        Returns:
+            Function taking a DataFrame and returning the transformed DataFrame
+        """
+        def apply(df: pd.DataFrame) -> pd.DataFrame:
+            return self.transform(df, params)
+            
+        return apply
 
 
 # Dictionary to store registered transformers
@@ -102,9 +149,22 @@ def register_transformer(cls):
     if not issubclass(cls, DataTransformer):
         raise TypeError("Class must inherit from DataTransformer")
         
+    _register_instance(cls)
+    return cls
+
+def _register_instance(cls) -> DataTransformer:
+    """
+    Instantiate a transformer class and add it to the registry.
+    
+    Args:
+        cls: The DataTransformer class to register
+        
+    Returns:
+        The registered transformer instance
+    """
     instance = cls()
     _transformers[instance.name] = instance
-    return cls
+    return instance
 
 def get_transformer(name: str) -> Optional[DataTransformer]:
     """
@@ -160,9 +220,16 @@ def apply_transformer(
         logger.error(f"Error applying transformer '{transformer_name}': {str(e)}", exc_info=True)
         return {"error": f"Error applying transformer: {str(e)}"}
 
+# Entry-point group through which installed packages can provide transformers
+ENTRY_POINT_GROUP = 'datafusion.transformers'
+
 # Automatically discover and load all transformers in this package
 def discover_transformers():
-    """Discover and load all transformer modules in this package."""
+    """
+    Discover and load all transformer modules in this package, followed by
+    any transformers advertised under the ``datafusion.transformers``
+    entry-point group.
+    """
     # Get the directory of this module
     package_dir = os.path.dirname(__file__)
     
@@ -176,16 +243,34 @@ def discover_transformers():
             # Import the module
             module = importlib.import_module(f"{__name__}.{module_name}")
             
-            # Find all DataTransformer subclasses in the module
-            for name, obj in inspect.getmembers(module):
-                if (inspect.isclass(obj) and 
+            # Classes decorated with @register_transformer were already
+            # instantiated on import; reuse those instances
+            registered = {type(t): t for t in _transformers.values()}
+            
+            # Find the DataTransformer subclasses defined in the module
+            for obj in vars(module).values():
+                if (isinstance(obj, type) and 
                     issubclass(obj, DataTransformer) and 
-                    obj is not DataTransformer):
+                    obj is not DataTransformer and
+                    obj.__module__ == module.__name__):
                     # Register the transformer
-                    register_transformer(obj)
-                    logger.info(f"Registered transformer: {obj().name}")
+                    instance = registered.get(obj) or _register_instance(obj)
+                    logger.info(f"Registered transformer: {instance.name}")
         except Exception as e:
             logger.error(f"Error loading transformer module {module_name}: {str(e)}", exc_info=True)
+    
+    # Load transformers provided by installed packages
+    for entry_point in importlib.metadata.entry_points(group=ENTRY_POINT_GROUP):
+        try:
+            transformer_cls = entry_point.load()
+            if not issubclass(transformer_cls, DataTransformer):
+                raise TypeError("Class must inherit from DataTransformer")
+                
+            # Class attribute or @property, the instance has the real name
+            instance = _register_instance(transformer_cls)
+            logger.info(f"Registered transformer: {instance.name}")
+        except Exception as e:
+            logger.error(f"Error loading transformer entry point {entry_point.name}: {str(e)}", exc_info=True)
 
 # Discover transformers when this module is imported
 discover_transformers()
\ No newline at end of file
@@ -4,89 +4,160 @@ Date Transformers
 Plugin with date and time transformation operations.
 """
 
+import re
+import hashlib
+import streamlit as st
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from src.plugins.data_transformers import DataTransformer, register_transformer
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def _parse_dates_cached(digest: str, input_format: str, _values: pd.Series) -> pd.Series:
+    """
+    Parse a column to datetimes, cached by content digest and format.
+    
+    The cache is keyed on ``digest`` rather than the column itself
+    (``_values`` is excluded from hashing). Streamlit only samples large
+    Series when hashing them, which can return a stale result for a column
+    that changed outside the sampled rows.
+    
+    Args:
+        digest: Exact digest of the column, as computed by _parse_dates
+        input_format: strftime-style format, or empty to let pandas infer it
+        _values: Column to parse
+        
+    Returns:
+        Parsed datetime Series (NaT where a value could not be parsed)
+    """
+    return pd.to_datetime(_values, format=input_format or None, errors='coerce')
+
+def _parse_dates(values: pd.Series, input_format: str = '') -> pd.Series:
+    """
+    Parse a column to datetimes, cached by content and format.
+    
+    String parsing dominates the cost of every date transformation, so
+    applying several transformations to the same column only parses it once.
+    
+    Args:
+        values: Column to parse
+        input_format: strftime-style format, or empty to let pandas infer it
+        
+    Returns:
+        Parsed datetime Series (NaT where a value could not be parsed)
+    """
+    try:
+        row_hashes = pd.util.hash_pandas_object(values, index=True).to_numpy()
+    except TypeError:
+        # Unhashable values (e.g. lists) are parsed without caching
+        return pd.to_datetime(values, format=input_format or None, errors='coerce')
+        
+    hasher = hashlib.blake2b(row_hashes.tobytes(), digest_size=16)
+    hasher.update(f"{values.name!r}:{values.dtype}".encode())
+    return _parse_dates_cached(hasher.hexdigest(), input_format, values)
+
+# Unambiguous layouts recognized by _guess_format, tried in order. Layouts
+# such as NN/NN/YYYY are left to pandas, which tells day-first and
+# month-first columns apart
+_FORMAT_PATTERNS = [
+    (re.compile(r'^\d{4}-\d{2}-\d{2}T'), 'ISO8601'),
+    (re.compile(r'^\d{4}-\d{2}-\d{2}$'), '%Y-%m-%d'),
+]
+
+def _guess_format(values: pd.Series, sample_size: int = 3) -> Optional[str]:
+    """
+    Guess the format of a column of date strings from its first values.
+    
+    Passing an explicit format lets pandas skip probing every value. A
+    format is only returned when it parses the whole sample.
+    
+    Args:
+        values: Column to inspect
+        sample_size: Number of non-null values to check
+        
+    Returns:
+        A format for pd.to_datetime, or None to let pandas infer it
+    """
+    sample = values.dropna().head(sample_size)
+    if sample.empty or not all(isinstance(value, str) for value in sample):
+        return None
+        
+    for pattern, date_format in _FORMAT_PATTERNS:
+        if all(pattern.match(value) for value in sample):
+            parsed = pd.to_datetime(sample, format=date_format, errors='coerce')
+            return date_format if parsed.notna().all() else None
+    return None
+
 @register_transformer
 class DateFormatTransformer(DataTransformer):
     """
     Transformer to format dates in a column.
     """
     
-    @property
-    def name(self) -> str:
-        return "Date Format Transformer"
+    name = "Date Format Transformer"
+    description = "Convert or format dates in a column"
         
-    @property
-    def description(self) -> str:
-        return "Convert or format dates in a column"
-        
-    def get_parameters(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                'name': 'column',
-                'type': 'select',
-                'label': 'Column',
-                'required': True,
-                'dynamic_options': True
-            },
-            {
-                'name': 'input_format',
-                'type': 'string',
-                'label': 'Input Format (leave blank for auto-detect)',
-                'required': False,
-                'default': '',
-                'help': "e.g., '%Y-%m-%d' for YYYY-MM-DD"
-            },
-            {
-                'name': 'output_format',
-                'type': 'select',
-                'label': 'Output Format',
-                'required': True,
-                'default': '%Y-%m-%d',
-                'options': [
-                    {'value': '%Y-%m-%d', 'label': 'YYYY-MM-DD'},
-                    {'value': '%m/%d/%Y', 'label': 'MM/DD/YYYY'},
-                    {'value': '%d/%m/%Y', 'label': 'DD/MM/YYYY'},
-                    {'value': '%b %d, %Y', 'label': 'Month DD, YYYY'},
-                    {'value': '%B %d, %Y', 'label': 'Full Month DD, YYYY'},
-                    {'value': '%Y%m%d', 'label': 'YYYYMMDD (no separators)'},
-                    {'value': 'custom', 'label': 'Custom Format...'}
-                ]
-            },
-            {
-                'name': 'custom_output_format',
-                'type': 'string',
-                'label': 'Custom Output Format',
-                'required': False,
-                'default': '',
-                'help': "Only used if 'Custom Format' is selected above"
-            },
-            {
-                'name': 'create_new_column',
-                'type': 'boolean',
-                'label': 'Create New Column',
-                'required': False,
-                'default': False
-            },
-            {
-                'name': 'new_column_name',
-                'type': 'string',
-                'label': 'New Column Name',
-                'required': False,
-                'default': '',
-                'help': "Only used if 'Create New Column' is checked"
-            }
-        ]
+    PARAMETERS = [
+        {
+            'name': 'column',
+            'type': 'select',
+            'label': 'Column',
+            'required': True,
+            'dynamic_options': True
+        },
+        {
+            'name': 'input_format',
+            'type': 'string',
+            'label': 'Input Format (leave blank for auto-detect)',
+            'required': False,
+            'default': '',
+            'help': "e.g., '%Y-%m-%d' for YYYY-MM-DD"
+        },
+        {
+            'name': 'output_format',
+            'type': 'select',
+            'label': 'Output Format',
+            'required': True,
+            'default': '%Y-%m-%d',
+            'options': [
+                {'value': '%Y-%m-%d', 'label': 'YYYY-MM-DD'},
+                {'value': '%m/%d/%Y', 'label': 'MM/DD/YYYY'},
+                {'value': '%d/%m/%Y', 'label': 'DD/MM/YYYY'},
+                {'value': '%b %d, %Y', 'label': 'Month DD, YYYY'},
+                {'value': '%B %d, %Y', 'label': 'Full Month DD, YYYY'},
+                {'value': '%Y%m%d', 'label': 'YYYYMMDD (no separators)'},
+                {'value': 'custom', 'label': 'Custom Format...'}
+            ]
+        },
+        {
+            'name': 'custom_output_format',
+            'type': 'string',
+            'label': 'Custom Output Format',
+            'required': False,
+            'default': '',
+            'help': "Only used if 'Custom Format' is selected above"
+        },
+        {
+            'name': 'create_new_column',
+            'type': 'boolean',
+            'label': 'Create New Column',
+            'required': False,
+            'default': False
+        },
+        {
+            'name': 'new_column_name',
+            'type': 'string',
+            'label': 'New Column Name',
+            'required': False,
+            'default': '',
+            'help': "Only used if 'Create New Column' is checked"
+        }
+    ]
         
     def transform(self, df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
         """Format dates in a column."""
-        result = df.copy()
-        
         column = params.get('column')
         input_format = params.get('input_format', '')
         output_format = params.get('output_format')
@@ -94,7 +165,7 @@ class DateFormatTransformer(DataTransformer):
         create_new_column = params.get('create_new_column', False)
         new_column_name = params.get('new_column_name', '')
         
-        if column not in result.columns:
+        if column not in df.columns:
             raise ValueError(f"Column '{column}' not found in dataframe")
             
         # Determine the actual output format
@@ -111,9 +182,14 @@ class DateFormatTransformer(DataTransformer):
         # Convert to datetime with the specified format or auto-detect
         try:
             if input_format:
-                datetime_series = pd.to_datetime(result[column], format=input_format, errors='coerce')
+                datetime_series = _parse_dates(df[column], input_format)
             else:
-                datetime_series = pd.to_datetime(result[column], infer_datetime_format=True, errors='coerce')
+                # ISO 8601 input has a dedicated fast parser; anything else
+                # falls back to parsing each value's format individually
+                try:
+                    datetime_series = pd.to_datetime(df[column], format='ISO8601')
+                except (ValueError, TypeError):
+                    datetime_series = _parse_dates(df[column], 'mixed')
                 
             # Format the dates
             formatted_dates = datetime_series.dt.strftime(actual_output_format)
@@ -121,13 +197,11 @@ class DateFormatTransformer(DataTransformer):
             # Replace NaT with empty string
             formatted_dates = formatted_dates.fillna('')
             
-            # Assign to the target column
-            result[target_column] = formatted_dates
-            
         except Exception as e:
             raise ValueError(f"Error formatting dates: {str(e)}")
             
-        return result
+        # Only the target column is new; the others are shared with df
+        return df.assign(**{target_column: formatted_dates})
 
 
 @register_transformer
@@ -136,61 +210,68 @@ class DateExtractTransformer(DataTransformer):
     Transformer to extract components from dates.
     """
     
-    @property
-    def name(self) -> str:
-        return "Date Component Extractor"
-        
-    @property
-    def description(self) -> str:
-        return "Extract components (year, month, day, etc.) from dates"
+    # Extraction function for each component, using the vectorized .dt accessors
+    _EXTRACT = {
+        'year': lambda s: s.dt.year,
+        'month': lambda s: s.dt.month,
+        'month_name': lambda s: s.dt.month_name(),
+        'day': lambda s: s.dt.day,
+        'day_of_week': lambda s: s.dt.dayofweek + 1,  # 1-based day of week
+        'day_name': lambda s: s.dt.day_name(),
+        'quarter': lambda s: s.dt.quarter,
+        'week': lambda s: s.dt.isocalendar().week,
+        'hour': lambda s: s.dt.hour,
+        'minute': lambda s: s.dt.minute,
+        'second': lambda s: s.dt.second
+    }
+    
+    name = "Date Component Extractor"
+    description = "Extract components (year, month, day, etc.) from dates"
         
-    def get_parameters(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                'name': 'column',
-                'type': 'select',
-                'label': 'Date Column',
-                'required': True,
-                'dynamic_options': True
-            },
-            {
-                'name': 'component',
-                'type': 'select',
-                'label': 'Component to Extract',
-                'required': True,
-                'default': 'year',
-                'options': [
-                    {'value': 'year', 'label': 'Year'},
-                    {'value': 'month', 'label': 'Month (number)'},
-                    {'value': 'month_name', 'label': 'Month Name'},
-                    {'value': 'day', 'label': 'Day of Month'},
-                    {'value': 'day_of_week', 'label': 'Day of Week (number)'},
-                    {'value': 'day_name', 'label': 'Day Name'},
-                    {'value': 'quarter', 'label': 'Quarter'},
-                    {'value': 'week', 'label': 'Week of Year'},
-                    {'value': 'hour', 'label': 'Hour'},
-                    {'value': 'minute', 'label': 'Minute'},
-                    {'value': 'second', 'label': 'Second'}
-                ]
-            },
-            {
-                'name': 'target_column',
-                'type': 'string',
-                'label': 'Target Column Name',
-                'required': True,
-                'default': ''
-            }
-        ]
+    PARAMETERS = [
+        {
+            'name': 'column',
+            'type': 'select',
+            'label': 'Date Column',
+            'required': True,
+            'dynamic_options': True
+        },
+        {
+            'name': 'component',
+            'type': 'select',
+            'label': 'Component to Extract',
+            'required': True,
+            'default': 'year',
+            'options': [
+                {'value': 'year', 'label': 'Year'},
+                {'value': 'month', 'label': 'Month (number)'},
+                {'value': 'month_name', 'label': 'Month Name'},
+                {'value': 'day', 'label': 'Day of Month'},
+                {'value': 'day_of_week', 'label': 'Day of Week (number)'},
+                {'value': 'day_name', 'label': 'Day Name'},
+                {'value': 'quarter', 'label': 'Quarter'},
+                {'value': 'week', 'label': 'Week of Year'},
+                {'value': 'hour', 'label': 'Hour'},
+                {'value': 'minute', 'label': 'Minute'},
+                {'value': 'second', 'label': 'Second'}
+            ]
+        },
+        {
+            'name': 'target_column',
+            'type': 'string',
+            'label': 'Target Column Name',
+            'required': True,
+            'default': ''
+        }
+    ]
         
     def transform(self, df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
         """Extract date components."""
-        result = df.copy()
-        
         column = params.get('column')
         component = params.get('component')
         target_column = params.get('target_column')
         
-        if column not in result.columns:
+        if column not in df.columns:
             raise ValueError(f"Column '{column}' not found in dataframe")
             
         if not target_column:
@@ -198,36 +279,20 @@ class DateExtractTransformer(DataTransformer):
             
         # Convert to datetime
         try:
-            datetime_series = pd.to_datetime(result[column], errors='coerce')
+            datetime_series = _parse_dates(df[column], _guess_format(df[column]) or '')
             
             # Extract the requested component
-            if component == 'year':
-                result[target_column] = datetime_series.dt.year
-            elif component == 'month':
-                result[target_column] = datetime_series.dt.month
-            elif component == 'month_name':
-                result[target_column] = datetime_series.dt.strftime('%B')
-            elif component == 'day':
-                result[target_column] = datetime_series.dt.day
-            elif component == 'day_of_week':
-                result[target_column] = datetime_series.dt.dayofweek + 1  # 1-based day of week
-            elif component == 'day_name':
-                result[target_column] = datetime_series.dt.strftime('%A')
-            elif component == 'quarter':
-                result[target_column] = datetime_series.dt.quarter
-            elif component == 'week':
-                result[target_column] = datetime_series.dt.isocalendar().week
-            elif component == 'hour':
-                result[target_column] = datetime_series.dt.hour
-            elif component == 'minute':
-                result[target_column] = datetime_series.dt.minute
-            elif component == 'second':
-                result[target_column] = datetime_series.dt.second
+            extract = self._EXTRACT.get(component)
+            values = extract(datetime_series) if extract else None
                 
         except Exception as e:
             raise ValueError(f"Error extracting date components: {str(e)}")
             
-        return result
+        # Unknown components leave the data unchanged
+        if values is None:
+            return df.copy(deep=False)
+            
+        return df.assign(**{target_column: values})
 
 
 @register_transformer
@@ -236,77 +301,80 @@ class DateDifferenceTransformer(DataTransformer):
     Transformer to calculate the difference between two date columns.
     """
     
-    @property
-    def name(self) -> str:
-        return "Date Difference Calculator"
-        
-    @property
-    def description(self) -> str:
-        return "Calculate the difference between two date columns"
+    # Length of each time unit in seconds (months and years are averages)
+    _UNIT_SECONDS = {
+        'days': 60 * 60 * 24,
+        'hours': 60 * 60,
+        'minutes': 60,
+        'seconds': 1,
+        'weeks': 60 * 60 * 24 * 7,
+        'months': int(60 * 60 * 24 * 30.44),
+        'years': int(60 * 60 * 24 * 365.25)
+    }
+    
+    name = "Date Difference Calculator"
+    description = "Calculate the difference between two date columns"
         
-    def get_parameters(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                'name': 'start_column',
-                'type': 'select',
-                'label': 'Start Date Column',
-                'required': True,
-                'dynamic_options': True
-            },
-            {
-                'name': 'end_column',
-                'type': 'select',
-                'label': 'End Date Column',
-                'required': True,
-                'dynamic_options': True
-            },
-            {
-                'name': 'target_column',
-                'type': 'string',
-                'label': 'Target Column Name',
-                'required': True,
-                'default': 'date_difference'
-            },
-            {
-                'name': 'unit',
-                'type': 'select',
-                'label': 'Time Unit',
-                'required': True,
-                'default': 'days',
-                'options': [
-                    {'value': 'days', 'label': 'Days'},
-                    {'value': 'hours', 'label': 'Hours'},
-                    {'value': 'minutes', 'label': 'Minutes'},
-                    {'value': 'seconds', 'label': 'Seconds'},
-                    {'value': 'weeks', 'label': 'Weeks'},
-                    {'value': 'months', 'label': 'Months (approx)'},
-                    {'value': 'years', 'label': 'Years (approx)'}
-                ]
-            },
-            {
-                'name': 'absolute_value',
-                'type': 'boolean',
-                'label': 'Use Absolute Value',
-                'required': False,
-                'default': False,
-                'help': "If checked, negative differences will be converted to positive"
-            }
-        ]
+    PARAMETERS = [
+        {
+            'name': 'start_column',
+            'type': 'select',
+            'label': 'Start Date Column',
+            'required': True,
+            'dynamic_options': True
+        },
+        {
+            'name': 'end_column',
+            'type': 'select',
+            'label': 'End Date Column',
+            'required': True,
+            'dynamic_options': True
+        },
+        {
+            'name': 'target_column',
+            'type': 'string',
+            'label': 'Target Column Name',
+            'required': True,
+            'default': 'date_difference'
+        },
+        {
+            'name': 'unit',
+            'type': 'select',
+            'label': 'Time Unit',
+            'required': True,
+            'default': 'days',
+            'options': [
+                {'value': 'days', 'label': 'Days'},
+                {'value': 'hours', 'label': 'Hours'},
+                {'value': 'minutes', 'label': 'Minutes'},
+                {'value': 'seconds', 'label': 'Seconds'},
+                {'value': 'weeks', 'label': 'Weeks'},
+                {'value': 'months', 'label': 'Months (approx)'},
+                {'value': 'years', 'label': 'Years (approx)'}
+            ]
+        },
+        {
+            'name': 'absolute_value',
+            'type': 'boolean',
+            'label': 'Use Absolute Value',
+            'required': False,
+            'default': False,
+            'help': "If checked, negative differences will be converted to positive"
+        }
+    ]
         
     def transform(self, df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
         """Calculate the difference between two date columns."""
-        result = df.copy()
-        
         start_column = params.get('start_column')
         end_column = params.get('end_column')
         target_column = params.get('target_column')
         unit = params.get('unit', 'days')
         absolute_value = params.get('absolute_value', False)
         
-        if start_column not in result.columns:
+        if start_column not in df.columns:
             raise ValueError(f"Start column '{start_column}' not found in dataframe")
             
-        if end_column not in result.columns:
+        if end_column not in df.columns:
             raise ValueError(f"End column '{end_column}' not found in dataframe")
             
         if not target_column:
@@ -314,36 +382,26 @@ class DateDifferenceTransformer(DataTransformer):
             
         try:
             # Convert both columns to datetime
-            start_dates = pd.to_datetime(result[start_column], errors='coerce')
-            end_dates = pd.to_datetime(result[end_column], errors='coerce')
+            start_dates = _parse_dates(df[start_column], _guess_format(df[start_column]) or '')
+            end_dates = _parse_dates(df[end_column], _guess_format(df[end_column]) or '')
             
             # Calculate the difference
             diff = end_dates - start_dates
             
-            # Convert to the requested unit
-            if unit == 'days':
-                result[target_column] = diff.dt.total_seconds() / (60 * 60 * 24)
-            elif unit == 'hours':
-                result[target_column] = diff.dt.total_seconds() / (60 * 60)
-            elif unit == 'minutes':
-                result[target_column] = diff.dt.total_seconds() / 60
-            elif unit == 'seconds':
-                result[target_column] = diff.dt.total_seconds()
-            elif unit == 'weeks':
-                result[target_column] = diff.dt.total_seconds() / (60 * 60 * 24 * 7)
-            elif unit == 'months':
-                result[target_column] = diff.dt.total_seconds() / (60 * 60 * 24 * 30.44)  # Average month length
-            elif unit == 'years':
-                result[target_column] = diff.dt.total_seconds() / (60 * 60 * 24 * 365.25)  # Average year length
-                
+            # Convert to the requested unit in one division of the raw
+            # timedelta64 values (NaT becomes NaN)
+            if unit not in self._UNIT_SECONDS:
+                raise ValueError(f"Unsupported time unit: {unit}")
+            values = diff.to_numpy() / np.timedelta64(self._UNIT_SECONDS[unit], 's')
+            
             # Apply absolute value if requested
             if absolute_value:
-                result[target_column] = result[target_column].abs()
+                np.abs(values, out=values)
                 
             # Round to 2 decimal places for readability
-            result[target_column] = result[target_column].round(2)
+            np.round(values, 2, out=values)
             
         except Exception as e:
             raise ValueError(f"Error calculating date difference: {str(e)}")
             
-        return result
\ No newline at end of file
+        return df.assign(**{target_column: values})
\ No newline at end of file
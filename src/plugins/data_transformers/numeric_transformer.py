@@ -6,10 +6,266 @@ Plugin with numerical data transformation operations.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List
+from collections import OrderedDict
+from pandas.arrays import ArrowExtensionArray
+from typing import Dict, Any, List, Tuple
+import functools
 import math
+import threading
+import warnings
+import weakref
 
 from src.plugins.data_transformers import DataTransformer, register_transformer
+from src.utils.numeric_kernels import nan_minmax, shift_scale
+
+# Coerced values of recently converted Arrow-backed columns, keyed by the id
+# of the column's (immutable) Arrow data; least recently used entries go first
+_NUMERIC_CACHE: "OrderedDict[int, Tuple[weakref.ref, Any]]" = OrderedDict()
+_NUMERIC_CACHE_SIZE = 16
+_NUMERIC_CACHE_LOCK = threading.Lock()
+
+def _to_numeric(series: pd.Series) -> pd.Series:
+    """
+    Convert a column to numeric, coercing errors to NaN.
+    
+    Same as ``pd.to_numeric(series, errors='coerce')``, but the result for an
+    Arrow-backed text column is cached, so applying several transformers to
+    the same data parses its strings only once. Arrow data is immutable, so a
+    cache entry is valid for as long as the data it was computed from is alive.
+    
+    Args:
+        series: Column to convert
+        
+    Returns:
+        Numeric Series with the index and name of the column
+    """
+    if pd.api.types.is_numeric_dtype(series.dtype) or not isinstance(series.array, ArrowExtensionArray):
+        return pd.to_numeric(series, errors='coerce')
+        
+    data = series.array.__arrow_array__()
+    key = id(data)
+    with _NUMERIC_CACHE_LOCK:
+        entry = _NUMERIC_CACHE.get(key)
+        if entry is not None and entry[0]() is data:
+            _NUMERIC_CACHE.move_to_end(key)
+            values = entry[1]
+        else:
+            values = None
+            
+    if values is None:
+        values = pd.to_numeric(series, errors='coerce').array
+        with _NUMERIC_CACHE_LOCK:
+            _NUMERIC_CACHE[key] = (weakref.ref(data), values)
+            if len(_NUMERIC_CACHE) > _NUMERIC_CACHE_SIZE:
+                _NUMERIC_CACHE.popitem(last=False)
+                
+    # Callers get their own copy, so the cached values cannot be modified
+    return pd.Series(values.copy(), index=series.index, name=series.name)
+
+# Parameter choosing the floating-point type computations are done in
+PRECISION_PARAMETER = {
+    'name': 'precision',
+    'type': 'select',
+    'label': 'Floating-Point Precision',
+    'required': False,
+    'default': 'auto',
+    'options': [
+        {'value': 'auto', 'label': 'Auto (float32 for float32 columns)'},
+        {'value': 'float64', 'label': 'Double (float64)'},
+        {'value': 'float32', 'label': 'Single (float32, faster but less precise)'}
+    ],
+    'help': "float32 halves memory traffic but keeps only about 7 significant digits"
+}
+
+def _float_dtype(precision: str, *columns: pd.Series) -> type:
+    """
+    Get the floating-point type to compute with.
+    
+    With 'auto', float32 is used only when every column is already stored in
+    32 bits or fewer as floats, so no precision is lost by the conversion.
+    
+    Args:
+        precision: 'auto', 'float32' or 'float64'
+        columns: Numeric source columns
+        
+    Returns:
+        np.float32 or np.float64
+    """
+    if precision == 'float32':
+        return np.float32
+    if precision == 'auto' and columns and all(
+        getattr(col.dtype, 'numpy_dtype', col.dtype).kind == 'f' and
+        getattr(col.dtype, 'numpy_dtype', col.dtype).itemsize <= 4
+        for col in columns
+    ):
+        return np.float32
+    return np.float64
+
+@functools.lru_cache(maxsize=256)
+def _parse_edges(edges: str) -> np.ndarray:
+    """
+    Parse comma-separated bin edges, cached by string.
+    
+    Args:
+        edges: Comma-separated numbers
+        
+    Returns:
+        Read-only float64 array of the edges
+        
+    Raises:
+        ValueError: If an edge is not a number
+    """
+    try:
+        bin_edges = np.array([float(edge) for edge in edges.split(',')])
+    except ValueError:
+        raise ValueError("Invalid bin edges format. Use comma-separated numbers.")
+    # The cached array is shared between calls
+    bin_edges.flags.writeable = False
+    return bin_edges
+
+@functools.lru_cache(maxsize=256)
+def _parse_labels(labels: str) -> Tuple[str, ...]:
+    """
+    Parse comma-separated bin labels, cached by string.
+    
+    Args:
+        labels: Comma-separated labels
+        
+    Returns:
+        Tuple of the stripped labels
+    """
+    return tuple(label.strip() for label in labels.split(','))
+
+def _equal_width_bins(values: np.ndarray, num_bins: int, labels, right: bool) -> pd.Categorical:
+    """
+    Assign values to equal-width bins by arithmetic.
+    
+    Equivalent to ``pd.cut(values, bins=num_bins, ...)``, but each value's bin
+    is computed directly from its offset from the minimum instead of by a
+    binary search over the edges. The edges and categories are still taken
+    from pd.cut (applied to just the minimum and maximum), so the result is
+    identical.
+    
+    Args:
+        values: Float64 array to bin
+        num_bins: Number of bins
+        labels: Bin labels, or None for interval categories
+        right: Whether bins include their right edge
+        
+    Returns:
+        Categorical of bins (missing for NaN values)
+    """
+    min_val, max_val = nan_minmax(values)
+    if not (np.isfinite(min_val) and np.isfinite(max_val)) or min_val == max_val:
+        # No usable range; let pandas handle (or reject) the column
+        return pd.cut(values, bins=num_bins, labels=labels, include_lowest=True, right=right)
+        
+    template, edges = pd.cut(
+        np.array([min_val, max_val]),
+        bins=num_bins,
+        labels=labels,
+        include_lowest=True,
+        right=right,
+        retbins=True
+    )
+    
+    # Estimate each bin from the value's position, then correct it by at
+    # most one step against the exact edges to absorb rounding
+    position = (values - min_val) * (num_bins / (max_val - min_val))
+    estimate = np.ceil(position) - 1 if right else np.floor(position)
+    np.clip(estimate, 0, num_bins - 1, out=estimate)
+    codes = np.where(np.isnan(values), -1, estimate).astype(np.intp)
+    
+    lower = edges[codes]
+    upper = edges[codes + 1]
+    if right:
+        codes -= (values <= lower) & (codes > 0)
+        codes += (values > upper) & (codes < num_bins - 1)
+    else:
+        codes -= (values < lower) & (codes > 0)
+        codes += (values >= upper) & (codes < num_bins - 1)
+        
+    return pd.Categorical.from_codes(codes, dtype=template.dtype)
+
+def _edge_bins_dtype(bin_edges: np.ndarray, labels, right: bool) -> pd.CategoricalDtype:
+    """
+    Get the categories of bins with explicit edges.
+    
+    The categories are taken from pd.cut applied to one value, which also
+    validates the edges and labels exactly as pd.cut does.
+    
+    Args:
+        bin_edges: Increasing bin edges
+        labels: Bin labels, or None for interval categories
+        right: Whether bins include their right edge
+        
+    Returns:
+        Categorical dtype of the bins
+    """
+    return pd.cut(
+        bin_edges[:1],
+        bins=bin_edges,
+        labels=labels,
+        include_lowest=True,
+        right=right
+    ).dtype
+
+def _edge_bins(values: np.ndarray, bin_edges: np.ndarray, labels, right: bool,
+               dtype: pd.CategoricalDtype = None) -> pd.Categorical:
+    """
+    Assign values to bins with explicit edges.
+    
+    Equivalent to ``pd.cut(values, bins=bin_edges, include_lowest=True, ...)``:
+    the bin codes come from a single np.searchsorted call and the categories
+    from _edge_bins_dtype, so no per-value intervals are built.
+    
+    Args:
+        values: Float64 array to bin
+        bin_edges: Increasing bin edges
+        labels: Bin labels, or None for interval categories
+        right: Whether bins include their right edge
+        dtype: Categories from _edge_bins_dtype, if already computed
+        
+    Returns:
+        Categorical of bins (missing for NaN and out-of-range values)
+    """
+    if dtype is None:
+        dtype = _edge_bins_dtype(bin_edges, labels, right)
+        
+    positions = np.searchsorted(bin_edges, values, side='left' if right else 'right')
+    # include_lowest: the first edge belongs to the first bin
+    positions[values == bin_edges[0]] = 1
+    
+    codes = positions - 1
+    codes[(positions == 0) | (positions == len(bin_edges))] = -1
+    return pd.Categorical.from_codes(codes, dtype=dtype)
+
+def _quantile_bins(values: np.ndarray, num_bins: int, labels) -> pd.Categorical:
+    """
+    Assign values to equal-frequency bins.
+    
+    Equivalent to ``pd.qcut(values, q=num_bins, duplicates='drop', ...)``.
+    The cut points are selected with np.quantile, which partitions the data
+    instead of sorting it, and the values are then binned with _edge_bins.
+    
+    Args:
+        values: Float64 array to bin
+        num_bins: Number of quantile bins
+        labels: Bin labels, or None for interval categories
+        
+    Returns:
+        Categorical of bins (missing for NaN values)
+    """
+    if np.isnan(values).all():
+        # Nothing to rank; let pandas handle (or reject) the column
+        return pd.qcut(values, q=num_bins, labels=labels, duplicates='drop')
+        
+    # Same quantiles as pd.qcut (rounded up where not exactly representable),
+    # with repeated cut points dropped
+    quantiles = np.linspace(0, 1, num_bins + 1)
+    np.putmask(quantiles, num_bins * quantiles != np.arange(num_bins + 1), np.nextafter(quantiles, 1))
+    bin_edges = np.unique(np.quantile(values[~np.isnan(values)], quantiles))
+    return _edge_bins(values, bin_edges, labels, right=True)
 
 @register_transformer
 class NumericScalingTransformer(DataTransformer):
@@ -17,145 +273,164 @@ class NumericScalingTransformer(DataTransformer):
     Transformer to scale numeric data (normalize, standardize, etc.).
     """
     
-    @property
-    def name(self) -> str:
-        return "Numeric Scaling Transformer"
-        
-    @property
-    def description(self) -> str:
-        return "Scale numeric data using various methods (min-max, z-score, etc.)"
-        
-    def get_parameters(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                'name': 'column',
-                'type': 'select',
-                'label': 'Column',
-                'required': True,
-                'dynamic_options': True
-            },
-            {
-                'name': 'method',
-                'type': 'select',
-                'label': 'Scaling Method',
-                'required': True,
-                'default': 'min_max',
-                'options': [
-                    {'value': 'min_max', 'label': 'Min-Max Scaling (0-1)'},
-                    {'value': 'z_score', 'label': 'Z-Score Standardization'},
-                    {'value': 'max_abs', 'label': 'Max Absolute Scaling (-1 to 1)'},
-                    {'value': 'custom_range', 'label': 'Custom Range Scaling'}
-                ]
-            },
-            {
-                'name': 'min_value',
-                'type': 'number',
-                'label': 'Min Value (for Custom Range)',
-                'required': False,
-                'default': 0
-            },
-            {
-                'name': 'max_value',
-                'type': 'number',
-                'label': 'Max Value (for Custom Range)',
-                'required': False,
-                'default': 100
-            },
-            {
-                'name': 'create_new_column',
-                'type': 'boolean',
-                'label': 'Create New Column',
-                'required': False,
-                'default': True
-            },
-            {
-                'name': 'new_column_name',
-                'type': 'string',
-                'label': 'New Column Name',
-                'required': False,
-                'default': '',
-                'help': "Leave blank to auto-generate based on method"
-            }
-        ]
+    name = "Numeric Scaling Transformer"
+    description = "Scale numeric data using various methods (min-max, z-score, etc.)"
+        
+    PARAMETERS = [
+        {
+            'name': 'column',
+            'type': 'select',
+            'label': 'Column',
+            'required': True,
+            'dynamic_options': True
+        },
+        {
+            'name': 'method',
+            'type': 'select',
+            'label': 'Scaling Method',
+            'required': True,
+            'default': 'min_max',
+            'options': [
+                {'value': 'min_max', 'label': 'Min-Max Scaling (0-1)'},
+                {'value': 'z_score', 'label': 'Z-Score Standardization'},
+                {'value': 'max_abs', 'label': 'Max Absolute Scaling (-1 to 1)'},
+                {'value': 'custom_range', 'label': 'Custom Range Scaling'}
+            ]
+        },
+        {
+            'name': 'min_value',
+            'type': 'number',
+            'label': 'Min Value (for Custom Range)',
+            'required': False,
+            'default': 0
+        },
+        {
+            'name': 'max_value',
+            'type': 'number',
+            'label': 'Max Value (for Custom Range)',
+            'required': False,
+            'default': 100
+        },
+        {
+            'name': 'create_new_column',
+            'type': 'boolean',
+            'label': 'Create New Column',
+            'required': False,
+            'default': True
+        },
+        {
+            'name': 'new_column_name',
+            'type': 'string',
+            'label': 'New Column Name',
+            'required': False,
+            'default': '',
+            'help': "Leave blank to auto-generate based on method"
+        },
+        PRECISION_PARAMETER
+    ]
+        
+    # Suffix of the auto-generated target column name for each method
+    _SUFFIXES = {
+        'min_max': 'scaled',
+        'z_score': 'zscore',
+        'max_abs': 'maxabs',
+        'custom_range': 'custom'
+    }
+    
+    @staticmethod
+    def _min_max(values: np.ndarray, has_missing: bool, dtype: type, min_value, max_value):
+        """Scale values to [0, 1]."""
+        min_val, max_val = nan_minmax(values)
+        if min_val == max_val:
+            return dtype(0.5)
+        return shift_scale(values, min_val, 1.0 / (max_val - min_val))
+        
+    @staticmethod
+    def _z_score(values: np.ndarray, has_missing: bool, dtype: type, min_value, max_value):
+        """Standardize values to zero mean and unit sample standard deviation."""
+        # Without missing values the plain reductions give the same results
+        # and skip the NaN masking of the nan* variants
+        if has_missing:
+            mean = np.nanmean(values)
+            std = np.nanstd(values, ddof=1)
+        else:
+            mean = np.mean(values)
+            std = np.std(values, ddof=1)
+        if std == 0:
+            return dtype(0)
+        return shift_scale(values, mean, 1.0 / std)
+        
+    @staticmethod
+    def _max_abs(values: np.ndarray, has_missing: bool, dtype: type, min_value, max_value):
+        """Scale values to [-1, 1] by their largest absolute value."""
+        min_val, max_val = nan_minmax(values)
+        max_abs = max(abs(min_val), abs(max_val))
+        if max_abs == 0:
+            return dtype(0)
+        return shift_scale(values, 0.0, 1.0 / max_abs)
+        
+    @staticmethod
+    def _custom_range(values: np.ndarray, has_missing: bool, dtype: type, min_value, max_value):
+        """Scale values to [min_value, max_value]."""
+        min_val, max_val = nan_minmax(values)
+        if min_val == max_val:
+            # If all values are the same, map to middle of range
+            return dtype((min_value + max_value) / 2)
+        scale = (max_value - min_value) / (max_val - min_val)
+        return shift_scale(values, min_val, scale, min_value)
         
     def transform(self, df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
         """Scale numeric data using various methods."""
-        result = df.copy()
+        return self._prepare(params)(df)
         
+    def _prepare(self, params: Dict[str, Any]):
+        """Resolve the target column and scaling kernel once."""
         column = params.get('column')
         method = params.get('method', 'min_max')
         min_value = params.get('min_value', 0)
         max_value = params.get('max_value', 100)
         create_new_column = params.get('create_new_column', True)
         new_column_name = params.get('new_column_name', '')
+        precision = params.get('precision', 'auto')
         
-        if column not in result.columns:
-            raise ValueError(f"Column '{column}' not found in dataframe")
-            
-        # Try to convert to numeric, coercing errors to NaN
-        numeric_data = pd.to_numeric(result[column], errors='coerce')
+        if method not in self._SUFFIXES:
+            raise ValueError(f"Unsupported scaling method: {method}")
+        kernel = getattr(self, f"_{method}")
         
-        # Check if we have valid numeric data
-        if numeric_data.isna().all():
-            raise ValueError(f"Column '{column}' does not contain valid numeric data")
-            
         # Auto-generate target column name if not provided
         if create_new_column and not new_column_name:
-            if method == 'min_max':
-                new_column_name = f"{column}_scaled"
-            elif method == 'z_score':
-                new_column_name = f"{column}_zscore"
-            elif method == 'max_abs':
-                new_column_name = f"{column}_maxabs"
-            elif method == 'custom_range':
-                new_column_name = f"{column}_custom"
-        
+            new_column_name = f"{column}_{self._SUFFIXES[method]}"
+            
         # Determine target column
         target_column = new_column_name if create_new_column else column
         
-        try:
-            # Apply the selected scaling method
-            if method == 'min_max':
-                min_val = numeric_data.min()
-                max_val = numeric_data.max()
-                if min_val == max_val:
-                    scaled_data = pd.Series(0.5, index=numeric_data.index)
-                else:
-                    scaled_data = (numeric_data - min_val) / (max_val - min_val)
+        def apply(df: pd.DataFrame) -> pd.DataFrame:
+            if column not in df.columns:
+                raise ValueError(f"Column '{column}' not found in dataframe")
                 
-            elif method == 'z_score':
-                mean = numeric_data.mean()
-                std = numeric_data.std()
-                if std == 0:
-                    scaled_data = pd.Series(0, index=numeric_data.index)
-                else:
-                    scaled_data = (numeric_data - mean) / std
+            # Try to convert to numeric, coercing errors to NaN; the scaling is
+            # done on the raw float array to skip Series alignment and dispatch
+            numeric_data = _to_numeric(df[column])
+            dtype = _float_dtype(precision, numeric_data)
+            values = numeric_data.to_numpy(dtype=dtype, na_value=np.nan)
+            
+            # Check if we have valid numeric data
+            missing = np.isnan(values)
+            if missing.all():
+                raise ValueError(f"Column '{column}' does not contain valid numeric data")
                 
-            elif method == 'max_abs':
-                max_abs = max(abs(numeric_data.min()), abs(numeric_data.max()))
-                if max_abs == 0:
-                    scaled_data = pd.Series(0, index=numeric_data.index)
-                else:
-                    scaled_data = numeric_data / max_abs
+            try:
+                scaled_data = kernel(values, missing.any(), dtype, min_value, max_value)
                 
-            elif method == 'custom_range':
-                min_val = numeric_data.min()
-                max_val = numeric_data.max()
-                if min_val == max_val:
-                    # If all values are the same, map to middle of range
-                    middle = (min_value + max_value) / 2
-                    scaled_data = pd.Series(middle, index=numeric_data.index)
-                else:
-                    # Map to custom range
-                    scaled_data = (numeric_data - min_val) / (max_val - min_val) * (max_value - min_value) + min_value
-            
-            # Assign the scaled data to the target column
-            result[target_column] = scaled_data
-            
-        except Exception as e:
-            raise ValueError(f"Error scaling numeric data: {str(e)}")
-            
-        return result
+                # Write the scaled data to the target column; constants (from
+                # columns without spread) are broadcast by pandas without an
+                # intermediate array
+                return df.assign(**{target_column: scaled_data})
+                
+            except Exception as e:
+                raise ValueError(f"Error scaling numeric data: {str(e)}")
+                
+        return apply
 
 
 @register_transformer
@@ -164,81 +439,89 @@ class BinningTransformer(DataTransformer):
     Transformer to bin numeric data into categories.
     """
     
-    @property
-    def name(self) -> str:
-        return "Numeric Binning Transformer"
-        
-    @property
-    def description(self) -> str:
-        return "Create categories or groups from numeric data by binning values"
-        
-    def get_parameters(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                'name': 'column',
-                'type': 'select',
-                'label': 'Column',
-                'required': True,
-                'dynamic_options': True
-            },
-            {
-                'name': 'method',
-                'type': 'select',
-                'label': 'Binning Method',
-                'required': True,
-                'default': 'equal_width',
-                'options': [
-                    {'value': 'equal_width', 'label': 'Equal Width Bins'},
-                    {'value': 'equal_freq', 'label': 'Equal Frequency Bins (Quantiles)'},
-                    {'value': 'custom', 'label': 'Custom Bin Edges'}
-                ]
-            },
-            {
-                'name': 'num_bins',
-                'type': 'number',
-                'label': 'Number of Bins',
-                'required': False,
-                'default': 5,
-                'min': 2,
-                'max': 100
-            },
-            {
-                'name': 'custom_bins',
-                'type': 'string',
-                'label': 'Custom Bin Edges (comma-separated)',
-                'required': False,
-                'default': '',
-                'help': "e.g., '0,18,35,50,65,100' for age groups"
-            },
-            {
-                'name': 'labels',
-                'type': 'string',
-                'label': 'Bin Labels (comma-separated, optional)',
-                'required': False,
-                'default': '',
-                'help': "e.g., 'Low,Medium,High' for 3 bins"
-            },
-            {
-                'name': 'target_column',
-                'type': 'string',
-                'label': 'Target Column Name',
-                'required': True,
-                'default': ''
-            },
-            {
-                'name': 'include_right',
-                'type': 'boolean',
-                'label': 'Include Right Edge in Bin',
-                'required': False,
-                'default': True,
-                'help': "If checked, bins include the right edge: (a,b]. Otherwise: [a,b)"
-            }
-        ]
+    name = "Numeric Binning Transformer"
+    description = "Create categories or groups from numeric data by binning values"
+        
+    PARAMETERS = [
+        {
+            'name': 'column',
+            'type': 'select',
+            'label': 'Column',
+            'required': True,
+            'dynamic_options': True
+        },
+        {
+            'name': 'method',
+            'type': 'select',
+            'label': 'Binning Method',
+            'required': True,
+            'default': 'equal_width',
+            'options': [
+                {'value': 'equal_width', 'label': 'Equal Width Bins'},
+                {'value': 'equal_freq', 'label': 'Equal Frequency Bins (Quantiles)'},
+                {'value': 'custom', 'label': 'Custom Bin Edges'}
+            ]
+        },
+        {
+            'name': 'num_bins',
+            'type': 'number',
+            'label': 'Number of Bins',
+            'required': False,
+            'default': 5,
+            'min': 2,
+            'max': 100
+        },
+        {
+            'name': 'custom_bins',
+            'type': 'string',
+            'label': 'Custom Bin Edges (comma-separated)',
+            'required': False,
+            'default': '',
+            'help': "e.g., '0,18,35,50,65,100' for age groups"
+        },
+        {
+            'name': 'labels',
+            'type': 'string',
+            'label': 'Bin Labels (comma-separated, optional)',
+            'required': False,
+            'default': '',
+            'help': "e.g., 'Low,Medium,High' for 3 bins"
+        },
+        {
+            'name': 'target_column',
+            'type': 'string',
+            'label': 'Target Column Name',
+            'required': True,
+            'default': ''
+        },
+        {
+            'name': 'include_right',
+            'type': 'boolean',
+            'label': 'Include Right Edge in Bin',
+            'required': False,
+            'default': True,
+            'help': "If checked, bins include the right edge: (a,b]. Otherwise: [a,b)"
+        },
+        {
+            'name': 'output_type',
+            'type': 'select',
+            'label': 'Output',
+            'required': False,
+            'default': 'labels',
+            'options': [
+                {'value': 'labels', 'label': 'Bin Labels (categorical)'},
+                {'value': 'codes', 'label': 'Bin Numbers (0, 1, 2, ...)'}
+            ],
+            'help': "Bin numbers start at 0; missing and out-of-range values get -1"
+        }
+    ]
         
     def transform(self, df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
         """Bin numeric data into categories."""
-        result = df.copy()
+        return self._prepare(params)(df)
         
+    def _prepare(self, params: Dict[str, Any]):
+        """Parse the edges and labels and pick the binning kernel once."""
         column = params.get('column')
         method = params.get('method', 'equal_width')
         num_bins = params.get('num_bins', 5)
@@ -246,31 +529,25 @@ class BinningTransformer(DataTransformer):
         labels_str = params.get('labels', '')
         target_column = params.get('target_column')
         include_right = params.get('include_right', True)
+        output_type = params.get('output_type', 'labels')
         
-        if column not in result.columns:
-            raise ValueError(f"Column '{column}' not found in dataframe")
-            
         if not target_column:
             raise ValueError("Target column name cannot be empty")
             
-        # Convert to numeric data
-        numeric_data = pd.to_numeric(result[column], errors='coerce')
-        
         # Parse labels if provided
         labels = None
         if labels_str:
-            labels = [label.strip() for label in labels_str.split(',')]
+            labels = _parse_labels(labels_str)
             
+        # Function binning the float64 values; None for unknown methods
+        kernel = None
         try:
             if method == 'custom':
                 if not custom_bins_str:
                     raise ValueError("Custom bin edges must be provided")
                     
                 # Parse custom bins
-                try:
-                    bin_edges = [float(edge.strip()) for edge in custom_bins_str.split(',')]
-                except:
-                    raise ValueError("Invalid bin edges format. Use comma-separated numbers.")
+                bin_edges = _parse_edges(custom_bins_str)
                     
                 # Check bin edges
                 if len(bin_edges) < 2:
@@ -280,16 +557,16 @@ class BinningTransformer(DataTransformer):
                 if labels and len(labels) != len(bin_edges) - 1:
                     raise ValueError(f"Number of labels ({len(labels)}) must be one less than bin edges ({len(bin_edges)})")
                     
-                # Create bins
-                result[target_column] = pd.cut(
-                    numeric_data,
-                    bins=bin_edges,
+                # The categories only depend on the edges and labels
+                kernel = functools.partial(
+                    _edge_bins,
+                    bin_edges=bin_edges,
                     labels=labels,
-                    include_lowest=True,
-                    right=include_right
+                    right=include_right,
+                    dtype=_edge_bins_dtype(bin_edges, labels, include_right)
                 )
                 
-            elif method == 'equal_width':
+            elif method in ('equal_width', 'equal_freq'):
                 # Check num_bins
                 if num_bins < 2:
                     raise ValueError("Number of bins must be at least 2")
@@ -298,36 +575,37 @@ class BinningTransformer(DataTransformer):
                 if labels and len(labels) != num_bins:
                     raise ValueError(f"Number of labels ({len(labels)}) must match number of bins ({num_bins})")
                     
-                # Create equal width bins
-                result[target_column] = pd.cut(
-                    numeric_data,
-                    bins=num_bins,
-                    labels=labels,
-                    include_lowest=True,
-                    right=include_right
-                )
-                
-            elif method == 'equal_freq':
-                # Check num_bins
-                if num_bins < 2:
-                    raise ValueError("Number of bins must be at least 2")
-                    
-                # Check if labels match bins
-                if labels and len(labels) != num_bins:
-                    raise ValueError(f"Number of labels ({len(labels)}) must match number of bins ({num_bins})")
+                if method == 'equal_width':
+                    kernel = functools.partial(_equal_width_bins, num_bins=num_bins, labels=labels, right=include_right)
+                else:
+                    # Equal frequency bins (quantiles)
+                    kernel = functools.partial(_quantile_bins, num_bins=num_bins, labels=labels)
                     
-                # Create equal frequency bins (quantiles)
-                result[target_column] = pd.qcut(
-                    numeric_data,
-                    q=num_bins,
-                    labels=labels,
-                    duplicates='drop'
-                )
-                
         except Exception as e:
             raise ValueError(f"Error binning data: {str(e)}")
             
-        return result
+        def apply(df: pd.DataFrame) -> pd.DataFrame:
+            if column not in df.columns:
+                raise ValueError(f"Column '{column}' not found in dataframe")
+                
+            # Unknown methods leave the data unchanged
+            if kernel is None:
+                return df.copy(deep=False)
+                
+            # Convert to numeric data once; every method bins the float64 array
+            values = _to_numeric(df[column]).to_numpy(dtype=np.float64, na_value=np.nan)
+            try:
+                binned = kernel(values)
+            except Exception as e:
+                raise ValueError(f"Error binning data: {str(e)}")
+                
+            if output_type == 'codes':
+                # Plain integer bin numbers, without the categories
+                return df.assign(**{target_column: binned.codes})
+                
+            return df.assign(**{target_column: binned})
+            
+        return apply
 
 
 @register_transformer
@@ -336,128 +614,180 @@ class MathOperationTransformer(DataTransformer):
     Transformer to perform mathematical operations on one or more columns.
     """
     
-    @property
-    def name(self) -> str:
-        return "Math Operation Transformer"
-        
-    @property
-    def description(self) -> str:
-        return "Apply mathematical operations to create a new column"
-        
-    def get_parameters(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                'name': 'operation',
-                'type': 'select',
-                'label': 'Operation Type',
-                'required': True,
-                'default': 'basic',
-                'options': [
-                    {'value': 'basic', 'label': 'Basic Operation (add, subtract, etc.)'},
-                    {'value': 'function', 'label': 'Math Function (log, sqrt, etc.)'},
-                    {'value': 'aggregate', 'label': 'Aggregate Multiple Columns'}
-                ]
-            },
-            {
-                'name': 'column1',
-                'type': 'select',
-                'label': 'First Column',
-                'required': True,
-                'dynamic_options': True
-            },
-            {
-                'name': 'operator',
-                'type': 'select',
-                'label': 'Operator',
-                'required': False,
-                'default': '+',
-                'options': [
-                    {'value': '+', 'label': 'Add (+)'},
-                    {'value': '-', 'label': 'Subtract (-)'},
-                    {'value': '*', 'label': 'Multiply (*)'},
-                    {'value': '/', 'label': 'Divide (/)'},
-                    {'value': '%', 'label': 'Modulo (%)'},
-                    {'value': '**', 'label': 'Power (**)'}
-                ]
-            },
-            {
-                'name': 'column2',
-                'type': 'select',
-                'label': 'Second Column (for basic operation)',
-                'required': False,
-                'dynamic_options': True
-            },
-            {
-                'name': 'value',
-                'type': 'number',
-                'label': 'Value (instead of second column)',
-                'required': False,
-                'default': 0
-            },
-            {
-                'name': 'use_value',
-                'type': 'boolean',
-                'label': 'Use Value instead of Second Column',
-                'required': False,
-                'default': False
-            },
-            {
-                'name': 'function',
-                'type': 'select',
-                'label': 'Math Function',
-                'required': False,
-                'default': 'log',
-                'options': [
-                    {'value': 'log', 'label': 'Natural Logarithm (ln)'},
-                    {'value': 'log10', 'label': 'Base-10 Logarithm'},
-                    {'value': 'sqrt', 'label': 'Square Root'},
-                    {'value': 'abs', 'label': 'Absolute Value'},
-                    {'value': 'exp', 'label': 'Exponential (e^x)'},
-                    {'value': 'sin', 'label': 'Sine'},
-                    {'value': 'cos', 'label': 'Cosine'},
-                    {'value': 'tan', 'label': 'Tangent'},
-                    {'value': 'round', 'label': 'Round'},
-                    {'value': 'floor', 'label': 'Floor'},
-                    {'value': 'ceil', 'label': 'Ceiling'}
-                ]
-            },
-            {
-                'name': 'aggregate_columns',
-                'type': 'string',
-                'label': 'Columns to Aggregate (comma-separated)',
-                'required': False,
-                'default': ''
-            },
-            {
-                'name': 'aggregate_function',
-                'type': 'select',
-                'label': 'Aggregate Function',
-                'required': False,
-                'default': 'sum',
-                'options': [
-                    {'value': 'sum', 'label': 'Sum'},
-                    {'value': 'mean', 'label': 'Mean (Average)'},
-                    {'value': 'min', 'label': 'Minimum'},
-                    {'value': 'max', 'label': 'Maximum'},
-                    {'value': 'median', 'label': 'Median'},
-                    {'value': 'std', 'label': 'Standard Deviation'},
-                    {'value': 'var', 'label': 'Variance'},
-                    {'value': 'prod', 'label': 'Product'}
-                ]
-            },
-            {
-                'name': 'target_column',
-                'type': 'string',
-                'label': 'Target Column Name',
-                'required': True,
-                'default': 'result'
-            }
-        ]
+    name = "Math Operation Transformer"
+    description = "Apply mathematical operations to create a new column"
+    
+    # Function for each basic operator
+    _BINARY_OPS = {
+        '+': np.add,
+        '-': np.subtract,
+        '*': np.multiply,
+        '/': np.true_divide,
+        '%': np.remainder,
+        '**': np.power
+    }
+    
+    # Error raised when a division-like operator gets a constant zero operand
+    _ZERO_DIVISION_ERRORS = {
+        '/': "Cannot divide by zero",
+        '%': "Cannot take modulo by zero"
+    }
+    
+    # Functions applied to the Series, so integer columns stay integers
+    _SERIES_FUNCS = {
+        'abs': np.abs,
+        'round': np.round,
+        'floor': np.floor,
+        'ceil': np.ceil
+    }
+    
+    # Functions evaluated in place on a float copy of the column
+    _FLOAT_FUNCS = {
+        'log': np.log,
+        'log10': np.log10,
+        'sqrt': np.sqrt,
+        'exp': np.exp,
+        'sin': np.sin,
+        'cos': np.cos,
+        'tan': np.tan
+    }
+    
+    # Comparison with zero selecting the arguments inside each function's
+    # domain; the function gives NaN elsewhere
+    _DOMAIN = {
+        'log': np.greater,
+        'log10': np.greater,
+        'sqrt': np.greater_equal
+    }
+    
+    # Row-wise NaN-skipping reduction for each aggregate; std and var use
+    # ddof=1 like pandas
+    _AGGREGATES = {
+        'sum': np.nansum,
+        'mean': np.nanmean,
+        'min': np.nanmin,
+        'max': np.nanmax,
+        'median': np.nanmedian,
+        'std': functools.partial(np.nanstd, ddof=1),
+        'var': functools.partial(np.nanvar, ddof=1),
+        'prod': np.nanprod
+    }
+    
+    # Aggregates whose result is floating point whatever the input dtypes
+    _FLOAT_AGGREGATES = ('mean', 'median', 'std', 'var')
+        
+    PARAMETERS = [
+        {
+            'name': 'operation',
+            'type': 'select',
+            'label': 'Operation Type',
+            'required': True,
+            'default': 'basic',
+            'options': [
+                {'value': 'basic', 'label': 'Basic Operation (add, subtract, etc.)'},
+                {'value': 'function', 'label': 'Math Function (log, sqrt, etc.)'},
+                {'value': 'aggregate', 'label': 'Aggregate Multiple Columns'}
+            ]
+        },
+        {
+            'name': 'column1',
+            'type': 'select',
+            'label': 'First Column',
+            'required': True,
+            'dynamic_options': True
+        },
+        {
+            'name': 'operator',
+            'type': 'select',
+            'label': 'Operator',
+            'required': False,
+            'default': '+',
+            'options': [
+                {'value': '+', 'label': 'Add (+)'},
+                {'value': '-', 'label': 'Subtract (-)'},
+                {'value': '*', 'label': 'Multiply (*)'},
+                {'value': '/', 'label': 'Divide (/)'},
+                {'value': '%', 'label': 'Modulo (%)'},
+                {'value': '**', 'label': 'Power (**)'}
+            ]
+        },
+        {
+            'name': 'column2',
+            'type': 'select',
+            'label': 'Second Column (for basic operation)',
+            'required': False,
+            'dynamic_options': True
+        },
+        {
+            'name': 'value',
+            'type': 'number',
+            'label': 'Value (instead of second column)',
+            'required': False,
+            'default': 0
+        },
+        {
+            'name': 'use_value',
+            'type': 'boolean',
+            'label': 'Use Value instead of Second Column',
+            'required': False,
+            'default': False
+        },
+        {
+            'name': 'function',
+            'type': 'select',
+            'label': 'Math Function',
+            'required': False,
+            'default': 'log',
+            'options': [
+                {'value': 'log', 'label': 'Natural Logarithm (ln)'},
+                {'value': 'log10', 'label': 'Base-10 Logarithm'},
+                {'value': 'sqrt', 'label': 'Square Root'},
+                {'value': 'abs', 'label': 'Absolute Value'},
+                {'value': 'exp', 'label': 'Exponential (e^x)'},
+                {'value': 'sin', 'label': 'Sine'},
+                {'value': 'cos', 'label': 'Cosine'},
+                {'value': 'tan', 'label': 'Tangent'},
+                {'value': 'round', 'label': 'Round'},
+                {'value': 'floor', 'label': 'Floor'},
+                {'value': 'ceil', 'label': 'Ceiling'}
+            ]
+        },
+        {
+            'name': 'aggregate_columns',
+            'type': 'string',
+            'label': 'Columns to Aggregate (comma-separated)',
+            'required': False,
+            'default': ''
+        },
+        {
+            'name': 'aggregate_function',
+            'type': 'select',
+            'label': 'Aggregate Function',
+            'required': False,
+            'default': 'sum',
+            'options': [
+                {'value': 'sum', 'label': 'Sum'},
+                {'value': 'mean', 'label': 'Mean (Average)'},
+                {'value': 'min', 'label': 'Minimum'},
+                {'value': 'max', 'label': 'Maximum'},
+                {'value': 'median', 'label': 'Median'},
+                {'value': 'std', 'label': 'Standard Deviation'},
+                {'value': 'var', 'label': 'Variance'},
+                {'value': 'prod', 'label': 'Product'}
+            ]
+        },
+        {
+            'name': 'target_column',
+            'type': 'string',
+            'label': 'Target Column Name',
+            'required': True,
+            'default': 'result'
+        },
+        PRECISION_PARAMETER
+    ]
         
     def transform(self, df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
         """Apply mathematical operations to create a new column."""
-        result = df.copy()
-        
         operation = params.get('operation', 'basic')
         column1 = params.get('column1')
         operator = params.get('operator', '+')
@@ -468,16 +798,18 @@ class MathOperationTransformer(DataTransformer):
         aggregate_columns_str = params.get('aggregate_columns', '')
         aggregate_function = params.get('aggregate_function', 'sum')
         target_column = params.get('target_column', 'result')
+        precision = params.get('precision', 'auto')
         
-        if column1 not in result.columns:
+        if column1 not in df.columns:
             raise ValueError(f"Column '{column1}' not found in dataframe")
             
         if not target_column:
             raise ValueError("Target column name cannot be empty")
             
         # Convert column1 to numeric
-        col1_data = pd.to_numeric(result[column1], errors='coerce')
+        col1_data = _to_numeric(df[column1])
         
+        values = None
         try:
             if operation == 'basic':
                 # Basic arithmetic operation
@@ -486,67 +818,56 @@ class MathOperationTransformer(DataTransformer):
                     operand2 = value
                 else:
                     # Use the second column
-                    if column2 not in result.columns:
+                    if column2 not in df.columns:
                         raise ValueError(f"Column '{column2}' not found in dataframe")
-                    operand2 = pd.to_numeric(result[column2], errors='coerce')
+                    operand2 = _to_numeric(df[column2])
                 
                 # Apply the operation
-                if operator == '+':
-                    result[target_column] = col1_data + operand2
-                elif operator == '-':
-                    result[target_column] = col1_data - operand2
-                elif operator == '*':
-                    result[target_column] = col1_data * operand2
-                elif operator == '/':
-                    # Handle division by zero
-                    if isinstance(operand2, pd.Series):
-                        # Replace zeros with NaN to avoid division errors
-                        div_operand = operand2.replace(0, np.nan)
-                        result[target_column] = col1_data / div_operand
-                    else:
-                        if operand2 == 0:
-                            raise ValueError("Cannot divide by zero")
-                        result[target_column] = col1_data / operand2
-                elif operator == '%':
-                    # Handle modulo by zero
-                    if isinstance(operand2, pd.Series):
-                        # Replace zeros with NaN to avoid modulo errors
-                        mod_operand = operand2.replace(0, np.nan)
-                        result[target_column] = col1_data % mod_operand
+                op = self._BINARY_OPS.get(operator)
+                if op is None:
+                    pass
+                elif operator in self._ZERO_DIVISION_ERRORS and isinstance(operand2, pd.Series):
+                    # Handle division and modulo by zero: divide only where the
+                    # divisor is non-zero, in one pass; other rows stay NaN
+                    dtype = _float_dtype(precision, col1_data, operand2)
+                    dividend = col1_data.to_numpy(dtype=dtype, na_value=np.nan)
+                    divisor = operand2.to_numpy(dtype=dtype, na_value=np.nan)
+                    values = np.full(len(dividend), np.nan, dtype=dtype)
+                    op(dividend, divisor, out=values, where=divisor != 0)
+                else:
+                    if operator in self._ZERO_DIVISION_ERRORS and operand2 == 0:
+                        raise ValueError(self._ZERO_DIVISION_ERRORS[operator])
+                    if isinstance(operand2, pd.Series) or not (
+                            isinstance(col1_data.dtype, np.dtype) and col1_data.dtype.kind in 'iuf'):
+                        values = op(col1_data, operand2)
+                    elif operator == '**' and operand2 == 2 and col1_data.dtype.kind == 'f':
+                        # Squaring is a plain multiply, cheaper than general pow
+                        values = np.square(col1_data.to_numpy())
                     else:
-                        if operand2 == 0:
-                            raise ValueError("Cannot take modulo by zero")
-                        result[target_column] = col1_data % operand2
-                elif operator == '**':
-                    result[target_column] = col1_data ** operand2
+                        # A constant operand on a NumPy column is a single
+                        # ufunc pass over the raw array, with the same dtype
+                        # rules as the Series operation
+                        values = op(col1_data.to_numpy(), operand2)
                 
             elif operation == 'function':
                 # Apply math function
-                if function == 'log':
-                    # Handle log of non-positive numbers
-                    result[target_column] = np.log(col1_data.clip(lower=np.finfo(float).eps))
-                elif function == 'log10':
-                    # Handle log10 of non-positive numbers
-                    result[target_column] = np.log10(col1_data.clip(lower=np.finfo(float).eps))
-                elif function == 'sqrt':
-                    # Handle sqrt of negative numbers
-                    result[target_column] = np.sqrt(col1_data.clip(lower=0))
-                elif function == 'abs':
-                    result[target_column] = np.abs(col1_data)
-                elif function == 'exp':
-                    result[target_column] = np.exp(col1_data)
-                elif function == 'sin':
-                    result[target_column] = np.sin(col1_data)
-                elif function == 'cos':
-                    result[target_column] = np.cos(col1_data)
-                elif function == 'tan':
-                    result[target_column] = np.tan(col1_data)
-                elif function == 'round':
-                    result[target_column] = np.round(col1_data)
-                elif function == 'floor':
-                    result[target_column] = np.floor(col1_data)
-                elif function == 'ceil':
-                    result[target_column] = np.ceil(col1_data)
+                if function in self._SERIES_FUNCS:
+                    values = self._SERIES_FUNCS[function](col1_data)
+                elif function in self._DOMAIN:
+                    # Evaluate only inside the function's domain, writing into
+                    # a NaN-filled output; arguments outside it give NaN
+                    dtype = _float_dtype(precision, col1_data)
+                    arguments = col1_data.to_numpy(dtype=dtype, na_value=np.nan)
+                    values = np.full(len(arguments), np.nan, dtype=dtype)
+                    self._FLOAT_FUNCS[function](
+                        arguments, out=values, where=self._DOMAIN[function](arguments, 0)
+                    )
+                elif function in self._FLOAT_FUNCS:
+                    # Evaluate in place on a private float copy, so no
+                    # intermediate array is allocated
+                    dtype = _float_dtype(precision, col1_data)
+                    values = col1_data.to_numpy(dtype=dtype, na_value=np.nan, copy=True)
+                    self._FLOAT_FUNCS[function](values, out=values)
                 
             elif operation == 'aggregate':
                 if not aggregate_columns_str:
@@ -560,32 +881,36 @@ class MathOperationTransformer(DataTransformer):
                     agg_columns = [column1] + agg_columns
                     
                 # Validate all columns exist
-                missing_columns = [col for col in agg_columns if col not in result.columns]
+                missing_columns = [col for col in agg_columns if col not in df.columns]
                 if missing_columns:
                     raise ValueError(f"Columns not found: {', '.join(missing_columns)}")
                     
                 # Convert all columns to numeric
-                numeric_df = result[agg_columns].apply(pd.to_numeric, errors='coerce')
+                numeric_columns = [_to_numeric(df[col]) for col in agg_columns]
                 
                 # Apply aggregate function
-                if aggregate_function == 'sum':
-                    result[target_column] = numeric_df.sum(axis=1)
-                elif aggregate_function == 'mean':
-                    result[target_column] = numeric_df.mean(axis=1)
-                elif aggregate_function == 'min':
-                    result[target_column] = numeric_df.min(axis=1)
-                elif aggregate_function == 'max':
-                    result[target_column] = numeric_df.max(axis=1)
-                elif aggregate_function == 'median':
-                    result[target_column] = numeric_df.median(axis=1)
-                elif aggregate_function == 'std':
-                    result[target_column] = numeric_df.std(axis=1)
-                elif aggregate_function == 'var':
-                    result[target_column] = numeric_df.var(axis=1)
-                elif aggregate_function == 'prod':
-                    result[target_column] = numeric_df.prod(axis=1)
+                if aggregate_function in self._AGGREGATES:
+                    if (aggregate_function in self._FLOAT_AGGREGATES or
+                            not all(pd.api.types.is_integer_dtype(col) for col in numeric_columns)):
+                        # Reduce one contiguous (rows x columns) float array
+                        dtype = _float_dtype(precision, *numeric_columns)
+                        matrix = np.column_stack([
+                            col.to_numpy(dtype=dtype, na_value=np.nan) for col in numeric_columns
+                        ])
+                        with warnings.catch_warnings():
+                            # All-NaN rows give NaN, as in pandas
+                            warnings.simplefilter('ignore', RuntimeWarning)
+                            values = self._AGGREGATES[aggregate_function](matrix, axis=1)
+                    else:
+                        # Integer-only sums, extremes and products stay integers
+                        numeric_df = pd.concat(numeric_columns, axis=1)
+                        values = getattr(numeric_df, aggregate_function)(axis=1)
                 
         except Exception as e:
             raise ValueError(f"Error performing math operation: {str(e)}")
             
-        return result
\ No newline at end of file
+        # Unknown operations leave the data unchanged
+        if values is None:
+            return df.copy(deep=False)
+            
+        return df.assign(**{target_column: values})
\ No newline at end of file
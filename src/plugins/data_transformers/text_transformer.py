@@ -5,10 +5,80 @@ Plugin with various text transformation operations.
 """
 
 import pandas as pd
+import numpy as np
 import re
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+import functools
 
 from src.plugins.data_transformers import DataTransformer, register_transformer
+from src.utils.data_processors import is_literal_pattern
+
+try:
+    # Arrow-backed strings with NaN for missing values (the pandas 3 default
+    # for str), so the .str methods run on Arrow compute kernels
+    _TEXT_DTYPE = pd.StringDtype('pyarrow', na_value=np.nan)
+except (ImportError, TypeError):
+    # pyarrow is missing, or pandas predates NaN-variant string dtypes
+    _TEXT_DTYPE = str
+
+def _as_text(values: pd.Series) -> pd.Series:
+    """
+    Convert a column to the text dtype, unless it already has it.
+    
+    Args:
+        values: Column to convert
+        
+    Returns:
+        The column itself, or a converted copy
+    """
+    if values.dtype == _TEXT_DTYPE:
+        return values
+    return values.astype(_TEXT_DTYPE)
+
+# Global inline flags, which must stay at the start of a pattern
+_LEADING_FLAGS = re.compile(r'^\(\?[aiLmsux]+\)')
+
+# Numeric backreference, whose group number would change if the pattern was
+# wrapped in another group
+_NUMERIC_BACKREF = re.compile(r'\\\d')
+
+@functools.lru_cache(maxsize=256)
+def _compiled(pattern: str, flags: int = 0) -> re.Pattern:
+    """
+    Compile a regular expression, cached by pattern and flags.
+    
+    Args:
+        pattern: Regular expression
+        flags: re module flags
+        
+    Returns:
+        The compiled pattern
+        
+    Raises:
+        re.error: If the pattern is invalid
+    """
+    return re.compile(pattern, flags)
+
+@functools.lru_cache(maxsize=256)
+def _whole_match_pattern(pattern: str) -> Optional[str]:
+    """
+    Wrap a pattern in a capturing group spanning the entire match.
+    
+    Lets Series.str.extract, which returns capture groups, return the whole
+    match instead.
+    
+    Args:
+        pattern: Valid regular expression
+        
+    Returns:
+        The wrapped pattern, or None if the pattern uses numeric
+        backreferences and cannot be wrapped safely
+    """
+    if _NUMERIC_BACKREF.search(pattern):
+        return None
+    flags = _LEADING_FLAGS.match(pattern)
+    prefix = flags.group(0) if flags else ''
+    return f"{prefix}({pattern[len(prefix):]})"
 
 @register_transformer
 class TextCaseTransformer(DataTransformer):
@@ -16,41 +86,35 @@ class TextCaseTransformer(DataTransformer):
     Transformer to change the case of text data in a column.
     """
     
-    @property
-    def name(self) -> str:
-        return "Text Case Transformer"
-        
-    @property
-    def description(self) -> str:
-        return "Change the case of text data in a column (uppercase, lowercase, title case)"
-        
-    def get_parameters(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                'name': 'column',
-                'type': 'select',
-                'label': 'Column',
-                'required': True,
-                'dynamic_options': True  # This will be populated with column names
-            },
-            {
-                'name': 'case_type',
-                'type': 'select',
-                'label': 'Case Type',
-                'required': True,
-                'default': 'lower',
-                'options': [
-                    {'value': 'lower', 'label': 'Lowercase'},
-                    {'value': 'upper', 'label': 'Uppercase'},
-                    {'value': 'title', 'label': 'Title Case'},
-                    {'value': 'sentence', 'label': 'Sentence case'}
-                ]
-            }
-        ]
+    name = "Text Case Transformer"
+    description = "Change the case of text data in a column (uppercase, lowercase, title case)"
+        
+    PARAMETERS = [
+        {
+            'name': 'column',
+            'type': 'select',
+            'label': 'Column',
+            'required': True,
+            'dynamic_options': True  # This will be populated with column names
+        },
+        {
+            'name': 'case_type',
+            'type': 'select',
+            'label': 'Case Type',
+            'required': True,
+            'default': 'lower',
+            'options': [
+                {'value': 'lower', 'label': 'Lowercase'},
+                {'value': 'upper', 'label': 'Uppercase'},
+                {'value': 'title', 'label': 'Title Case'},
+                {'value': 'sentence', 'label': 'Sentence case'}
+            ]
+        }
+    ]
         
     def transform(self, df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
         """Change the case of text in a column."""
-        result = df.copy()
+        result = df.copy(deep=False)
         
         column = params.get('column')
         case_type = params.get('case_type', 'lower')
@@ -58,22 +122,43 @@ class TextCaseTransformer(DataTransformer):
         if column not in result.columns:
             raise ValueError(f"Column '{column}' not found in dataframe")
             
-        # Convert to string type if needed
-        result[column] = result[column].astype(str)
+        values = result[column]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Change the case of each category once, then expand by code
+            categories = pd.Series(values.cat.categories.astype(_TEXT_DTYPE))
+            cased = self._change_case(categories, case_type)
+            result[column] = pd.Series(
+                cased.array.take(values.cat.codes.to_numpy(), allow_fill=True),
+                index=values.index
+            )
+        else:
+            # Convert to string type if needed
+            result[column] = self._change_case(_as_text(values), case_type)
+            
+        return result
+        
+    @staticmethod
+    def _change_case(values: pd.Series, case_type: str) -> pd.Series:
+        """
+        Change the case of text values.
         
+        Args:
+            values: Text values
+            case_type: 'lower', 'upper', 'title' or 'sentence'
+            
+        Returns:
+            The converted values (unchanged for an unknown case type)
+        """
         if case_type == 'lower':
-            result[column] = result[column].str.lower()
+            return values.str.lower()
         elif case_type == 'upper':
-            result[column] = result[column].str.upper()
+            return values.str.upper()
         elif case_type == 'title':
-            result[column] = result[column].str.title()
+            return values.str.title()
         elif case_type == 'sentence':
-            # First lowercase everything
-            result[column] = result[column].str.lower()
-            # Then capitalize the first letter
-            result[column] = result[column].str.capitalize()
-            
-        return result
+            # Capitalize the first letter; capitalize also lowercases the rest
+            return values.str.capitalize()
+        return values
 
 
 @register_transformer
@@ -82,48 +167,42 @@ class TextPatternExtractor(DataTransformer):
     Transformer to extract text patterns using regular expressions.
     """
     
-    @property
-    def name(self) -> str:
-        return "Text Pattern Extractor"
-        
-    @property
-    def description(self) -> str:
-        return "Extract text that matches a pattern and save to a new column"
-        
-    def get_parameters(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                'name': 'source_column',
-                'type': 'select',
-                'label': 'Source Column',
-                'required': True,
-                'dynamic_options': True
-            },
-            {
-                'name': 'target_column',
-                'type': 'string',
-                'label': 'Target Column Name',
-                'required': True
-            },
-            {
-                'name': 'pattern',
-                'type': 'string',
-                'label': 'Regular Expression Pattern',
-                'required': True,
-                'default': '(\\d+)'
-            },
-            {
-                'name': 'replace_na',
-                'type': 'string',
-                'label': 'Replacement for Non-Matches',
-                'required': False,
-                'default': ''
-            }
-        ]
+    name = "Text Pattern Extractor"
+    description = "Extract text that matches a pattern and save to a new column"
+        
+    PARAMETERS = [
+        {
+            'name': 'source_column',
+            'type': 'select',
+            'label': 'Source Column',
+            'required': True,
+            'dynamic_options': True
+        },
+        {
+            'name': 'target_column',
+            'type': 'string',
+            'label': 'Target Column Name',
+            'required': True
+        },
+        {
+            'name': 'pattern',
+            'type': 'string',
+            'label': 'Regular Expression Pattern',
+            'required': True,
+            'default': '(\\d+)'
+        },
+        {
+            'name': 'replace_na',
+            'type': 'string',
+            'label': 'Replacement for Non-Matches',
+            'required': False,
+            'default': ''
+        }
+    ]
         
     def transform(self, df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
         """Extract patterns from text using regex."""
-        result = df.copy()
+        result = df.copy(deep=False)
         
         source_column = params.get('source_column')
         target_column = params.get('target_column')
@@ -137,21 +216,34 @@ class TextPatternExtractor(DataTransformer):
             raise ValueError("Regular expression pattern cannot be empty")
             
         # Convert to string type if needed
-        result[source_column] = result[source_column].astype(str)
+        result[source_column] = _as_text(result[source_column])
         
         try:
-            # Extract the pattern
-            compiled_pattern = re.compile(pattern)
+            # Validate the pattern
+            compiled_pattern = _compiled(pattern)
+            whole_match = _whole_match_pattern(pattern)
             
-            # Define extraction function
-            def extract_pattern(text):
-                match = compiled_pattern.search(text)
-                if match:
-                    return match.group(0)  # Return the entire match
-                return replace_na
+            source = result[source_column]
+            if is_literal_pattern(pattern):
+                # A plain-text pattern can only match itself, so a substring
+                # search is all that is needed
+                found = source.str.contains(pattern, regex=False, na=False)
+                extracted = pd.Series(pattern, index=source.index, dtype=source.dtype).where(found)
+            elif whole_match is not None:
+                # Extract the entire match in one vectorized pass; the
+                # outer group comes first when the pattern has its own
+                extracted = source.str.extract(whole_match, expand=False)
+                if isinstance(extracted, pd.DataFrame):
+                    extracted = extracted.iloc[:, 0]
+            else:
+                # Search row by row when the pattern cannot be wrapped
+                extracted = source.map(
+                    lambda text: match.group(0) if (match := compiled_pattern.search(text)) else None,
+                    na_action='ignore'
+                )
                 
-            # Apply the function
-            result[target_column] = result[source_column].apply(extract_pattern)
+            # Fill non-matches
+            result[target_column] = extracted.fillna(replace_na)
             
         except re.error as e:
             raise ValueError(f"Invalid regular expression: {str(e)}")
@@ -165,48 +257,43 @@ class TextReplaceTransformer(DataTransformer):
     Transformer to replace text patterns in a column.
     """
     
-    @property
-    def name(self) -> str:
-        return "Text Replace Transformer"
-        
-    @property
-    def description(self) -> str:
-        return "Replace text patterns in a column using regular expressions"
-        
-    def get_parameters(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                'name': 'column',
-                'type': 'select',
-                'label': 'Column',
-                'required': True,
-                'dynamic_options': True
-            },
-            {
-                'name': 'pattern',
-                'type': 'string',
-                'label': 'Search Pattern (regular expression)',
-                'required': True
-            },
-            {
-                'name': 'replacement',
-                'type': 'string',
-                'label': 'Replacement Text',
-                'required': True,
-                'default': ''
-            },
-            {
-                'name': 'case_sensitive',
-                'type': 'boolean',
-                'label': 'Case Sensitive',
-                'required': False,
-                'default': True
-            }
-        ]
+    name = "Text Replace Transformer"
+    description = "Replace text patterns in a column using regular expressions"
+        
+    PARAMETERS = [
+        {
+            'name': 'column',
+            'type': 'select',
+            'label': 'Column',
+            'required': True,
+            'dynamic_options': True
+        },
+        {
+            'name': 'pattern',
+            'type': 'string',
+            'label': 'Search Pattern (regular expression)',
+            'required': True,
+            'help': "Plain text without special characters is replaced as-is"
+        },
+        {
+            'name': 'replacement',
+            'type': 'string',
+            'label': 'Replacement Text',
+            'required': True,
+            'default': ''
+        },
+        {
+            'name': 'case_sensitive',
+            'type': 'boolean',
+            'label': 'Case Sensitive',
+            'required': False,
+            'default': True
+        }
+    ]
         
     def transform(self, df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
         """Replace text patterns in a column."""
-        result = df.copy()
+        result = df.copy(deep=False)
         
         column = params.get('column')
         pattern = params.get('pattern')
@@ -220,16 +307,20 @@ class TextReplaceTransformer(DataTransformer):
             raise ValueError("Search pattern cannot be empty")
             
         # Convert to string type if needed
-        result[column] = result[column].astype(str)
+        result[column] = _as_text(result[column])
         
         try:
-            # Create flags for regular expression
-            flags = 0 if case_sensitive else re.IGNORECASE
-            
-            # Replace the pattern
-            result[column] = result[column].str.replace(
-                pattern, replacement, regex=True, flags=flags
-            )
+            if case_sensitive and is_literal_pattern(pattern) and '\\' not in replacement:
+                # Plain substring replacement, without the regex engine
+                result[column] = result[column].str.replace(pattern, replacement, regex=False)
+            else:
+                # Create flags for regular expression
+                flags = 0 if case_sensitive else re.IGNORECASE
+                
+                # Replace the pattern
+                result[column] = result[column].str.replace(
+                    _compiled(pattern, flags), replacement, regex=True
+                )
             
         except re.error as e:
             raise ValueError(f"Invalid regular expression: {str(e)}")
@@ -8,11 +8,41 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Any, Union
 import re
+import math
 from difflib import SequenceMatcher
+import functools
 import logging
 
+try:
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process
+except ImportError:
+    _rf_process = None
+
+try:
+    import numexpr as _ne
+except ImportError:
+    _ne = None
+
 logger = logging.getLogger(__name__)
 
+# Character that is special in a regular expression or its replacement
+_REGEX_SPECIAL = re.compile(r'[\\^$.|?*+()\[\]{}]')
+
+def is_literal_pattern(pattern: str) -> bool:
+    """
+    Check whether a regular expression matches only its own text.
+    
+    Such patterns can be searched for as plain substrings, without the
+    regex engine.
+    
+    Args:
+        pattern: Regular expression
+        
+    Returns:
+        True if the pattern has no special characters
+    """
+    return not _REGEX_SPECIAL.search(pattern)
+
 def clean_dataframe(df: pd.DataFrame, options: Dict[str, Any] = None) -> pd.DataFrame:
     """
     Clean a DataFrame with various options.
@@ -31,8 +61,8 @@ def clean_dataframe(df: pd.DataFrame, options: Dict[str, Any] = None) -> pd.Data
     if options is None:
         options = {}
         
-    # Make a copy to avoid modifying the original
-    result = df.copy()
+    # Shallow copy; with copy-on-write, changes never reach the original
+    result = df.copy(deep=False)
     
     # Handle column names case
     if options.get('ignore_case', True):
@@ -42,26 +72,51 @@ def clean_dataframe(df: pd.DataFrame, options: Dict[str, Any] = None) -> pd.Data
     if options.get('fill_method') and options.get('fill_method') != "None (keep NaN)":
         if options['fill_method'] == "Zero":
             result = result.fillna(0)
-        elif options['fill_method'] == "Mean":
-            for col in result.select_dtypes(include=[np.number]).columns:
-                result[col] = result[col].fillna(result[col].mean())
-        elif options['fill_method'] == "Median":
-            for col in result.select_dtypes(include=[np.number]).columns:
-                result[col] = result[col].fillna(result[col].median())
+        elif options['fill_method'] in ("Mean", "Median"):
+            # One fillna call; the statistic is only computed for the
+            # numeric columns that actually have missing values
+            numeric = result.select_dtypes(include=[np.number])
+            numeric = numeric.loc[:, numeric.isna().any()]
+            fill_values = numeric.mean() if options['fill_method'] == "Mean" else numeric.median()
+            result = result.fillna(fill_values)
         elif options['fill_method'] == "Mode":
-            for col in result.columns:
-                mode_val = result[col].mode()
-                result[col] = result[col].fillna(mode_val[0] if not mode_val.empty else np.nan)
+            # Most frequent value of every column that has missing values;
+            # ties go to the smallest value, as with DataFrame.mode
+            modes = {}
+            for col in result.columns[result.isna().any().to_numpy()]:
+                # Categoricals also count categories that never occur
+                counts = result[col].value_counts()
+                counts = counts[counts > 0]
+                if counts.empty:
+                    continue
+                tied = counts.index[counts.to_numpy() == counts.iloc[0]]
+                try:
+                    modes[col] = tied.min() if len(tied) > 1 else tied[0]
+                except TypeError:
+                    mode = result[col].mode()
+                    if mode.empty:
+                        continue
+                    modes[col] = mode.iloc[0]
+            if modes:
+                result = result.fillna(modes)
         elif options['fill_method'] == "Forward fill":
-            result = result.fillna(method='ffill')
+            result = result.ffill()
         elif options['fill_method'] == "Backward fill":
-            result = result.fillna(method='bfill')
+            result = result.bfill()
         elif options['fill_method'] == "Custom value" and 'fill_value' in options:
+            # Use a number if the value parses as a finite one ("-1", "1e5",
+            # ...); "nan" and "inf" are kept as text
+            try:
+                fill_val = float(options['fill_value'])
+            except (TypeError, ValueError):
+                fill_val = options['fill_value']
+            else:
+                if not math.isfinite(fill_val):
+                    fill_val = options['fill_value']
             try:
-                # Try to convert to numeric if possible
-                fill_val = float(options['fill_value']) if options['fill_value'].replace('.', '', 1).isdigit() else options['fill_value']
                 result = result.fillna(fill_val)
-            except:
+            except (TypeError, ValueError):
+                # Some columns (e.g. categoricals) only accept the text form
                 result = result.fillna(options['fill_value'])
                 
     # Handle duplicates
@@ -103,11 +158,13 @@ def detect_duplicates(df: pd.DataFrame, subset: Optional[List[str]] = None) -> D
             
         duplicated = df.duplicated(subset=valid_cols, keep='first')
         
-    duplicate_indices = duplicated[duplicated].index.tolist()
-    duplicate_rows = df.loc[duplicate_indices]
+    # Gather the rows by position rather than by looking their labels up
+    positions = np.flatnonzero(duplicated.to_numpy())
+    duplicate_rows = df.take(positions)
+    duplicate_indices = duplicate_rows.index.tolist()
     
     return {
-        'duplicate_count': len(duplicate_indices),
+        'duplicate_count': positions.size,
         'duplicate_rows': duplicate_rows,
         'duplicate_indices': duplicate_indices
     }
@@ -129,37 +186,76 @@ def suggest_column_mapping(
         If source is a string: List of suggested column names
         If source is a list: Dictionary mapping source columns to target columns
     """
+    if not isinstance(source, (str, list)):
+        return []
+        
+    sources = [source] if isinstance(source, str) else source
+    targets = list(target_columns)
+    # Lowercase each name once; the scores are cached by these names, since
+    # the same files are compared again on every rerun
+    scores = _similarity_matrix(
+        tuple(str(col).lower() for col in sources),
+        tuple(str(col).lower() for col in targets),
+        score_cutoff=threshold
+    )
+    
     # Handle single column case
     if isinstance(source, str):
-        matches = []
-        for target in target_columns:
-            similarity = SequenceMatcher(None, source.lower(), target.lower()).ratio()
-            if similarity >= threshold:
-                matches.append(target)
-                
-        return sorted(matches, key=lambda x: SequenceMatcher(None, source.lower(), x.lower()).ratio(), reverse=True)
+        row = scores[0]
+        order = np.argsort(-row, kind='stable')
+        return [targets[j] for j in order if row[j] >= threshold]
         
     # Handle multiple columns case
-    elif isinstance(source, list):
-        mapping = {}
-        
-        for src_col in source:
-            best_match = None
-            best_score = 0
-            
-            for tgt_col in target_columns:
-                similarity = SequenceMatcher(None, src_col.lower(), tgt_col.lower()).ratio()
-                if similarity > best_score and similarity >= threshold:
-                    best_score = similarity
-                    best_match = tgt_col
-                    
+    mapping = {}
+    if targets:
+        best = scores.argmax(axis=1)
+        for i, src_col in enumerate(sources):
             # Only add to mapping if a good match was found
-            if best_match:
-                mapping[src_col] = best_match
+            if scores[i, best[i]] >= threshold:
+                mapping[src_col] = targets[best[i]]
                 
-        return mapping
+    return mapping
+
+@functools.lru_cache(maxsize=128)
+def _similarity_matrix(sources: Tuple[str, ...], targets: Tuple[str, ...], score_cutoff: float = 0.0) -> np.ndarray:
+    """
+    Compute pairwise similarity ratios between two lists of strings.
+    
+    The scores are difflib's SequenceMatcher ratios. When rapidfuzz is
+    installed, its batched C++ Indel ratio (fuzz.ratio) is used to skip the
+    pairs that cannot reach ``score_cutoff`` first. The Indel ratio never
+    falls below SequenceMatcher's, because the matching blocks difflib finds
+    form a common subsequence, so both backends give the same scores.
+    
+    Args:
+        sources: Strings for the matrix rows
+        targets: Strings for the matrix columns
+        score_cutoff: Scores below this are of no interest; pairs that
+            cannot reach it may be reported as 0
+        
+    Returns:
+        Read-only array of shape (len(sources), len(targets)) with scores
+        in [0, 1]; it is shared between calls with the same arguments
+    """
+    if _rf_process is not None:
+        # The small margin keeps pairs whose two ratios differ by rounding
+        candidates = _rf_process.cdist(
+            sources,
+            targets,
+            scorer=_rf_fuzz.ratio,
+            score_cutoff=max(score_cutoff * 100 - 1e-6, 0),
+            workers=-1
+        )
+        pairs = zip(*np.nonzero(candidates))
+    else:
+        pairs = np.ndindex(len(sources), len(targets))
         
-    return {} if isinstance(source, list) else []
+    scores = np.zeros((len(sources), len(targets)))
+    for i, j in pairs:
+        scores[i, j] = SequenceMatcher(None, sources[i], targets[j]).ratio()
+        
+    scores.flags.writeable = False
+    return scores
 
 def create_calculated_column(df: pd.DataFrame, column_name: str, expression: str) -> pd.DataFrame:
     """
@@ -173,23 +269,56 @@ def create_calculated_column(df: pd.DataFrame, column_name: str, expression: str
     Returns:
         DataFrame with the new column added
     """
-    result = df.copy()
+    result = df.copy(deep=False)
     
     try:
-        # Create a safe local namespace with only the necessary variables
-        local_dict = {col: result[col] for col in result.columns if col in expression}
-        
-        # Add numpy for common math functions
-        local_dict['np'] = np
-        
-        # Evaluate the expression
-        result[column_name] = eval(expression, {"__builtins__": {}}, local_dict)
+        result[column_name] = _evaluate_expression(result, expression)
         
         return result
     except Exception as e:
         logger.error(f"Error creating calculated column: {str(e)}", exc_info=True)
         raise ValueError(f"Error creating calculated column: {str(e)}")
 
+# Operators that numexpr evaluates differently from Python: integer % and //
+# by zero give 0 instead of NaN/inf, and not/and/or become bitwise operations
+# instead of raising on Series
+_PYTHON_ONLY_OPERATORS = re.compile(r'%|//|\b(?:not|and|or)\b')
+
+def _evaluate_expression(df: pd.DataFrame, expression: str) -> Any:
+    """
+    Evaluate a column expression against a DataFrame.
+    
+    numexpr is used when it is installed and gives the same result as
+    Python; see _PYTHON_ONLY_OPERATORS.
+    
+    Args:
+        df: DataFrame whose columns the expression refers to
+        expression: Python expression using column names as variables
+        
+    Returns:
+        The values of the expression (usually a Series)
+    """
+    if _ne is not None and not _PYTHON_ONLY_OPERATORS.search(expression):
+        try:
+            # Plain arithmetic and comparisons are evaluated by numexpr in
+            # one multithreaded pass, without per-operator temporaries
+            values = df.eval(expression, engine='numexpr')
+            # Assignments are not column expressions
+            if not isinstance(values, pd.DataFrame):
+                return values
+        except Exception:
+            # Not supported by pandas.eval (e.g. np.* calls); use Python
+            pass
+            
+    # Create a safe local namespace with only the necessary variables
+    local_dict = {col: df[col] for col in df.columns if col in expression}
+    
+    # Add numpy for common math functions
+    local_dict['np'] = np
+    
+    # Evaluate the expression
+    return eval(expression, {"__builtins__": {}}, local_dict)
+
 def apply_data_transformations(df: pd.DataFrame, transformations: List[Dict[str, Any]]) -> pd.DataFrame:
     """
     Apply a series of transformations to a DataFrame.
@@ -199,22 +328,40 @@ def apply_data_transformations(df: pd.DataFrame, transformations: List[Dict[str,
         transformations: List of transformation dictionaries, each containing:
             - type: Transformation type
             - params: Parameters for the transformation
+                (for replace_values, either 'find' and 'replace' or a
+                'mapping' dict of replacements applied in one pass)
             
     Returns:
         Transformed DataFrame
     """
-    result = df.copy()
+    result = df.copy(deep=False)
+    
+    # Row masks of consecutive filter_rows steps, applied together in one
+    # indexing pass before the next other step, and the numeric columns
+    # they compare against (kept in step with the rows of result)
+    filter_masks = []
+    numeric_columns = {}
     
     for transform in transformations:
         transform_type = transform.get('type')
         params = transform.get('params', {})
         
+        if transform_type != 'filter_rows':
+            if filter_masks:
+                keep = np.logical_and.reduce(filter_masks)
+                result = result[keep]
+                numeric_columns = {col: values[keep] for col, values in numeric_columns.items()}
+                filter_masks = []
+            if transform_type != 'drop_columns':
+                # Any other step may change column values or names
+                numeric_columns = {}
+                
         try:
             if transform_type == 'create_calculated_column':
-                result = create_calculated_column(
-                    result,
-                    params.get('column_name', 'calculated_column'),
-                    params.get('expression', '0')
+                # result is already this function's own frame, so the column
+                # is assigned directly instead of through another copy
+                result[params.get('column_name', 'calculated_column')] = _evaluate_expression(
+                    result, params.get('expression', '0')
                 )
                 
             elif transform_type == 'convert_column_type':
@@ -233,11 +380,16 @@ def apply_data_transformations(df: pd.DataFrame, transformations: List[Dict[str,
                         
             elif transform_type == 'replace_values':
                 col_name = params.get('column')
+                mapping = params.get('mapping')
                 find_val = params.get('find')
                 replace_val = params.get('replace')
                 
-                if col_name and col_name in result.columns and find_val is not None:
-                    result[col_name] = result[col_name].replace(find_val, replace_val)
+                if col_name and col_name in result.columns:
+                    if isinstance(mapping, dict) and mapping:
+                        # Several replacements in a single pass over the column
+                        result[col_name] = result[col_name].replace(mapping)
+                    elif find_val is not None:
+                        result[col_name] = result[col_name].replace(find_val, replace_val)
                     
             elif transform_type == 'filter_rows':
                 col_name = params.get('column')
@@ -245,23 +397,41 @@ def apply_data_transformations(df: pd.DataFrame, transformations: List[Dict[str,
                 filter_val = params.get('value')
                 
                 if col_name and col_name in result.columns and filter_type and filter_val is not None:
+                    mask = None
                     if filter_type == 'equals':
-                        result = result[result[col_name] == filter_val]
+                        mask = result[col_name] == filter_val
                     elif filter_type == 'not_equals':
-                        result = result[result[col_name] != filter_val]
+                        mask = result[col_name] != filter_val
                     elif filter_type == 'contains':
-                        result = result[result[col_name].astype(str).str.contains(str(filter_val), na=False)]
-                    elif filter_type == 'greater_than':
-                        try:
-                            result = result[pd.to_numeric(result[col_name], errors='coerce') > float(filter_val)]
-                        except:
-                            pass
-                    elif filter_type == 'less_than':
+                        column = result[col_name]
+                        if not isinstance(column.dtype, pd.StringDtype):
+                            column = column.astype(str)
+                        filter_text = str(filter_val)
+                        # Plain text is searched for as a substring; anything
+                        # else keeps its regular-expression meaning
+                        mask = column.str.contains(
+                            filter_text, regex=not is_literal_pattern(filter_text), na=False
+                        )
+                    elif filter_type in ('greater_than', 'less_than'):
                         try:
-                            result = result[pd.to_numeric(result[col_name], errors='coerce') < float(filter_val)]
-                        except:
+                            if col_name not in numeric_columns:
+                                numeric_columns[col_name] = pd.to_numeric(
+                                    result[col_name], errors='coerce'
+                                ).to_numpy(dtype=float, na_value=np.nan)
+                            values = numeric_columns[col_name]
+                            if filter_type == 'greater_than':
+                                mask = values > float(filter_val)
+                            else:
+                                mask = values < float(filter_val)
+                        except (TypeError, ValueError):
                             pass
                             
+                    if isinstance(mask, pd.Series):
+                        # Missing comparison results exclude the row
+                        mask = mask.to_numpy(dtype=bool, na_value=False)
+                    if mask is not None:
+                        filter_masks.append(mask)
+                            
             elif transform_type == 'rename_columns':
                 rename_dict = params.get('mapping', {})
                 if rename_dict:
@@ -276,4 +446,7 @@ def apply_data_transformations(df: pd.DataFrame, transformations: List[Dict[str,
             logger.error(f"Error applying transformation {transform_type}: {str(e)}", exc_info=True)
             # Continue with the next transformation rather than failing
             
+    if filter_masks:
+        result = result[np.logical_and.reduce(filter_masks)]
+        
     return result
\ No newline at end of file
@@ -5,16 +5,48 @@ Utility functions for handling file operations.
 """
 
 import pandas as pd
+import numpy as np
 import json
+import csv
+import codecs
 import io
 import base64
 import chardet
 from typing import Dict, List, Optional, Union, Tuple
 import logging
 from pathlib import Path
+from importlib.util import find_spec
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Whether the Rust-based calamine Excel engine is available to pandas
+_HAS_CALAMINE = find_spec('python_calamine') is not None
 
 logger = logging.getLogger(__name__)
 
+# Number of bytes read once from the start of a file and shared by the
+# encoding and delimiter detection
+_PEEK_SIZE = 64 * 1024
+
+# Number of bytes passed to the encoding detector at a time
+_ENCODING_CHUNK_SIZE = 2048
+
+# Byte order marks and the codecs that strip them; UTF-32 comes first
+# because its little-endian mark starts with the UTF-16 one
+_BYTE_ORDER_MARKS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# Delimiters tried when sniffing a CSV file
+_CANDIDATE_DELIMITERS = (',', ';', '\t', '|')
+
 def get_file_info(uploaded_file) -> Dict:
     """
     Get information about an uploaded file.
@@ -32,10 +64,51 @@ def get_file_info(uploaded_file) -> Dict:
         "extension": Path(uploaded_file.name).suffix.lower().lstrip('.')
     }
 
+def _peek(uploaded_file, size: int = _PEEK_SIZE) -> bytes:
+    """
+    Get the first bytes of a file without moving its position.
+    
+    The bytes are cached on the file object, so encoding detection and
+    delimiter sniffing share a single read of the file header.
+    
+    Args:
+        uploaded_file: Streamlit UploadedFile object
+        size: Minimum number of bytes wanted (fewer if the file is shorter)
+        
+    Returns:
+        The first ``max(size, _PEEK_SIZE)`` bytes of the file
+    """
+    cached = getattr(uploaded_file, '_peek_cache', None)
+    if cached is not None:
+        read_size, head = cached
+        # A short read means the whole file is already cached
+        if size <= read_size or len(head) < read_size:
+            return head
+            
+    read_size = max(size, _PEEK_SIZE)
+    pos = uploaded_file.tell()
+    try:
+        uploaded_file.seek(0)
+        head = uploaded_file.read(read_size)
+    finally:
+        uploaded_file.seek(pos)
+        
+    try:
+        uploaded_file._peek_cache = (read_size, head)
+    except AttributeError:
+        # Objects without a __dict__ are simply read again next time
+        pass
+    return head
+
 def detect_encoding(uploaded_file, sample_size: int = 10000) -> str:
     """
     Detect the encoding of a file.
     
+    Only the first ``sample_size`` bytes are looked at, so the cost is
+    independent of the file size. A Unicode byte order mark or a pure ASCII
+    sample is recognized without running the detector; otherwise the sample
+    is fed to it in chunks until it is confident.
+    
     Args:
         uploaded_file: Streamlit UploadedFile object
         sample_size: Number of bytes to sample for detection
@@ -44,17 +117,25 @@ def detect_encoding(uploaded_file, sample_size: int = 10000) -> str:
         Detected encoding as string (defaults to utf-8 if detection fails)
     """
     try:
-        # Save current position
-        pos = uploaded_file.tell()
-        
-        # Read a sample of the file
-        sample = uploaded_file.read(sample_size)
-        
-        # Reset position
-        uploaded_file.seek(pos)
-        
-        # Detect encoding
-        result = chardet.detect(sample)
+        sample = memoryview(_peek(uploaded_file, sample_size))[:sample_size]
+        for bom, bom_encoding in _BYTE_ORDER_MARKS:
+            if sample[:len(bom)] == bom:
+                return bom_encoding
+            
+        detector = chardet.UniversalDetector()
+        is_ascii = True
+        for start in range(0, len(sample), _ENCODING_CHUNK_SIZE):
+            chunk = sample[start:start + _ENCODING_CHUNK_SIZE].tobytes()
+            # Escape sequences mark 7-bit encodings such as ISO-2022
+            is_ascii = is_ascii and chunk.isascii() and b'\x1b' not in chunk and b'~{' not in chunk
+            detector.feed(chunk)
+            if detector.done:
+                break
+                
+        if is_ascii and len(sample):
+            return 'ascii'
+            
+        result = detector.close()
         encoding = result['encoding']
         
         # If confidence is low or encoding is None, use utf-8
@@ -66,6 +147,290 @@ def detect_encoding(uploaded_file, sample_size: int = 10000) -> str:
         logger.warning(f"Error detecting encoding: {str(e)}. Using utf-8 as fallback.")
         return 'utf-8'
 
+def _detect_delimiter(sample: bytes, encoding: Optional[str] = None) -> Optional[str]:
+    """
+    Guess the delimiter of a CSV sample.
+    
+    Uses csv.Sniffer, which looks for a candidate that occurs equally often
+    on every line (and respects quoting), rather than the most frequent one
+    overall; a single-column file with ``|`` or ``,`` inside its values is
+    therefore not split.
+    
+    Args:
+        sample: Raw bytes from the start of the file
+        encoding: File encoding (defaults to utf-8)
+        
+    Returns:
+        The detected delimiter, or None if no candidate is consistent
+    """
+    text = sample.decode(encoding or 'utf-8', errors='ignore')
+    
+    # The sample usually ends partway through a line
+    last_newline = text.rfind('\n')
+    if last_newline > 0:
+        text = text[:last_newline + 1]
+        
+    try:
+        return csv.Sniffer().sniff(text, delimiters=''.join(_CANDIDATE_DELIMITERS)).delimiter
+    except csv.Error:
+        return None
+
+# Strings pd.read_csv treats as missing by default
+_PANDAS_NULL_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a',
+    'nan', 'null'
+]
+
+def read_csv_polars(uploaded_file, encoding: Optional[str] = None) -> Optional[pd.DataFrame]:
+    """
+    Read a CSV file with Polars' multi-threaded reader.
+    
+    Used for large inputs where Polars is considerably faster than the pandas
+    parser. Returns None when Polars is not installed, the encoding is not
+    UTF-8 compatible, the header has duplicate or empty names, or Polars
+    cannot parse the file, so callers can fall back to read_file().
+    
+    Args:
+        uploaded_file: Streamlit UploadedFile object
+        encoding: Detected file encoding
+        
+    Returns:
+        DataFrame if read with Polars, None otherwise
+    """
+    try:
+        import polars as pl
+    except ImportError:
+        return None
+        
+    encoding = (encoding or 'utf-8').lower().replace('-', '').replace('_', '')
+    if encoding not in ('utf8', 'ascii'):
+        return None
+        
+    sample = _peek(uploaded_file)[:4096]
+    separator = _detect_delimiter(sample) or ','
+    
+    # Polars renames duplicate headers to name_duplicated_0 and keeps empty
+    # ones, where pandas uses name.1 and Unnamed: N; leave those to pandas
+    first_line = sample.decode('utf-8', errors='replace').partition('\n')[0].rstrip('\r')
+    header = next(csv.reader([first_line], delimiter=separator), [])
+    if len(set(header)) != len(header) or '' in header:
+        return None
+        
+    data = uploaded_file.read()
+    uploaded_file.seek(0)
+    
+    try:
+        df = pl.read_csv(
+            data,
+            separator=separator,
+            infer_schema_length=10000,
+            # Recognize the same missing-value markers as pandas
+            null_values=_PANDAS_NULL_VALUES
+        )
+        return df.to_pandas()
+    except (pl.exceptions.PolarsError, ValueError) as e:
+        # Ragged rows, invalid UTF-8 and integers beyond int64 (ArrowInvalid)
+        logger.warning(f"Polars could not parse CSV, falling back to pandas: {str(e)}")
+        return None
+
+def read_csv_arrow(uploaded_file, sep: str = ',', encoding: Optional[str] = None) -> Optional[pd.DataFrame]:
+    """
+    Read a CSV file with PyArrow's multi-threaded C++ reader.
+    
+    The file contents are parsed in place and the resulting Arrow table is
+    converted to pandas block by block, releasing the Arrow buffers as soon as
+    they have been copied. Returns None
+    when PyArrow is not installed or cannot parse the file, so callers can
+    fall back to pandas' own parser.
+    
+    Args:
+        uploaded_file: Streamlit UploadedFile object
+        sep: Field delimiter
+        encoding: File encoding (defaults to utf-8)
+        
+    Returns:
+        DataFrame if read with PyArrow, None otherwise
+    """
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        return None
+        
+    # In-memory uploads expose their buffer directly, which avoids holding a
+    # second copy of the file while it is parsed
+    if hasattr(uploaded_file, 'getbuffer'):
+        data = uploaded_file.getbuffer()
+    else:
+        data = uploaded_file.read()
+        uploaded_file.seek(0)
+    
+    try:
+        table = pa_csv.read_csv(
+            pa.py_buffer(data),
+            read_options=pa_csv.ReadOptions(block_size=8 << 20, encoding=encoding or 'utf8'),
+            parse_options=pa_csv.ParseOptions(delimiter=sep),
+            # Treat empty strings as missing, like pandas does
+            convert_options=pa_csv.ConvertOptions(strings_can_be_null=True)
+        )
+    except (pa.ArrowInvalid, LookupError) as e:
+        logger.warning(f"PyArrow could not parse CSV, falling back to pandas: {str(e)}")
+        return None
+        
+    reason = _arrow_csv_mismatch(table)
+    if reason:
+        logger.info(f"Reading CSV with pandas instead of PyArrow: {reason}")
+        return None
+        
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+def _arrow_csv_mismatch(table) -> Optional[str]:
+    """
+    Check whether an Arrow-parsed CSV differs from what pd.read_csv loads.
+    
+    Arrow keeps duplicate and empty header names as they are, returns
+    undecodable text as bytes, infers dates, times and timestamps that pandas
+    leaves as text, and reads integers beyond the int64 range as floats.
+    
+    Args:
+        table: PyArrow table read from the CSV file
+        
+    Returns:
+        Description of the first difference found, or None if there is none
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    
+    names = table.column_names
+    if len(set(names)) != len(names):
+        return "duplicate column names"
+    if '' in names:
+        return "empty column name"
+        
+    for field, column in zip(table.schema, table.columns):
+        field_type = field.type
+        if pa.types.is_binary(field_type) or pa.types.is_large_binary(field_type):
+            return f"column '{field.name}' is not valid text"
+        if pa.types.is_temporal(field_type):
+            return f"column '{field.name}' has dates or times"
+        if pa.types.is_floating(field_type):
+            largest = pc.max(pc.abs(column)).as_py()
+            if largest is not None and largest >= 2 ** 63:
+                return f"column '{field.name}' may hold integers beyond int64"
+    return None
+
+def _records_to_dataframe(records: List) -> pd.DataFrame:
+    """
+    Convert a list of JSON records to a DataFrame.
+    
+    Records without nested objects are converted directly; json_normalize,
+    which walks every record in Python, is only used to flatten nested ones.
+    
+    Args:
+        records: Parsed JSON array
+        
+    Returns:
+        DataFrame with one row per record
+    """
+    is_flat = bool(records) and all(
+        type(record) is dict and record and not any(isinstance(v, dict) for v in record.values())
+        for record in records
+    )
+    if is_flat:
+        return pd.DataFrame.from_records(records)
+    return pd.json_normalize(records)
+
+def _read_csv(uploaded_file, **kwargs) -> pd.DataFrame:
+    """
+    Read a CSV file, detecting its delimiter if none is given.
+    
+    Args:
+        uploaded_file: Streamlit UploadedFile object
+        **kwargs: Additional arguments to pass to pd.read_csv
+        
+    Returns:
+        DataFrame with the file contents
+    """
+    # For CSV, try to detect delimiter if not specified
+    if 'delimiter' not in kwargs and 'sep' not in kwargs:
+        sample = _peek(uploaded_file)[:4096]
+        likely_delimiter = _detect_delimiter(sample, kwargs.get('encoding'))
+        if likely_delimiter:
+            kwargs['sep'] = likely_delimiter
+            
+    # Use the PyArrow reader unless pandas-only options were requested
+    if set(kwargs) <= {'sep', 'encoding'}:
+        df = read_csv_arrow(uploaded_file, sep=kwargs.get('sep', ','), encoding=kwargs.get('encoding'))
+        if df is not None:
+            return df
+            
+    return pd.read_csv(uploaded_file, **kwargs)
+
+def _read_excel(uploaded_file, **kwargs) -> pd.DataFrame:
+    """
+    Read the first sheet of an Excel workbook.
+    
+    Uses the Rust-based calamine engine when python-calamine is installed;
+    otherwise pandas picks its default engine (openpyxl, which pandas
+    already opens in read-only mode, or xlrd for .xls).
+    
+    Args:
+        uploaded_file: Streamlit UploadedFile object
+        **kwargs: Additional arguments to pass to pd.read_excel
+        
+    Returns:
+        DataFrame with the sheet contents
+    """
+    if 'engine' not in kwargs and _HAS_CALAMINE:
+        kwargs['engine'] = 'calamine'
+    return pd.read_excel(uploaded_file, **kwargs)
+
+def _read_json(uploaded_file, **kwargs) -> pd.DataFrame:
+    """
+    Read a JSON file of records, or of an object holding a list of records.
+    
+    Args:
+        uploaded_file: Streamlit UploadedFile object
+        **kwargs: Additional arguments to pass to pd.read_json
+        
+    Returns:
+        DataFrame with the file contents
+    """
+    # Handle different JSON structures
+    try:
+        # Try direct loading first
+        return pd.read_json(uploaded_file, **kwargs)
+    except ValueError:
+        # If direct loading fails, try manual parsing
+        uploaded_file.seek(0)
+        content = _json_loads(uploaded_file.read())
+        
+        # Determine if it's a list or dict and convert accordingly
+        if isinstance(content, list):
+            return _records_to_dataframe(content)
+        elif isinstance(content, dict):
+            # Try different approaches based on JSON structure
+            if any(isinstance(v, list) for v in content.values()):
+                # Find the first list and normalize it
+                for k, v in content.items():
+                    if isinstance(v, list):
+                        return _records_to_dataframe(v)
+            else:
+                # Convert flat dict to single-row DataFrame
+                return pd.DataFrame([content])
+        
+        # If all else fails
+        raise ValueError("Unsupported JSON structure")
+
+# Reader for each supported file extension
+_READERS = {
+    'csv': _read_csv,
+    'xlsx': _read_excel,
+    'xls': _read_excel,
+    'json': _read_json,
+}
+
 def read_file(uploaded_file, file_extension: str, **kwargs) -> Optional[pd.DataFrame]:
     """
     Read a file into a pandas DataFrame based on its extension.
@@ -78,76 +443,551 @@ def read_file(uploaded_file, file_extension: str, **kwargs) -> Optional[pd.DataF
     Returns:
         DataFrame if successfully loaded, None otherwise
     """
+    reader = _READERS.get(file_extension)
+    if reader is None:
+        logger.error(f"Unsupported file extension: {file_extension}")
+        return None
+        
     try:
-        if file_extension == 'csv':
-            # For CSV, try to detect delimiter if not specified
-            if 'delimiter' not in kwargs and 'sep' not in kwargs:
-                sample = uploaded_file.read(4096).decode(kwargs.get('encoding', 'utf-8'))
-                uploaded_file.seek(0)
-                
-                # Simple delimiter detection
-                potential_delimiters = [',', ';', '\t', '|']
-                delimiter_counts = {d: sample.count(d) for d in potential_delimiters}
-                likely_delimiter = max(delimiter_counts, key=delimiter_counts.get)
-                
-                # Only use detected delimiter if it appears reasonably often
-                if delimiter_counts[likely_delimiter] > 5:
-                    kwargs['sep'] = likely_delimiter
-                    
-            return pd.read_csv(uploaded_file, **kwargs)
+        return reader(uploaded_file, **kwargs)
+    except Exception as e:
+        logger.error(f"Error reading file: {str(e)}", exc_info=True)
+        raise
+
+# MIME type and link label for each export format
+_EXPORT_TYPES = {
+    "csv": ("file/csv", "CSV"),
+    "xlsx": ("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", "Excel"),
+    "json": ("application/json", "JSON"),
+    "parquet": ("application/vnd.apache.parquet", "Parquet"),
+    "feather": ("application/vnd.apache.arrow.file", "Feather"),
+}
+
+# Row limit of an Excel worksheet, including the header row
+_XLSX_MAX_ROWS = 1_048_576
+
+# Number of rows converted to Python values at a time when streaming XLSX
+_XLSX_BATCH_ROWS = 8192
+
+# Most decimals counted when sizing float columns of Excel exports
+_MAX_FLOAT_DECIMALS = 10
+
+# Cell format applied to the header row of Excel exports
+_XLSX_HEADER_FORMAT = {
+    'bold': True,
+    'text_wrap': True,
+    'valign': 'top',
+    'bg_color': '#D9E1F2',
+    'border': 1
+}
+
+def _text_width(column: pd.Series) -> int:
+    """
+    Get the length of the longest value of a column written as text.
+    
+    Integer and boolean columns are measured from their extremes, and string
+    columns from their lengths, without formatting every value. Datetime
+    columns are measured from the precision their values need, and float
+    columns are estimated from their magnitude and the number of decimals
+    in use (at most 10, as Excel does not show more in a cell anyway).
+    
+    Args:
+        column: Column to measure
+        
+    Returns:
+        Number of characters in the longest value
+    """
+    if column.empty:
+        return 0
+    if not column.hasnans and (
+        pd.api.types.is_integer_dtype(column.dtype) or pd.api.types.is_bool_dtype(column.dtype)
+    ):
+        return max(len(str(column.min())), len(str(column.max())))
+    if column.dtype.kind == 'f':
+        return _float_text_width(column.to_numpy())
+    if column.dtype.kind == 'M':
+        valid = column.dropna()
+        if valid.empty:
+            return len('NaT')
+        if (valid.dt.normalize() == valid).all():
+            return len('YYYY-MM-DD')
+        if (valid.dt.nanosecond != 0).any():
+            return len('YYYY-MM-DD HH:MM:SS.fffffffff')
+        if (valid.dt.microsecond % 1000 != 0).any():
+            return len('YYYY-MM-DD HH:MM:SS.ffffff')
+        if (valid.dt.microsecond != 0).any():
+            return len('YYYY-MM-DD HH:MM:SS.fff')
+        return len('YYYY-MM-DD HH:MM:SS')
+    if isinstance(column.dtype, pd.StringDtype):
+        lengths = column.str.len()
+    else:
+        lengths = column.astype(str).str.len()
+    return int(lengths.fillna(0).max())
+
+def _float_text_width(values: np.ndarray) -> int:
+    """
+    Estimate the length of the longest value of a float array written as text.
+    
+    Args:
+        values: Float array
+        
+    Returns:
+        Number of characters in the integer part, sign, point and decimals
+    """
+    finite_mask = np.isfinite(values)
+    # Missing values are written as empty cells
+    infinite = values[np.isinf(values)]
+    width = max((len(str(value)) for value in np.unique(infinite)), default=0)
+    
+    finite = values[finite_mask]
+    if finite.size:
+        lo, hi = finite.min(), finite.max()
+        int_width = len(str(int(max(abs(lo), abs(hi))))) + bool(lo < 0)
+        # Fewest decimals that reproduce the values ("1.0" still shows one)
+        decimals = next(
+            (d for d in range(1, _MAX_FLOAT_DECIMALS) if np.allclose(np.round(finite, d), finite, rtol=1e-12, atol=0)),
+            _MAX_FLOAT_DECIMALS
+        )
+        width = max(width, int_width + 1 + decimals)
+    return width
+
+def _rust_writable(dtype) -> bool:
+    """
+    Check whether rustpy-xlsxwriter writes a column dtype faithfully.
+    
+    It writes unsupported columns (timedeltas, lists, objects, ...) as empty
+    cells without raising, and stores integers as floats.
+    
+    Args:
+        dtype: Column dtype
+        
+    Returns:
+        True if the column can be written with rustpy-xlsxwriter
+    """
+    if isinstance(dtype, pd.StringDtype):
+        return True
+    if isinstance(dtype, pd.ArrowDtype) and pd.api.types.is_string_dtype(dtype):
+        return True
+    return (
+        pd.api.types.is_float_dtype(dtype)
+        or pd.api.types.is_bool_dtype(dtype)
+        or pd.api.types.is_datetime64_any_dtype(dtype)
+    )
+
+def _xlsx_bytes_rust(df: pd.DataFrame) -> Optional[bytes]:
+    """
+    Write a dataframe to XLSX with rustpy-xlsxwriter.
+    
+    The columns are read through Arrow and the workbook is generated in Rust,
+    including the autofit widths, so no per-cell Python work is done.
+    Categorical columns are written as their values. Returns None when
+    rustpy-xlsxwriter is not installed or any column has a dtype it does not
+    write faithfully (see _rust_writable), so callers can fall back to the
+    other writers.
+    
+    Args:
+        df: Pandas DataFrame to export
+        
+    Returns:
+        The workbook contents, or None if rustpy-xlsxwriter could not write it
+    """
+    try:
+        import rustpy_xlsxwriter as rxw
+    except ImportError:
+        return None
+        
+    # Write categoricals as their values; the writer leaves them empty
+    categorical = [col for col, dtype in df.dtypes.items() if isinstance(dtype, pd.CategoricalDtype)]
+    if categorical:
+        df = df.copy()
+        for col in categorical:
+            df[col] = df[col].astype(df[col].cat.categories.dtype)
+        
+    if not all(_rust_writable(dtype) for dtype in df.dtypes):
+        return None
+        
+    # Infinite values would be left empty; pandas writes them as 'inf'
+    floats = df.select_dtypes(include='floating')
+    if floats.shape[1] and np.isinf(floats.to_numpy(dtype='float64', na_value=np.nan)).any():
+        return None
+        
+    header_format = (
+        rxw.Format()
+        .set_bold()
+        .set_text_wrap()
+        .set_align('top')
+        .set_background_color(_XLSX_HEADER_FORMAT['bg_color'])
+        .set_border('thin')
+    )
+    
+    output = io.BytesIO()
+    try:
+        rxw.write_worksheet(
+            df,
+            output,
+            sheet_name='Data',
+            autofit=True,
+            header_format=header_format
+        )
+    except (TypeError, ValueError) as e:
+        logger.warning(f"Falling back to another writer for Excel export: {str(e)}")
+        return None
+        
+    return output.getvalue()
+
+def _arrow_csv_compatible(column: pd.Series) -> bool:
+    """
+    Check whether PyArrow writes a column so that pandas reads it back unchanged.
+    
+    Arrow writes whole floats without a decimal point (so they are read back
+    as integers) and formats timestamps and timezone offsets differently
+    from pandas, so float columns with whole values, datetimes and other
+    dtypes are left to pandas' writer.
+    
+    Args:
+        column: Column to check
+        
+    Returns:
+        True if the column can be written with PyArrow
+    """
+    dtype = column.dtype
+    if isinstance(dtype, pd.StringDtype) or pd.api.types.is_bool_dtype(dtype):
+        return True
+    if pd.api.types.is_integer_dtype(dtype):
+        return True
+    if pd.api.types.is_float_dtype(dtype):
+        values = column.to_numpy(dtype='float64', na_value=np.nan)
+        values = values[np.isfinite(values)]
+        return not (values == np.floor(values)).any()
+    return False
+
+def _csv_bytes_arrow(df: pd.DataFrame) -> Optional[bytes]:
+    """
+    Write a dataframe to CSV with PyArrow's C++ writer.
+    
+    Considerably faster than pandas' formatter on large exports. Text is
+    always quoted and booleans are written as ``true``/``false``, but pandas
+    reads the file back with the same values and dtypes. Returns None when
+    PyArrow is not installed, a column is not Arrow compatible (see
+    _arrow_csv_compatible) or the dataframe cannot be converted (e.g.
+    mixed-type object columns), so callers can fall back to pandas.
+    
+    Args:
+        df: Pandas DataFrame to export
+        
+    Returns:
+        The CSV contents, or None if PyArrow could not write them
+    """
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        return None
+        
+    if not all(_arrow_csv_compatible(df.iloc[:, i]) for i in range(df.shape[1])):
+        return None
+        
+    output = io.BytesIO()
+    try:
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), output)
+    except (pa.ArrowException, TypeError, ValueError) as e:
+        logger.warning(f"Falling back to pandas for CSV export: {str(e)}")
+        return None
+        
+    return output.getvalue()
+
+def _xlsx_bytes_streaming(df: pd.DataFrame) -> Optional[bytes]:
+    """
+    Write a dataframe to XLSX with xlsxwriter in constant-memory mode.
+    
+    Rows are taken from Arrow record batches and written in order, so
+    xlsxwriter flushes each one to a temporary file instead of holding the
+    whole worksheet in memory. Returns None when PyArrow is not installed or
+    a value cannot be written this way, so callers can fall back to pandas.
+    
+    Args:
+        df: Pandas DataFrame to export
+        
+    Returns:
+        The workbook contents, or None if the rows could not be streamed
+    """
+    try:
+        import pyarrow as pa
+        import xlsxwriter
+    except ImportError:
+        return None
+        
+    # Let pandas report sheets that do not fit in Excel
+    if len(df) >= _XLSX_MAX_ROWS:
+        return None
+        
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+        
+    output = io.BytesIO()
+    workbook = xlsxwriter.Workbook(output, {
+        'constant_memory': True,
+        'default_date_format': 'yyyy-mm-dd hh:mm:ss'
+    })
+    try:
+        worksheet = workbook.add_worksheet('Data')
+        
+        # Widths cannot be fitted afterwards, as rows are flushed as written
+        for i, col in enumerate(df.columns):
+            worksheet.set_column(i, i, max(_text_width(df.iloc[:, i]), len(str(col))) + 2)
+        worksheet.write_row(0, 0, df.columns.tolist(), workbook.add_format(_XLSX_HEADER_FORMAT))
+        
+        row = 1
+        for batch in table.to_batches(max_chunksize=_XLSX_BATCH_ROWS):
+            for values in zip(*(column.to_pylist() for column in batch.columns)):
+                worksheet.write_row(row, 0, values)
+                row += 1
+        workbook.close()
+    except (TypeError, ValueError, xlsxwriter.exceptions.XlsxWriterException) as e:
+        logger.warning(f"Falling back to pandas for Excel export: {str(e)}")
+        return None
+        
+    return output.getvalue()
+
+def _json_bytes_polars(df: pd.DataFrame) -> Optional[bytes]:
+    """
+    Write a dataframe to a JSON array of records with Polars.
+    
+    Datetimes are written in the same ISO 8601 form as pandas (millisecond
+    precision, UTC with a ``Z`` suffix for time zone aware columns); floats
+    keep their full precision and text is written as UTF-8 rather than as
+    escape sequences. Returns None when Polars is not installed or cannot
+    convert the dataframe, so callers can fall back to pandas.
+    
+    Args:
+        df: Pandas DataFrame to export
+        
+    Returns:
+        The JSON contents, or None if Polars could not write them
+    """
+    try:
+        import polars as pl
+    except ImportError:
+        return None
+        
+    output = io.BytesIO()
+    try:
+        frame = pl.from_pandas(df)
+        if any(isinstance(dtype, (pl.Duration, pl.Time, pl.Object)) for dtype in frame.dtypes):
+            return None
             
-        elif file_extension in ['xlsx', 'xls']:
-            return pd.read_excel(uploaded_file, **kwargs)
+        iso_format = '%Y-%m-%dT%H:%M:%S%.3f'
+        frame = frame.with_columns(
+            pl.col(name).dt.convert_time_zone('UTC').dt.to_string(iso_format) + 'Z'
+            if dtype.time_zone else
+            pl.col(name).dt.to_string(iso_format)
+            for name, dtype in frame.schema.items()
+            if isinstance(dtype, pl.Datetime)
+        )
+        frame.write_json(output)
+    except (pl.exceptions.PolarsError, TypeError, ValueError) as e:
+        logger.warning(f"Falling back to pandas for JSON export: {str(e)}")
+        return None
+        
+    return output.getvalue()
+
+def _stringify_objects(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert the values of object columns to text, keeping missing values.
+    
+    Args:
+        df: Pandas DataFrame to convert
+        
+    Returns:
+        Copy of the dataframe with text object columns
+    """
+    result = df.copy()
+    for i, dtype in enumerate(df.dtypes):
+        if dtype == object:
+            column = df.iloc[:, i]
+            result.isetitem(i, column.astype(str).where(column.notna(), None))
+    return result
+
+def _write_columnar(df: pd.DataFrame, output: io.BytesIO, fmt: str, parquet_compression: str):
+    """
+    Write a dataframe to Parquet or Feather.
+    
+    Args:
+        df: Pandas DataFrame to write
+        output: Buffer to write to
+        fmt: "parquet" or "feather"
+        parquet_compression: Compression codec for Parquet exports
+    """
+    if fmt == "parquet":
+        df.to_parquet(output, index=False, compression=parquet_compression)
+    else:
+        df.reset_index(drop=True).to_feather(output, compression="lz4")
+
+def _export_bytes(df: pd.DataFrame, fmt: str, parquet_compression: str = "zstd") -> Optional[bytes]:
+    """
+    Serialize a dataframe to one of the export formats.
+    
+    Args:
+        df: Pandas DataFrame to export
+        fmt: Export format (a key of _EXPORT_TYPES)
+        parquet_compression: Compression codec for Parquet exports
+        
+    Returns:
+        The file contents, or None if the format cannot be written
+    """
+    if fmt == "csv":
+        data = _csv_bytes_arrow(df)
+        if data is not None:
+            return data
             
-        elif file_extension == 'json':
-            # Handle different JSON structures
-            try:
-                # Try direct loading first
-                return pd.read_json(uploaded_file, **kwargs)
-            except ValueError:
-                # If direct loading fails, try manual parsing
-                uploaded_file.seek(0)
-                content = json.load(uploaded_file)
-                
-                # Determine if it's a list or dict and convert accordingly
-                if isinstance(content, list):
-                    return pd.json_normalize(content)
-                elif isinstance(content, dict):
-                    # Try different approaches based on JSON structure
-                    if any(isinstance(v, list) for v in content.values()):
-                        # Find the first list and normalize it
-                        for k, v in content.items():
-                            if isinstance(v, list):
-                                return pd.json_normalize(v)
-                    else:
-                        # Convert flat dict to single-row DataFrame
-                        return pd.DataFrame([content])
+        # Written straight to bytes, so the text is never held as a whole str
+        output = io.BytesIO()
+        df.to_csv(output, index=False)
+        return output.getvalue()
+        
+    if fmt == "json":
+        data = _json_bytes_polars(df)
+        if data is not None:
+            return data
+        return df.to_json(orient='records', date_format='iso').encode()
+        
+    if fmt == "xlsx":
+        data = _xlsx_bytes_rust(df)
+        if data is None:
+            data = _xlsx_bytes_streaming(df)
+        if data is not None:
+            return data
+            
+    output = io.BytesIO()
+    if fmt == "xlsx":
+        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+            df.to_excel(writer, index=False, sheet_name='Data')
+            
+            # Access the XlsxWriter workbook and worksheet objects
+            workbook = writer.book
+            worksheet = writer.sheets['Data']
+            
+            # Formats belong to the workbook, so one is added per export
+            header_format = workbook.add_format(_XLSX_HEADER_FORMAT)
+            worksheet.write_row(0, 0, df.columns.tolist(), header_format)
                 
-                # If all else fails
-                raise ValueError("Unsupported JSON structure")
+            # Auto-fit columns
+            for i, col in enumerate(df.columns):
+                max_width = max(_text_width(df.iloc[:, i]), len(str(col))) + 2
+                worksheet.set_column(i, i, max_width)
                 
-        else:
-            logger.error(f"Unsupported file extension: {file_extension}")
+    elif fmt in ("parquet", "feather"):
+        # Columnar formats require pyarrow; skip them if it is unavailable.
+        # Arrow errors subclass TypeError, ValueError or NotImplementedError
+        try:
+            try:
+                _write_columnar(df, output, fmt, parquet_compression)
+            except (TypeError, ValueError, NotImplementedError) as e:
+                # Arrow needs one type per column, so mixed object columns
+                # (e.g. numbers and text) are written as text
+                logger.info(f"Writing object columns as text for {fmt} export: {str(e)}")
+                output = io.BytesIO()
+                _write_columnar(_stringify_objects(df), output, fmt, parquet_compression)
+        except (ImportError, TypeError, ValueError, NotImplementedError) as e:
+            logger.warning(f"Cannot export {fmt}: {str(e)}")
             return None
-            
-    except Exception as e:
-        logger.error(f"Error reading file: {str(e)}", exc_info=True)
-        raise
+    else:
+        return None
+        
+    return output.getvalue()
+
+# The HTML snippets are joined from these pieces around the base64
+# payload, so the (possibly very long) payload is copied only once into
+# each snippet rather than first into an intermediate data URL
+_DOWNLOAD_LINK_PARTS = ('<a href="data:{mime};base64,', '" download="{filename}" class="download-button">Download {label}</a>')
+
+_AUTO_DOWNLOAD_PARTS = ("""
+                <script>
+                const link = document.createElement('a');
+                link.href = 'data:{mime};base64,""", """';
+                link.download = '{filename}';
+                document.body.appendChild(link);
+                link.click();
+                document.body.removeChild(link);
+                </script>
+                """)
+
+def _download_link(mime: str, encoded: str, filename: str, label: str) -> str:
+    """Build the HTML download link for a base64-encoded export."""
+    prefix, suffix = _DOWNLOAD_LINK_PARTS
+    return ''.join((prefix.format(mime=mime), encoded, suffix.format(filename=filename, label=label)))
+
+def _auto_download_script(mime: str, encoded: str, filename: str) -> str:
+    """Build the script that downloads a base64-encoded export on page load."""
+    prefix, suffix = _AUTO_DOWNLOAD_PARTS
+    return ''.join((prefix.format(mime=mime), encoded, suffix.format(filename=filename)))
+
+def get_export_data(
+    df: pd.DataFrame,
+    fmt: str,
+    parquet_compression: str = "zstd"
+) -> Optional[Tuple[bytes, str, str]]:
+    """
+    Serialize a dataframe for a download button.
+    
+    Unlike the HTML links, the raw bytes are handed to the browser as they
+    are, without being base64-encoded into the page.
+    
+    Args:
+        df: Pandas DataFrame to export
+        fmt: Export format (csv, xlsx, json, parquet or feather)
+        parquet_compression: Compression codec for Parquet exports
+        
+    Returns:
+        Tuple of (file contents, MIME type, format label), or None if the
+        format cannot be written
+    """
+    data = _export_bytes(df, fmt, parquet_compression)
+    if data is None:
+        return None
+    mime, label = _EXPORT_TYPES[fmt]
+    return data, mime, label
+
+def get_auto_download_script(data: bytes, fmt: str, filename: str) -> str:
+    """
+    Generate the script that downloads an export on page load.
+    
+    Args:
+        data: File contents, as returned by get_export_data()
+        fmt: Export format of the contents
+        filename: Download filename, including the extension
+        
+    Returns:
+        HTML script element with the contents embedded as a data URL
+    """
+    mime, _ = _EXPORT_TYPES[fmt]
+    return _auto_download_script(mime, base64.b64encode(data).decode('ascii'), filename)
 
 def get_download_link_multi_format(
     df: pd.DataFrame, 
     filename: str = "data", 
     formats: List[str] = ["csv", "xlsx", "json"],
-    auto_download: bool = False
-) -> Dict[str, str]:
+    auto_download: bool = False,
+    parquet_compression: str = "zstd",
+    with_auto_download: bool = False
+) -> Dict[str, Union[str, Tuple[str, str]]]:
     """
     Generate download links for a dataframe in multiple formats.
     
+    Each format is serialized and base64-encoded once, however many HTML
+    snippets are built from it. Streamlit pages should prefer
+    get_export_data() with st.download_button, which sends the raw bytes.
+    
     Args:
         df: Pandas DataFrame to export
         filename: Base filename without extension
         formats: List of formats to generate links for
         auto_download: Whether to generate auto-download script
+        parquet_compression: Compression codec for Parquet exports
+        with_auto_download: Return a (link, auto-download script) tuple for
+            each format instead of a single snippet
         
     Returns:
         Dictionary with format keys and HTML link/script values
@@ -155,95 +995,25 @@ def get_download_link_multi_format(
     result = {}
     
     for fmt in formats:
-        if fmt == "csv":
-            csv = df.to_csv(index=False)
-            b64 = base64.b64encode(csv.encode()).decode()
-            
-            if auto_download:
-                # Auto-download script
-                result[fmt] = f"""
-                <script>
-                const link = document.createElement('a');
-                link.href = 'data:file/csv;base64,{b64}';
-                link.download = '{filename}.csv';
-                document.body.appendChild(link);
-                link.click();
-                document.body.removeChild(link);
-                </script>
-                """
-            else:
-                # Download link
-                href = f'<a href="data:file/csv;base64,{b64}" download="{filename}.csv" class="download-button">Download CSV</a>'
-                result[fmt] = href
-                
-        elif fmt == "xlsx":
-            output = io.BytesIO()
-            with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-                df.to_excel(writer, index=False, sheet_name='Data')
-                
-                # Access the XlsxWriter workbook and worksheet objects
-                workbook = writer.book
-                worksheet = writer.sheets['Data']
-                
-                # Add a header format
-                header_format = workbook.add_format({
-                    'bold': True,
-                    'text_wrap': True,
-                    'valign': 'top',
-                    'bg_color': '#D9E1F2',
-                    'border': 1
-                })
-                
-                # Apply the header format
-                for col_num, value in enumerate(df.columns.values):
-                    worksheet.write(0, col_num, value, header_format)
-                    
-                # Auto-fit columns
-                for i, col in enumerate(df.columns):
-                    max_width = max(
-                        df[col].astype(str).map(len).max(),
-                        len(str(col))
-                    ) + 2
-                    worksheet.set_column(i, i, max_width)
+        data = _export_bytes(df, fmt, parquet_compression)
+        if data is None:
+            continue
             
-            b64 = base64.b64encode(output.getvalue()).decode()
-            
-            if auto_download:
-                # Auto-download script
-                result[fmt] = f"""
-                <script>
-                const link = document.createElement('a');
-                link.href = 'data:application/vnd.openxmlformats-officedocument.spreadsheetml.sheet;base64,{b64}';
-                link.download = '{filename}.xlsx';
-                document.body.appendChild(link);
-                link.click();
-                document.body.removeChild(link);
-                </script>
-                """
-            else:
-                # Download link
-                href = f'<a href="data:application/vnd.openxmlformats-officedocument.spreadsheetml.sheet;base64,{b64}" download="{filename}.xlsx" class="download-button">Download Excel</a>'
-                result[fmt] = href
-                
-        elif fmt == "json":
-            json_str = df.to_json(orient='records', date_format='iso')
-            b64 = base64.b64encode(json_str.encode()).decode()
-            
-            if auto_download:
-                # Auto-download script
-                result[fmt] = f"""
-                <script>
-                const link = document.createElement('a');
-                link.href = 'data:application/json;base64,{b64}';
-                link.download = '{filename}.json';
-                document.body.appendChild(link);
-                link.click();
-                document.body.removeChild(link);
-                </script>
-                """
-            else:
-                # Download link
-                href = f'<a href="data:application/json;base64,{b64}" download="{filename}.json" class="download-button">Download JSON</a>'
-                result[fmt] = href
+        mime, label = _EXPORT_TYPES[fmt]
+        encoded = base64.b64encode(data).decode('ascii')
+        # Free the raw export before the HTML copies are built
+        del data
+        download_name = f"{filename}.{fmt}"
+        
+        if with_auto_download:
+            result[fmt] = (
+                _download_link(mime, encoded, download_name, label),
+                _auto_download_script(mime, encoded, download_name)
+            )
+        elif auto_download:
+            result[fmt] = _auto_download_script(mime, encoded, download_name)
+        else:
+            result[fmt] = _download_link(mime, encoded, download_name, label)
+        del encoded
                 
-    return result
\ No newline at end of file
+    return result
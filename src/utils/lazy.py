@@ -0,0 +1,67 @@
+"""
+Lazy Imports
+-----------
+Helpers for deferring expensive imports until they are actually used.
+"""
+
+import importlib
+from typing import Any
+
+
+class LazyObject:
+    """
+    Proxy for a module or module attribute that is imported on first use.
+
+    Streamlit re-executes the entry script on every rerun, so importing
+    heavy modules (pandas, openpyxl, ...) only when a page needs them keeps
+    the startup path cheap. The resolved object is cached on the proxy.
+    """
+
+    __slots__ = ("_dotted", "_target")
+
+    def __init__(self, dotted: str):
+        """
+        Initialize the proxy.
+
+        Args:
+            dotted: Dotted path to a module (``"pandas"``) or to an attribute
+                of a module (``"src.controllers.file_merger.FileMerger"``)
+        """
+        object.__setattr__(self, "_dotted", dotted)
+        object.__setattr__(self, "_target", None)
+
+    def _resolve(self) -> Any:
+        """Import and cache the target object."""
+        target = object.__getattribute__(self, "_target")
+        if target is None:
+            dotted = object.__getattribute__(self, "_dotted")
+            module_name, _, attr = dotted.rpartition('.')
+            if module_name:
+                module = importlib.import_module(module_name)
+                target = getattr(module, attr, None)
+            if target is None:
+                target = importlib.import_module(dotted)
+            object.__setattr__(self, "_target", target)
+        return target
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<lazy {object.__getattribute__(self, '_dotted')}>"
+
+
+def lazy_import(dotted: str) -> LazyObject:
+    """
+    Return a proxy that imports ``dotted`` the first time it is used.
+
+    Args:
+        dotted: Dotted path to a module or module attribute
+
+    Returns:
+        A LazyObject proxy for the target
+    """
+    return LazyObject(dotted)
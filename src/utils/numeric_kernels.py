@@ -0,0 +1,119 @@
+"""
+Numeric Kernels
+--------------
+Array kernels used by the numeric transformers.
+
+When Numba is installed, large arrays are processed by compiled, multi-threaded
+loops; when only numexpr is, compound expressions on large arrays are evaluated
+by it in one fused pass. Otherwise (and for small arrays, where the dispatch is
+not worth it) the equivalent NumPy operations are used.
+"""
+
+import numpy as np
+from typing import Tuple
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:
+    import numexpr as _ne
+except ImportError:
+    _ne = None
+
+# Arrays shorter than this are always processed with NumPy
+JIT_MIN_ROWS = 50_000
+
+# Arrays shorter than this are never handed to numexpr
+NUMEXPR_MIN_ROWS = 100_000
+
+# Number of values reduced at a time by the NumPy nan_minmax (fits in L2 cache)
+_MINMAX_BLOCK = 1 << 16
+
+if njit is not None:
+    # 'contract' allows fused multiply-add; NaN semantics are kept intact
+    @njit(parallel=True, fastmath={'contract'}, cache=True)
+    def _shift_scale_jit(values, shift, scale, offset, out):
+        for i in prange(values.shape[0]):
+            out[i] = (values[i] - shift) * scale + offset
+
+    @njit(cache=True)
+    def _nan_minmax_jit(values):
+        min_val = np.inf
+        max_val = -np.inf
+        for value in values:
+            if value < min_val:
+                min_val = value
+            if value > max_val:
+                max_val = value
+        return min_val, max_val
+else:
+    _shift_scale_jit = None
+    _nan_minmax_jit = None
+
+def nan_minmax(values: np.ndarray) -> Tuple[float, float]:
+    """
+    Get the minimum and maximum of an array, ignoring NaN.
+
+    Both reductions are made in a single pass over memory: by one compiled
+    loop, or by reducing one cache-sized block at a time with NumPy.
+
+    Args:
+        values: Float array with at least one non-NaN value
+
+    Returns:
+        Tuple of (minimum, maximum)
+    """
+    if _nan_minmax_jit is not None and len(values) >= JIT_MIN_ROWS:
+        return _nan_minmax_jit(values)
+
+    min_val, max_val = np.inf, -np.inf
+    for start in range(0, len(values), _MINMAX_BLOCK):
+        block = values[start:start + _MINMAX_BLOCK]
+        min_val = min(min_val, np.fmin.reduce(block))
+        max_val = max(max_val, np.fmax.reduce(block))
+    return min_val, max_val
+
+def shift_scale(values: np.ndarray, shift: float, scale: float, offset: float = 0.0) -> np.ndarray:
+    """
+    Compute ``(values - shift) * scale + offset`` in a new array.
+
+    Covers min-max, z-score, max-abs and custom range scaling. NaN values
+    stay NaN.
+
+    Args:
+        values: Contiguous float32 or float64 array
+        shift: Value subtracted first
+        scale: Factor applied to the shifted values
+        offset: Value added last
+
+    Returns:
+        Array of the scaled values, with the dtype of ``values``
+    """
+    out = np.empty_like(values)
+    if _shift_scale_jit is not None and len(values) >= JIT_MIN_ROWS:
+        _shift_scale_jit(values, shift, scale, offset, out)
+        return out
+
+    if _ne is not None and len(values) >= NUMEXPR_MIN_ROWS:
+        # One multithreaded pass without temporaries; the constants take the
+        # array's type so float32 input stays float32
+        as_type = values.dtype.type
+        _ne.evaluate(
+            "(values - shift) * scale + offset",
+            local_dict={
+                'values': values,
+                'shift': as_type(shift),
+                'scale': as_type(scale),
+                'offset': as_type(offset)
+            },
+            out=out
+        )
+        return out
+
+    np.subtract(values, shift, out=out)
+    out *= scale
+    if offset:
+        out += offset
+    return out
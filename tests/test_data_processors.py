@@ -0,0 +1,93 @@
+"""
+Tests for the column matching in the data processors.
+"""
+
+import unittest
+import pandas as pd
+from importlib.util import find_spec
+from unittest.mock import patch
+import sys
+import os
+
+# Add the parent directory to the path so we can import the application modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils import data_processors
+from src.utils.data_processors import suggest_column_mapping, create_calculated_column
+
+class TestColumnMapping(unittest.TestCase):
+    """Test cases for suggest_column_mapping."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.sources = ['customer_id', 'first_name', 'email', 'date_ordered', 'date_start', 'qty']
+        self.targets = [
+            'cust_id', 'CustomerID', 'firstname', 'surname', 'e_mail', 'email_address',
+            'date_created', 'updated_at', 'quantity', 'postal_code', 'id'
+        ]
+        data_processors._similarity_matrix.cache_clear()
+
+    def tearDown(self):
+        """Drop scores cached by the tests."""
+        data_processors._similarity_matrix.cache_clear()
+
+    def _mappings(self):
+        """Collect mappings for a range of thresholds."""
+        return [
+            (suggest_column_mapping(self.sources, self.targets, threshold),
+             suggest_column_mapping(self.sources[0], self.targets, threshold))
+            for threshold in (0.5, 0.6, 0.7, 0.8, 0.9)
+        ]
+
+    def test_suggest_column_mapping_difflib(self):
+        """Test the matches found with the difflib backend."""
+        with patch.object(data_processors, '_rf_process', None):
+            mapping = suggest_column_mapping(self.sources, self.targets, 0.8)
+
+        # Assertions
+        self.assertEqual(mapping['email'], 'e_mail')
+        self.assertEqual(mapping['first_name'], 'firstname')
+        self.assertNotIn('qty', mapping)
+
+    @unittest.skipUnless(find_spec('rapidfuzz'), "rapidfuzz is not installed")
+    def test_backends_agree(self):
+        """Test that rapidfuzz pruning gives the same mappings as difflib."""
+        with_rapidfuzz = self._mappings()
+        data_processors._similarity_matrix.cache_clear()
+        with patch.object(data_processors, '_rf_process', None):
+            with_difflib = self._mappings()
+
+        # Assertions
+        self.assertEqual(with_rapidfuzz, with_difflib)
+
+class TestCalculatedColumn(unittest.TestCase):
+    """Test cases for create_calculated_column."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.df = pd.DataFrame({'a': [5, 7, 5, 0], 'b': [0, 2, 0, 3], 'price': [1.5, 2.0, 0.5, 1.0]})
+
+    def _evaluate(self, expression):
+        """Evaluate an expression, returning the values or the error type."""
+        try:
+            return create_calculated_column(self.df, 'result', expression)['result']
+        except ValueError as e:
+            return type(e)
+
+    @unittest.skipUnless(find_spec('numexpr'), "numexpr is not installed")
+    def test_engines_agree(self):
+        """Test that numexpr gives the same results as Python evaluation."""
+        expressions = ['a % b', 'a // b', 'not a', 'a and b', 'a / b', 'a * price + 1', '(a > 1) & (b > 1)']
+        for expression in expressions:
+            with_numexpr = self._evaluate(expression)
+            with patch.object(data_processors, '_ne', None):
+                with_python = self._evaluate(expression)
+
+            # Assertions
+            if isinstance(with_python, pd.Series):
+                pd.testing.assert_series_equal(with_numexpr, with_python, obj=expression)
+            else:
+                self.assertIs(with_numexpr, with_python, expression)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+Tests for the export writers in the file handlers.
+"""
+
+import unittest
+import pandas as pd
+import io
+import openpyxl
+import sys
+import os
+from importlib.util import find_spec
+
+# Add the parent directory to the path so we can import the application modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.file_handlers import (
+    _export_bytes,
+    _xlsx_bytes_rust,
+    detect_encoding,
+    read_csv_polars,
+    read_file
+)
+
+class TestReadCsv(unittest.TestCase):
+    """Test cases for reading CSV uploads."""
+
+    def _read(self, data: bytes) -> pd.DataFrame:
+        """Read CSV bytes the way uploads are read."""
+        buffer = io.BytesIO(data)
+        return read_file(buffer, 'csv', encoding=detect_encoding(buffer))
+
+    def test_read_csv_matches_pandas(self):
+        """Test that uploads load the same columns and dtypes as pd.read_csv."""
+        files = [
+            b'a,a,b\n1,2,3\n',
+            b'a,b,\n1,2,\n',
+            b'day,time,stamp\n2020-01-01,10:00:00,2020-01-01 10:00:00\n',
+            b'id\n18446744073709551615\n',
+            b'id,name\n1,x\n2,\n'
+        ]
+        for data in files:
+            pd.testing.assert_frame_equal(self._read(data), pd.read_csv(io.BytesIO(data)))
+
+    @unittest.skipUnless(find_spec('polars'), "polars is not installed")
+    def test_read_csv_polars_matches_pandas(self):
+        """Test that the Polars reader loads files like pandas or leaves them to it."""
+        files = [
+            b'a,a,b\n1,2,3\n',
+            b'a,b\n1,2\n3,4,5\n',
+            b'name\nJos\xe9\n',
+            b'id\n18446744073709551615\n',
+            b'id,name,score\n1,NA,1.5\n2,x,null\n'
+        ]
+        for data in files:
+            df = read_csv_polars(io.BytesIO(data), encoding='utf-8')
+            if df is not None:
+                pd.testing.assert_frame_equal(df, pd.read_csv(io.BytesIO(data)))
+
+        # Files Polars cannot match are left to pandas
+        self.assertIsNone(read_csv_polars(io.BytesIO(files[0]), encoding='utf-8'))
+        self.assertIsNone(read_csv_polars(io.BytesIO(files[1]), encoding='utf-8'))
+
+    def test_read_csv_undecodable(self):
+        """Test that text that is not valid in the detected encoding is an error."""
+        with self.assertRaises(UnicodeDecodeError):
+            self._read('name\nJos\xe9\n'.encode('latin-1'))
+
+class TestExportBytes(unittest.TestCase):
+    """Test cases for writing DataFrames to export formats."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.df = pd.DataFrame({
+            'qty': [5, 6, 7, 8],
+            'price': [1.5, 2.0, 2.5, 3.0],
+            'name': ['a', 'b', 'c', 'd'],
+            'band': pd.cut([1, 4, 6, 9], bins=[0, 5, 10], labels=['low', 'high'])
+        })
+
+    def test_xlsx_round_trip(self):
+        """Test that an XLSX export reads back with the same values."""
+        result = pd.read_excel(io.BytesIO(_export_bytes(self.df, 'xlsx')))
+
+        # Assertions
+        self.assertEqual(result['qty'].tolist(), [5, 6, 7, 8])
+        self.assertEqual(result['price'].tolist(), [1.5, 2.0, 2.5, 3.0])
+        self.assertEqual(result['band'].tolist(), ['low', 'low', 'high', 'high'])
+
+    def test_xlsx_cell_formats(self):
+        """Test that XLSX exports keep numbers in the General format outside a table."""
+        df = pd.DataFrame({'ratio': [1.23456789, float('inf'), -float('inf')], 'qty': [-1000, 5, 6]})
+        worksheet = openpyxl.load_workbook(io.BytesIO(_export_bytes(df, 'xlsx')))['Data']
+        rows = list(worksheet.iter_rows(min_row=2))
+
+        # Assertions
+        self.assertEqual({cell.number_format for row in rows for cell in row}, {'General'})
+        self.assertEqual([row[0].value for row in rows], [1.23456789, 'inf', '-inf'])
+        self.assertEqual(len(worksheet.tables), 0)
+
+    @unittest.skipUnless(find_spec('rustpy_xlsxwriter'), "rustpy-xlsxwriter is not installed")
+    def test_xlsx_rust_writer(self):
+        """Test that the Rust writer keeps categoricals and skips integer columns."""
+        data = _xlsx_bytes_rust(self.df[['price', 'band']])
+        result = pd.read_excel(io.BytesIO(data))
+
+        # Assertions
+        self.assertEqual(result['band'].tolist(), ['low', 'low', 'high', 'high'])
+        self.assertIsNone(_xlsx_bytes_rust(self.df))
+
+    def test_parquet_mixed_object_column(self):
+        """Test that columns mixing numbers and text are exported as text."""
+        df = pd.DataFrame({'code': pd.Series([1, 'x', 2.5, None], dtype=object), 'qty': [1, 2, 3, 4]})
+
+        for fmt, reader in (('parquet', pd.read_parquet), ('feather', pd.read_feather)):
+            data = _export_bytes(df, fmt)
+            result = reader(io.BytesIO(data))
+
+            # Assertions
+            self.assertEqual(result['code'].tolist()[:3], ['1', 'x', '2.5'])
+            self.assertTrue(pd.isna(result['code'].iloc[3]))
+            self.assertEqual(result['qty'].tolist(), [1, 2, 3, 4])
+
+    def test_csv_round_trip(self):
+        """Test that a CSV export reads back with the same values and dtypes."""
+        df = pd.DataFrame({
+            'qty': [1.0, 2.0, 3.0],
+            'price': [1.5, 2.25, None],
+            'name': ['a', 'b,c', None],
+            'when': pd.to_datetime(['2020-01-01', '2020-01-02', '2020-01-03'])
+        })
+        data = _export_bytes(df, 'csv')
+        result = pd.read_csv(io.BytesIO(data), parse_dates=['when'])
+
+        # Assertions
+        pd.testing.assert_frame_equal(result, df, check_dtype=False)
+        self.assertEqual(result['qty'].dtype, df['qty'].dtype)
+        self.assertIn(b'2020-01-01\n', data)
+
+if __name__ == '__main__':
+    unittest.main()
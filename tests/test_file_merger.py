@@ -15,6 +15,15 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from src.controllers.file_merger import FileMerger
 
+class FakeUpload(io.BytesIO):
+    """In-memory stand-in for a Streamlit UploadedFile."""
+    
+    def __init__(self, data: bytes, name: str, type: str):
+        super().__init__(data)
+        self.name = name
+        self.size = len(data)
+        self.type = type
+
 class TestFileMerger(unittest.TestCase):
     """Test cases for the FileMerger class."""
     
@@ -42,23 +51,18 @@ class TestFileMerger(unittest.TestCase):
             'salary': [50000, 60000, 70000]
         })
         
-        # Create a mock uploaded file
-        self.mock_csv_file = MagicMock()
-        self.mock_csv_file.name = 'test.csv'
-        self.mock_csv_file.size = 1000
-        self.mock_csv_file.read.return_value = self.df1.to_csv(index=False).encode('utf-8')
-        self.mock_csv_file.seek = MagicMock()
-        
-        self.mock_excel_file = MagicMock()
-        self.mock_excel_file.name = 'test.xlsx'
-        self.mock_excel_file.size = 2000
+        # Create in-memory uploaded files, so loading runs the real readers
+        self.mock_csv_file = FakeUpload(
+            self.df1.to_csv(index=False).encode('utf-8'), 'test.csv', 'text/csv'
+        )
         
-        # Create a buffer for Excel data
         excel_buffer = io.BytesIO()
         self.df2.to_excel(excel_buffer, index=False)
-        excel_buffer.seek(0)
-        self.mock_excel_file.read.return_value = excel_buffer.read()
-        self.mock_excel_file.seek = MagicMock()
+        self.mock_excel_file = FakeUpload(
+            excel_buffer.getvalue(),
+            'test.xlsx',
+            'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        )
         
     def test_init(self):
         """Test initialization of FileMerger."""
@@ -68,21 +72,20 @@ class TestFileMerger(unittest.TestCase):
         self.assertIn('xlsx', self.merger.supported_formats)
         self.assertIn('json', self.merger.supported_formats)
         
-    @patch('src.utils.file_handlers.get_file_info')
-    @patch('src.utils.file_handlers.detect_encoding')
-    @patch('src.utils.file_handlers.read_file')
-    def test_load_data_csv(self, mock_read_file, mock_detect_encoding, mock_get_file_info):
-        """Test loading CSV data."""
-        # Set up mocks
-        mock_get_file_info.return_value = {
-            'name': 'test.csv',
-            'type': 'text/csv',
-            'size': 1000,
-            'extension': 'csv'
-        }
-        mock_detect_encoding.return_value = 'utf-8'
-        mock_read_file.return_value = self.df1
+    def test_select_engine(self):
+        """Test engine selection based on total upload size."""
+        threshold = self.config["max_file_size_mb"] * 0.5 * 1024 * 1024
+        
+        # Auto engine switches to Polars only above the threshold
+        self.assertEqual(self.merger.select_engine(1000), "pandas")
+        self.assertEqual(self.merger.select_engine(threshold + 1), "polars")
         
+        # Explicit engines ignore the size
+        self.assertEqual(FileMerger({"engine": "polars"}).select_engine(1000), "polars")
+        self.assertEqual(FileMerger({"engine": "pandas"}).select_engine(threshold + 1), "pandas")
+        
+    def test_load_data_csv(self):
+        """Test loading CSV data."""
         # Call the method
         df, error = self.merger.load_data(self.mock_csv_file)
         
@@ -90,25 +93,9 @@ class TestFileMerger(unittest.TestCase):
         self.assertIsNone(error)
         self.assertIsInstance(df, pd.DataFrame)
         pd.testing.assert_frame_equal(df, self.df1)
-        mock_get_file_info.assert_called_once_with(self.mock_csv_file)
-        mock_detect_encoding.assert_called_once_with(self.mock_csv_file)
-        mock_read_file.assert_called_once_with(
-            self.mock_csv_file, 'csv', encoding='utf-8'
-        )
         
-    @patch('src.utils.file_handlers.get_file_info')
-    @patch('src.utils.file_handlers.read_file')
-    def test_load_data_excel(self, mock_read_file, mock_get_file_info):
+    def test_load_data_excel(self):
         """Test loading Excel data."""
-        # Set up mocks
-        mock_get_file_info.return_value = {
-            'name': 'test.xlsx',
-            'type': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            'size': 2000,
-            'extension': 'xlsx'
-        }
-        mock_read_file.return_value = self.df2
-        
         # Call the method
         df, error = self.merger.load_data(self.mock_excel_file)
         
@@ -116,15 +103,11 @@ class TestFileMerger(unittest.TestCase):
         self.assertIsNone(error)
         self.assertIsInstance(df, pd.DataFrame)
         pd.testing.assert_frame_equal(df, self.df2)
-        mock_get_file_info.assert_called_once_with(self.mock_excel_file)
-        mock_read_file.assert_called_once()
         
     def test_load_data_unsupported_format(self):
         """Test loading an unsupported file format."""
-        # Create a mock file with unsupported extension
-        mock_file = MagicMock()
-        mock_file.name = 'test.txt'
-        mock_file.size = 500
+        # Create a file with unsupported extension
+        mock_file = FakeUpload(b'some text', 'test.txt', 'text/plain')
         
         # Call the method
         df, error = self.merger.load_data(mock_file)
@@ -136,9 +119,8 @@ class TestFileMerger(unittest.TestCase):
         
     def test_load_data_file_too_large(self):
         """Test loading a file that exceeds the size limit."""
-        # Create a mock file that's too large
-        mock_file = MagicMock()
-        mock_file.name = 'large.csv'
+        # Create a file that reports a size over the limit
+        mock_file = FakeUpload(b'id\n1\n', 'large.csv', 'text/csv')
         mock_file.size = (self.config["max_file_size_mb"] + 1) * 1024 * 1024
         
         # Call the method
@@ -256,5 +238,54 @@ class TestFileMerger(unittest.TestCase):
         self.assertIsNotNone(errors)
         self.assertIn("Please specify a key column for joining", errors)
 
+    @patch('src.controllers.file_merger.clean_dataframe')
+    def test_process_files_keeps_64bit_arithmetic(self, mock_clean_dataframe):
+        """Test that arithmetic on the merged result neither overflows nor loses precision."""
+        mock_clean_dataframe.side_effect = lambda df, options: df
+        
+        orders = pd.DataFrame({
+            'qty': [50000, 60000],
+            'price': [70000, 80000],
+            'weight': [1000000.5, 1000001.25]
+        })
+        self.merger.load_data = MagicMock(return_value=(orders, None))
+        
+        options = {
+            "merge_method": "Append (stack vertically)",
+            "join_key": None,
+            "join_type": "outer",
+            "matching_columns": False,
+            "output_filename": "test_output",
+            "ignore_case": True,
+            "handle_duplicates": False,
+            "fill_missing": False,
+            "fill_method": None,
+            "fill_value": None
+        }
+        
+        result_df, errors = self.merger.process_files([self.mock_csv_file], options)
+        
+        # Assertions
+        self.assertIsNone(errors)
+        self.assertEqual((result_df['qty'] * result_df['price']).tolist(), [3500000000, 4800000000])
+        self.assertEqual((result_df['weight'] - 1000000).tolist(), [0.5, 1.25])
+
+    def test_arrow_text_columns(self):
+        """Test that only text columns are converted to Arrow strings."""
+        df = pd.DataFrame({
+            'name': ['Alice', 'Bob'],
+            'mixed': pd.Series([1, 'x'], dtype=object),
+            'score': [1.0, 2.0],
+            'age': [25, 30]
+        })
+        
+        result = FileMerger.arrow_text_columns(df)
+        
+        # Assertions
+        self.assertEqual(str(result['name'].dtype), 'string[pyarrow]')
+        self.assertEqual(result['mixed'].dtype, object)
+        self.assertEqual(result['score'].dtype, np.float64)
+        self.assertEqual(result['age'].dtype, np.int64)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,130 @@
+"""
+Tests for the built-in data transformer plugins.
+"""
+
+import unittest
+import pandas as pd
+import sys
+import os
+
+# Add the parent directory to the path so we can import the application modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.plugins.data_transformers.text_transformer import TextCaseTransformer
+from src.plugins.data_transformers.date_transformer import (
+    DateExtractTransformer,
+    DateDifferenceTransformer
+)
+from src.plugins.data_transformers.numeric_transformer import (
+    BinningTransformer,
+    NumericScalingTransformer
+)
+
+class TestTextTransformers(unittest.TestCase):
+    """Test cases for the text transformers."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.df = pd.DataFrame({
+            'Text': ['HELLO WORLD', 'good morning', 'mIxEd CaSe']
+        })
+        
+    def test_text_case_sentence(self):
+        """Test sentence case conversion."""
+        result = TextCaseTransformer().transform(self.df, {'column': 'Text', 'case_type': 'sentence'})
+        
+        self.assertEqual(result['Text'].tolist(), ['Hello world', 'Good morning', 'Mixed case'])
+        
+        # Categorical columns give the same result
+        categorical = self.df.astype({'Text': 'category'})
+        result = TextCaseTransformer().transform(categorical, {'column': 'Text', 'case_type': 'sentence'})
+        
+        self.assertEqual(result['Text'].tolist(), ['Hello world', 'Good morning', 'Mixed case'])
+
+class TestDateTransformers(unittest.TestCase):
+    """Test cases for the date transformers."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.df = pd.DataFrame({
+            'day_first': ['13/01/2024', '25/12/2023', '01/02/2024'],
+            'day_first_end': ['20/01/2024', '30/12/2023', '05/02/2024'],
+            'month_first': ['01/13/2024', '12/25/2023', '02/01/2024'],
+            'iso': ['2024-01-13', '2023-12-25', '2024-02-01']
+        })
+        
+    def test_date_extract_day_and_month_first(self):
+        """Test that day-first and month-first columns are both parsed."""
+        for column in ('day_first', 'month_first', 'iso'):
+            result = DateExtractTransformer().transform(
+                self.df, {'column': column, 'component': 'month', 'target_column': 'month'}
+            )
+            
+            self.assertEqual(result['month'].tolist(), [1, 12, 2], column)
+            
+    def test_date_difference_day_first(self):
+        """Test the difference between two day-first columns."""
+        result = DateDifferenceTransformer().transform(self.df, {
+            'start_column': 'day_first',
+            'end_column': 'day_first_end',
+            'target_column': 'days',
+            'unit': 'days'
+        })
+        
+        self.assertEqual(result['days'].tolist(), [7, 5, 4])
+
+class TestNumericCompile(unittest.TestCase):
+    """Test cases for compiling the numeric transformers."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.batches = [
+            pd.DataFrame({'value': [1.0, 4.0, None, 9.0]}),
+            pd.DataFrame({'value': [2, 7, 3, 10]})
+        ]
+        
+    def _assert_compiled_matches(self, transformer, params):
+        """Check that the compiled function gives the same results as transform."""
+        apply = transformer.compile(params)
+        for df in self.batches:
+            pd.testing.assert_frame_equal(apply(df), transformer.transform(df, params))
+            
+    def test_compile_scaling(self):
+        """Test that compiled scaling matches transform for every method."""
+        for method in ('min_max', 'z_score', 'max_abs', 'custom_range'):
+            self._assert_compiled_matches(NumericScalingTransformer(), {
+                'column': 'value',
+                'method': method,
+                'min_value': -1,
+                'max_value': 1,
+                'create_new_column': True
+            })
+            
+    def test_compile_binning(self):
+        """Test that compiled binning matches transform for every method."""
+        for method in ('custom', 'equal_width', 'equal_freq'):
+            self._assert_compiled_matches(BinningTransformer(), {
+                'column': 'value',
+                'method': method,
+                'num_bins': 2,
+                'custom_bins': '0, 5, 10',
+                'labels': 'low, high',
+                'target_column': 'band'
+            })
+            
+    def test_compile_rejects_invalid_params(self):
+        """Test that bad edges, labels and methods are reported at compile time."""
+        binning = {'column': 'value', 'method': 'custom', 'custom_bins': '0, 5, 10', 'target_column': 'band'}
+        for params in (
+            dict(binning, custom_bins='5'),
+            dict(binning, labels='low, mid, high'),
+            dict(binning, method='equal_width', num_bins=3, labels='low, high')
+        ):
+            with self.assertRaises(ValueError):
+                BinningTransformer().compile(params)
+                
+        with self.assertRaises(ValueError):
+            NumericScalingTransformer().compile({'column': 'value', 'method': 'bogus'})
+
+if __name__ == '__main__':
+    unittest.main()